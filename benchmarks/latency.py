@@ -0,0 +1,316 @@
+"""Per-stage latency benchmarks replayed against recorded API payloads.
+
+Starts the local API stub from ``stub.py``, points a throwaway config and
+cache directory at it (the response cache and rate limiter are turned off so
+every run does the same work) and times each stage of an invocation:
+
+    startup          interpreter start plus importing the entry modules
+    invocation       a whole ``python -m sunny`` run against the stub
+    invocation_ansi  the same run with ``--renderer ansi``
+    config_cold      ConfigManager parsing config.toml and the theme
+    config_warm      the same, served from the compiled config cache
+    parse_weather    decoding the /weather fixture
+    parse_forecast   decoding the /forecast fixture and aggregating the days
+    fetch_weather    one /weather round trip to the stub
+    fetch_hedged     a /weather query to a stub that takes 100 ms, hedged
+                     after 20 ms by a provider serving the fixtures
+    render_weather   display_full_weather
+    render_forecast  display_forecast
+    render_themes    show_all_themes
+    render_*_ansi    the render stages again with the native ANSI renderer
+    render_weather_cached  display_full_weather answered from the render cache
+    statusline       --statusline from a warm response cache
+
+The fastest run of each stage (min of N, which scheduler and cache noise
+only ever slow down) is compared with ``baseline.json``, and the run exits
+with status 1 when a stage is more than ``--threshold`` slower than its
+baseline. Stages that start an interpreter are allowed
+``PROCESS_THRESHOLD`` instead.
+
+    python benchmarks/latency.py [--runs 20] [--threshold 0.25] [--save-baseline]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+from contextlib import redirect_stdout
+
+from stub import FIXTURES_DIR, StubAPI
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+# Differences below this are noise, whatever the ratio
+DEFAULT_SLACK_MS = 0.5
+# Stages that start a new interpreter are slow, so they run fewer times,
+# and they vary more with the state of the machine
+PROCESS_RUNS = 10
+PROCESS_STAGES = ("startup", "invocation", "invocation_ansi")
+PROCESS_THRESHOLD = 0.4
+# Latency of the slow API of fetch_hedged, and when the backup is asked
+SLOW_DELAY = 0.1
+HEDGE_AFTER = 0.02
+
+
+def isolate(root: Path) -> None:
+    """Send every config, cache and home directory lookup into ``root``."""
+    for name in ("HOME", "XDG_CONFIG_HOME", "XDG_CACHE_HOME", "APPDATA", "LOCALAPPDATA"):
+        os.environ[name] = str(root / name.lower())
+    os.environ["SUNNY_NO_DAEMON"] = "1"
+    os.environ["FORCE_COLOR"] = "1"
+    os.environ["COLUMNS"] = "120"
+
+
+def write_config(base_url: str) -> None:
+    from sunny.configure import ConfigManager
+
+    config = ConfigManager()
+    text = (
+        config.DEFAULT_CONFIG.replace(
+            'key = "YOUR-OPEN-WEATHER-API-KEY"', 'key = "benchmark"'
+        )
+        .replace("[cache]\nenabled = true", "[cache]\nenabled = false")
+        .replace("[ratelimit]\nenabled = true", "[ratelimit]\nenabled = false")
+        .replace('base_url = "https://api.openweathermap.org"', f'base_url = "{base_url}"')
+    )
+    config.THEMES_DIR.mkdir(parents=True, exist_ok=True)
+    config.CONFIG_FILE.write_text(text, encoding="utf-8")
+    with redirect_stdout(io.StringIO()):
+        config.setup_themes()
+
+
+def measure(stage, runs: int, setup=None) -> list:
+    """Time ``stage()`` ``runs`` times, calling ``setup()`` untimed before each run."""
+    samples = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        stage()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def run_stages(runs: int, slow_url: str) -> dict:
+    from rich.console import Console
+    from sunny import decode
+    from sunny.ansi import AnsiRenderer
+    from sunny.art import render_art
+    from sunny.cli import WeatherCLI
+    from sunny.configure import ConfigManager
+    from sunny.forecast import aggregate
+    from sunny.providers import HedgedProvider, OpenWeatherProvider, StubProvider
+    from sunny.statusline import statusline
+    from sunny.themes import show_all_themes
+    from sunny.utility import Weather
+
+    weather_body = (FIXTURES_DIR / "weather.json").read_bytes()
+    forecast_body = (FIXTURES_DIR / "forecast.json").read_bytes()
+    current = decode.current_weather(weather_body)
+    days = aggregate(decode.forecast_series(forecast_body))
+    compiled_file = ConfigManager().COMPILED_FILE
+
+    def load_config():
+        config = ConfigManager()
+        config.config
+        config.resolver
+
+    def drop_compiled():
+        try:
+            compiled_file.unlink()
+        except OSError:
+            pass
+
+    weather = Weather()
+
+    def fetch():
+        weather.reset()
+        weather.fetch_current("Delhi")
+
+    slow = dict(weather.config.network_settings, base_url=slow_url)
+    hedged = HedgedProvider(
+        OpenWeatherProvider(slow, weather.config.get_api_key),
+        StubProvider(FIXTURES_DIR),
+        HEDGE_AFTER,
+    )
+
+    cli = WeatherCLI()
+    cli.console = Console(
+        file=io.StringIO(), force_terminal=True, width=120, color_system="truecolor"
+    )
+    cli.config.resolver
+    # Same console, drawn by the ANSI renderer
+    ansi_cli = WeatherCLI()
+    ansi_cli.console = cli.console
+    ansi_cli.renderer_name = "ansi"
+    ansi_cli.config.resolver
+    ansi_themes = AnsiRenderer.for_console(ansi_cli.config, cli.console)
+    # The config turns caching off; this CLI turns the render cache back on
+    # and warms it with one call
+    cached_cli = WeatherCLI()
+    cached_cli.console = cli.console
+    cached_cli.config.config["cache"]["enabled"] = True
+    cached_cli.display_full_weather(current, "Delhi", "°C", "m/s")
+    # A Weather built after that switch reads and fills the response cache
+    cached_weather = Weather(cached_cli.config)
+    cached_weather.fetch_current("Delhi")
+
+    def quiet_themes(renderer=None):
+        with redirect_stdout(io.StringIO()):
+            show_all_themes(renderer)
+
+    def run_process(*args):
+        return lambda: subprocess.run(
+            [sys.executable, *args], stdout=subprocess.DEVNULL, check=True
+        )
+
+    process_runs = min(runs, PROCESS_RUNS)
+    return {
+        "startup": measure(
+            run_process("-c", "import sunny.__main__, sunny.cli"), process_runs
+        ),
+        "invocation": measure(run_process("-m", "sunny", "-c", "Delhi"), process_runs),
+        "invocation_ansi": measure(
+            run_process("-m", "sunny", "-c", "Delhi", "--renderer", "ansi"), process_runs
+        ),
+        "config_cold": measure(load_config, runs, setup=drop_compiled),
+        "config_warm": measure(load_config, runs),
+        "parse_weather": measure(lambda: decode.current_weather(weather_body), runs),
+        "parse_forecast": measure(
+            lambda: aggregate(decode.forecast_series(forecast_body)), runs
+        ),
+        "fetch_weather": measure(fetch, runs),
+        "fetch_hedged": measure(lambda: hedged.fetch("weather", "Delhi", "metric"), runs),
+        # Clearing the art cache makes every render pay what a single run pays
+        "render_weather": measure(
+            lambda: cli.display_full_weather(current, "Delhi", "°C", "m/s"),
+            runs,
+            setup=render_art.cache_clear,
+        ),
+        "render_forecast": measure(
+            lambda: cli.display_forecast("Delhi", days, "°C", "m/s"),
+            runs,
+            setup=render_art.cache_clear,
+        ),
+        "render_themes": measure(quiet_themes, runs),
+        "render_weather_ansi": measure(
+            lambda: ansi_cli.display_full_weather(current, "Delhi", "°C", "m/s"),
+            runs,
+            setup=render_art.cache_clear,
+        ),
+        "render_forecast_ansi": measure(
+            lambda: ansi_cli.display_forecast("Delhi", days, "°C", "m/s"),
+            runs,
+            setup=render_art.cache_clear,
+        ),
+        "render_themes_ansi": measure(lambda: quiet_themes(ansi_themes), runs),
+        "render_weather_cached": measure(
+            lambda: cached_cli.display_full_weather(current, "Delhi", "°C", "m/s"), runs
+        ),
+        "statusline": measure(lambda: statusline(cached_weather, "Delhi", "metric"), runs),
+    }
+
+
+def summarise(samples: dict) -> dict:
+    return {
+        stage: {
+            "min": min(values),
+            "median": statistics.median(values),
+            "p90": sorted(values)[int(0.9 * (len(values) - 1))],
+        }
+        for stage, values in samples.items()
+    }
+
+
+def load_baseline() -> dict:
+    try:
+        with open(BASELINE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("stages", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baseline(results: dict) -> None:
+    data = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "statistic": "min",
+        "stages": {stage: round(r["min"], 3) for stage, r in results.items()},
+    }
+    with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def report(results: dict, baseline: dict, threshold: float, slack_ms: float) -> list:
+    """Print a table of the results and return the stages that regressed."""
+    regressions = []
+    print(
+        f"{'stage':<23}{'min ms':>10}{'median ms':>10}{'p90 ms':>10}"
+        f"{'baseline':>10}{'change':>9}"
+    )
+    for stage, r in results.items():
+        base = baseline.get(stage)
+        line = f"{stage:<23}{r['min']:>10.2f}{r['median']:>10.2f}{r['p90']:>10.2f}"
+        if base:
+            change = r["min"] / base - 1
+            line += f"{base:>10.2f}{change:>+9.0%}"
+            allowed = PROCESS_THRESHOLD if stage in PROCESS_STAGES else threshold
+            allowed = max(allowed, threshold)
+            if r["min"] > base * (1 + allowed) and r["min"] - base > slack_ms:
+                regressions.append(stage)
+                line += "  REGRESSION"
+        print(line)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sunny stage by stage")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown over the baseline, as a fraction",
+    )
+    parser.add_argument("--slack-ms", type=float, default=DEFAULT_SLACK_MS)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help=f"Store this run as the new baseline in {BASELINE_FILE.name}",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="sunny-bench-") as root:
+        isolate(Path(root))
+        with StubAPI() as stub, StubAPI(delay=SLOW_DELAY) as slow:
+            write_config(stub.url)
+            results = summarise(run_stages(args.runs, slow.url))
+
+    if args.save_baseline:
+        report(results, {}, args.threshold, args.slack_ms)
+        save_baseline(results)
+        print(f"Baseline saved to {BASELINE_FILE}")
+        return 0
+
+    baseline = load_baseline()
+    regressions = report(results, baseline, args.threshold, args.slack_ms)
+    if not baseline:
+        print("No baseline yet, run with --save-baseline to record one")
+    elif regressions:
+        print(f"FAIL: slower than baseline: {', '.join(regressions)}")
+        return 1
+    else:
+        print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Cold-start import budget for the sunny entry point.
+
+Runs ``python -X importtime`` on the modules a plain ``sunny`` call imports,
+reports the import time they add on top of a bare interpreter, and exits
+with status 1 when that goes over budget or when a heavy module that should
+be lazily imported gets pulled in at startup.
+
+    python benchmarks/startup.py [--budget-ms 40] [--runs 5]
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+ENTRY_MODULES = "import sunny.__main__, sunny.cli"
+
+# Modules only specific code paths may import
+LAZY_MODULES = (
+    "requests",
+    "urllib3",
+    "toml",
+    "rich.console",
+    "rich.panel",
+    "rich.columns",
+    "importlib.metadata",
+    "concurrent.futures",
+    "subprocess",
+)
+
+DEFAULT_BUDGET_MS = 40.0
+
+
+def import_times(code: str) -> dict:
+    """Return {module: cumulative microseconds} for top-level imports of ``code``."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.startswith(" ") and not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def startup_cost_ms(runs: int) -> float:
+    """Median import time added by the entry modules, in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        baseline = import_times("pass")
+        entry = import_times(ENTRY_MODULES)
+        added = sum(t for name, t in entry.items() if name not in baseline)
+        samples.append(added / 1000)
+    return statistics.median(samples)
+
+
+def eager_imports() -> list:
+    code = f"{ENTRY_MODULES}; import sys; print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    loaded = set(result.stdout.split())
+    return [name for name in LAZY_MODULES if name in loaded]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check sunny's cold-start budget")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    cost = startup_cost_ms(args.runs)
+    eager = eager_imports()
+    print(f"startup imports: {cost:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    failed = False
+    if cost > args.budget_ms:
+        print("FAIL: cold start is over budget")
+        failed = True
+    if eager:
+        print(f"FAIL: imported at startup but should be lazy: {', '.join(eager)}")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
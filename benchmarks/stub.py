@@ -0,0 +1,88 @@
+"""Local stand-in for the OpenWeather API that serves recorded payloads.
+
+Answers ``/data/2.5/weather`` and ``/data/2.5/forecast`` with the files in
+``benchmarks/fixtures`` and anything else with 404, so benchmarks never touch
+the network. Point ``[network] base_url`` at it, or run it on its own:
+
+    python benchmarks/stub.py [--port 8765] [--delay-ms 0]
+"""
+
+import time
+import argparse
+import threading
+from pathlib import Path
+from urllib.parse import urlparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+ENDPOINTS = {
+    "/data/2.5/weather": "weather.json",
+    "/data/2.5/forecast": "forecast.json",
+}
+
+
+class StubAPI:
+    """Serve the recorded fixtures from a background thread."""
+
+    def __init__(self, port: int = 0, delay: float = 0.0) -> None:
+        payloads = {
+            path: (FIXTURES_DIR / name).read_bytes() for path, name in ENDPOINTS.items()
+        }
+        self.requests = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Send headers and body in one segment, as a real server would,
+            # instead of waiting out a delayed ACK between them
+            disable_nagle_algorithm = True
+            wbufsize = -1
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub.requests += 1
+                body = payloads.get(urlparse(self.path).path)
+                if delay:
+                    time.sleep(delay)
+                self.send_response(200 if body is not None else 404)
+                body = body if body is not None else b'{"cod": "404"}'
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubAPI":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve recorded OpenWeather payloads")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with StubAPI(args.port, args.delay_ms / 1000) as stub:
+        print(f"Serving fixtures at {stub.url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,41 @@
+import os
 import sys
-from sunny.cli import WeatherCLI
 
 
 def main():
     """Application entry point."""
     try:
+        _main()
+    except BrokenPipeError:
+        # The reader of a pipe went away (`sunny --format ndjson | head`).
+        # Point stdout at devnull so the flush at exit does not fail again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(0)
+
+
+def _main():
+    if any(arg.split("=", 1)[0] == "--statusline" for arg in sys.argv[1:]):
+        from sunny.statusline import main as statusline
+
+        code = statusline(sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
+
+    if not os.environ.get("SUNNY_NO_DAEMON"):
+        from sunny.daemon import request
+
+        code = request(sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
+
+    from sunny import trace
+
+    # Started before the CLI is built, so config and theme loading are traced
+    trace.enable_from(sys.argv[1:])
+
+    try:
+        from sunny.cli import WeatherCLI
+
         app = WeatherCLI()
         app.run()
 
@@ -13,6 +44,9 @@ def main():
         print("\nOperation cancelled by user")
         sys.exit(0)
 
+    except BrokenPipeError:
+        raise
+
     except Exception as e:
 
         print(f"Unexpected error: {str(e)}")
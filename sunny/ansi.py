@@ -0,0 +1,757 @@
+"""Direct ANSI renderer for sunny's fixed layouts.
+
+Draws the same panels and columns as ``RichRenderer`` by assembling lines of
+box characters and SGR escape sequences, without building rich renderables.
+The layout rules (panel sizing, padding, column fitting and word wrapping)
+follow rich's, so both renderers produce the same screen.
+
+Escape sequences for theme styles and box characters are resolved through
+rich the first time they are needed and then kept in the compiled config
+cache, so later runs draw without importing rich.
+"""
+
+import re
+import sys
+import unicodedata
+from typing import TYPE_CHECKING, Optional
+
+from sunny.render import Renderer, detect_terminal
+
+if TYPE_CHECKING:
+    from sunny.decode import CurrentWeather
+
+# Box characters in the order top-left, top, top-right, mid-left, mid-right,
+# bottom-left, bottom, bottom-right, then "1" for ASCII-only boxes
+TOP_LEFT, TOP, TOP_RIGHT, MID_LEFT, MID_RIGHT, BOTTOM_LEFT, BOTTOM, BOTTOM_RIGHT, ASCII = range(9)
+
+# Colour systems as rich names them
+COLOR_SYSTEMS = ("standard", "256", "truecolor", "windows")
+
+# SGR parameter of each rich style attribute, in the order rich emits them
+SGR_ATTRIBUTES = (
+    ("bold", "1"),
+    ("dim", "2"),
+    ("italic", "3"),
+    ("underline", "4"),
+    ("blink", "5"),
+    ("blink2", "6"),
+    ("reverse", "7"),
+    ("conceal", "8"),
+    ("strike", "9"),
+    ("underline2", "21"),
+    ("frame", "51"),
+    ("encircle", "52"),
+    ("overline", "53"),
+)
+
+re_word = re.compile(r"\s*\S+\s*")
+
+
+def cell_len(text: str) -> int:
+    """Terminal cells a string takes up."""
+    if text.isascii():
+        return len(text)
+    width = 0
+    for char in text:
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in "WF" else 1
+    return width
+
+
+def set_cell_size(text: str, width: int) -> str:
+    """Crop or pad a string to exactly ``width`` cells."""
+    length = cell_len(text)
+    if length == width:
+        return text
+    if length < width:
+        return text + " " * (width - length)
+    if text.isascii():
+        return text[:width]
+    cropped, used = [], 0
+    for char in text:
+        size = cell_len(char)
+        if used + size > width:
+            break
+        cropped.append(char)
+        used += size
+    return "".join(cropped) + " " * (width - used)
+
+
+def chop_cells(text: str, width: int) -> list:
+    """Split a string into pieces of at most ``width`` cells."""
+    if text.isascii():
+        return [text[i : i + width] for i in range(0, len(text), width)] or [""]
+    pieces, piece, used = [], [], 0
+    for char in text:
+        size = cell_len(char)
+        if piece and used + size > width:
+            pieces.append("".join(piece))
+            piece, used = [], 0
+        piece.append(char)
+        used += size
+    pieces.append("".join(piece))
+    return pieces
+
+
+def divide_line(text: str, width: int, fold: bool = True) -> list:
+    """Offsets to break a line at so every piece fits ``width``.
+
+    Words longer than a line are folded over several lines, or left whole
+    (to be cropped) when ``fold`` is false.
+    """
+    breaks = []
+    offset = 0
+    for match in re_word.finditer(text):
+        start, word = match.start(), match.group(0)
+        word_length = cell_len(word.rstrip())
+        if width - offset >= word_length:
+            offset += cell_len(word)
+        elif word_length > width and not fold:
+            if start:
+                breaks.append(start)
+            offset = cell_len(word)
+        elif word_length > width:
+            folded = chop_cells(word, width)
+            for index, piece in enumerate(folded):
+                if start:
+                    breaks.append(start)
+                if index == len(folded) - 1:
+                    offset = cell_len(piece)
+                else:
+                    start += len(piece)
+        elif offset and start:
+            breaks.append(start)
+            offset = cell_len(word)
+    return breaks
+
+
+def wrap(text: str, width: int, fold: bool = True) -> list:
+    """Word-wrap text to ``width`` cells, line by line.
+
+    Lines still too long are cropped, ending in an ellipsis unless ``fold``.
+    """
+    lines = []
+    for paragraph in text.split("\n"):
+        if cell_len(paragraph) <= width:
+            lines.append(paragraph)
+            continue
+        offsets = [0, *divide_line(paragraph, width, fold), len(paragraph)]
+        for start, end in zip(offsets, offsets[1:]):
+            line = paragraph[start:end]
+            excess = len(line) - width
+            if excess > 0:
+                stripped = line.rstrip()
+                line = line[: len(line) - min(len(line) - len(stripped), excess)]
+            if cell_len(line) > width:
+                line = set_cell_size(line, width) if fold else set_cell_size(line, width - 1) + "…"
+            lines.append(line)
+    return lines
+
+
+def ratio_distribute(total: int, ratios: list) -> list:
+    """Split ``total`` into integer parts proportional to ``ratios``."""
+    total_ratio = sum(ratios)
+    remaining = total
+    parts = []
+    for ratio in ratios:
+        part = -(-ratio * remaining // total_ratio) if total_ratio > 0 else remaining
+        parts.append(part)
+        total_ratio -= ratio
+        remaining -= part
+    return parts
+
+
+# A line is (width in cells, [(text, sgr codes), ...])
+
+
+def blank(width: int) -> tuple:
+    return (width, [(" " * width, "")])
+
+
+def shape(lines: list, width: int, height: Optional[int] = None) -> list:
+    """Pad lines to ``width`` and crop or pad them to ``height`` lines."""
+    shaped = [
+        line if line[0] >= width else (width, [*line[1], (" " * (width - line[0]), "")])
+        for line in (lines if height is None else lines[: max(0, height)])
+    ]
+    if height is not None and len(shaped) < height:
+        shaped.extend(blank(width) for _ in range(height - len(shaped)))
+    return shaped
+
+
+class Text:
+    """Paragraphs of text, each in one style."""
+
+    __slots__ = ("paragraphs",)
+
+    def __init__(self, *paragraphs) -> None:
+        self.paragraphs = paragraphs
+
+    def measure(self, max_width: int) -> int:
+        longest = max(
+            (cell_len(line) for text, _ in self.paragraphs for line in text.splitlines()),
+            default=0,
+        )
+        return min(longest, max_width)
+
+    def lines(self, width: int, height: Optional[int] = None, fold: bool = True) -> list:
+        lines = []
+        for text, codes in self.paragraphs:
+            for line in wrap(text, width, fold):
+                lines.append((cell_len(line), [(line, codes)]))
+        return lines
+
+
+class Group:
+    """Renderables stacked vertically."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, *items) -> None:
+        self.items = items
+
+    def measure(self, max_width: int) -> int:
+        return max((item.measure(max_width) for item in self.items), default=0)
+
+    def lines(self, width: int, height: Optional[int] = None, fold: bool = True) -> list:
+        return [line for item in self.items for line in item.lines(width, None, fold)]
+
+
+class Panel:
+    """A box around a renderable, with optional title and subtitle.
+
+    Titles are lists of (text, codes) runs. ``padding`` is (vertical,
+    horizontal) as in rich.
+    """
+
+    __slots__ = (
+        "body",
+        "box",
+        "border",
+        "title",
+        "subtitle",
+        "padding",
+        "width",
+        "height",
+    )
+
+    def __init__(
+        self,
+        body,
+        box: str,
+        border: str = "",
+        title: Optional[list] = None,
+        subtitle: Optional[list] = None,
+        padding: tuple = (0, 1),
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        self.body = body
+        self.box = box
+        self.border = border
+        self.title = title
+        self.subtitle = subtitle
+        self.padding = padding
+        self.width = width
+        self.height = height
+
+    def measure(self, max_width: int) -> int:
+        if self.width is not None:
+            return min(self.width, max_width)
+        extra = self.padding[1] * 2 + 2
+        inner = max_width - extra
+        width = self.body.measure(inner) if inner >= 1 else 0
+        if self.title:
+            width = max(width, min(sum(cell_len(t) for t, _ in self.title), inner))
+        return min(width + extra, max_width)
+
+    def _edge(self, runs: Optional[list], width: int, left: str, fill: str, right: str) -> tuple:
+        border = self.border
+        if not runs or width <= 4:
+            return (width, [(left + fill * (width - 2) + right, border)])
+        room = width - 4
+        title, used = [], 0
+        for text, codes in runs:
+            if used >= room:
+                break
+            size = cell_len(text)
+            if used + size > room:
+                text, size = set_cell_size(text, room - used), room - used
+            title.append((text, codes))
+            used += size
+        excess = room - used
+        before = excess // 2
+        return (
+            width,
+            [
+                (left + fill + fill * before, border),
+                *title,
+                (fill * (excess - before) + fill + right, border),
+            ],
+        )
+
+    def lines(self, max_width: int, height: Optional[int] = None, fold: bool = True) -> list:
+        box, border = self.box, self.border
+        width = max_width if self.width is None else min(max_width, self.width)
+        child_width = width - 2
+        if self.title:
+            title_width = sum(cell_len(text) for text, _ in self.title)
+            child_width = min(max_width - 2, max(child_width, title_width + 2))
+        width = child_width + 2
+        child_height = self.height or height or None
+        if child_height:
+            child_height -= 2
+
+        vertical, horizontal = self.padding
+        inner_width = child_width - horizontal * 2
+        inner_height = None if child_height is None else max(0, child_height - vertical * 2)
+        body = shape(
+            self.body.lines(inner_width, inner_height, fold), inner_width, inner_height
+        )
+        if horizontal:
+            side = (" " * horizontal, "")
+            body = [(child_width, [side, *runs, side]) for _, runs in body]
+        if vertical:
+            gap = [blank(child_width) for _ in range(vertical)]
+            body = gap + body + gap
+        body = shape(body, child_width, child_height)
+
+        left, right = (box[MID_LEFT], border), (box[MID_RIGHT], border)
+        return [
+            self._edge(self.title, width, box[TOP_LEFT], box[TOP], box[TOP_RIGHT]),
+            *((width, [left, *runs, right]) for _, runs in body),
+            self._edge(
+                self.subtitle, width, box[BOTTOM_LEFT], box[BOTTOM], box[BOTTOM_RIGHT]
+            ),
+        ]
+
+
+class Columns:
+    """Renderables laid out in as many columns as fit, row by row."""
+
+    __slots__ = ("items", "expand")
+
+    def __init__(self, items: list, expand: bool = False) -> None:
+        self.items = items
+        self.expand = expand
+
+    def _column_count(self, widths: list, max_width: int) -> int:
+        count = len(widths)
+        while count > 1:
+            fitted = {}
+            cells = widths + [0] * (-len(widths) % count)
+            for index, width in enumerate(cells):
+                column = index % count
+                fitted[column] = max(fitted.get(column, 0), width)
+                if sum(fitted.values()) + len(fitted) - 1 > max_width:
+                    count = len(fitted) - 1
+                    break
+            else:
+                break
+        return count
+
+    def lines(self, max_width: int, height: Optional[int] = None, fold: bool = True) -> list:
+        items = self.items
+        if not items:
+            return []
+        count = self._column_count([item.measure(max_width) for item in items], max_width)
+        cells = items + [None] * (-len(items) % count)
+        rows = [cells[i : i + count] for i in range(0, len(cells), count)]
+
+        # Every column but the last has one cell of padding on its right
+        widths = []
+        for column in range(count):
+            pad = 0 if column == count - 1 else 1
+            width = 0
+            for row in rows:
+                item = row[column]
+                if item is None:
+                    measured = pad
+                elif max_width - pad < 1:
+                    measured = max_width
+                else:
+                    measured = min(item.measure(max_width - pad) + pad, max_width)
+                width = max(width, measured)
+            widths.append(min(width, max_width) or 1)
+        total = sum(widths)
+        if self.expand and total < max_width:
+            widths = [
+                width + extra
+                for width, extra in zip(widths, ratio_distribute(max_width - total, widths))
+            ]
+            total = max_width
+
+        lines = []
+        for row in rows:
+            rendered = []
+            for column, (item, width) in enumerate(zip(row, widths)):
+                pad = 0 if column == count - 1 else 1
+                inner = width - pad
+                # Cells crop overlong words with an ellipsis, like rich table columns
+                cell = shape(item.lines(inner, None, False) if item is not None else [], inner)
+                if pad:
+                    cell = [(width, [*runs, (" ", "")]) for _, runs in cell]
+                rendered.append(cell)
+            row_height = max(len(cell) or 1 for cell in rendered)
+            rendered = [
+                shape(cell, width, row_height) for cell, width in zip(rendered, widths)
+            ]
+            for parts in zip(*rendered):
+                lines.append((total, [run for _, runs in parts for run in runs]))
+        return lines
+
+
+def _system_key(color_system: Optional[str], no_color: bool) -> str:
+    return f"{color_system}:{'no_color' if no_color else 'color'}"
+
+
+class AnsiRenderer(Renderer):
+    """Renderer writing box-drawn views as ANSI text."""
+
+    name = "ansi"
+
+    def __init__(
+        self,
+        config,
+        width: int = 80,
+        color_system: Optional[str] = "truecolor",
+        no_color: bool = False,
+        ascii_only: bool = False,
+        file=None,
+    ) -> None:
+        self.config = config
+        self.width = width
+        self.color_system = color_system
+        self.no_color = no_color
+        self.ascii_only = ascii_only
+        self.file = file
+        self._system = _system_key(color_system, no_color)
+        self._styles = dict(config.load_cached("ansi_styles", {}).get(self._system, {}))
+        self._boxes = dict(config.load_cached("ansi_boxes", {}))
+        self._dirty = False
+
+    @classmethod
+    def for_console(cls, config, console) -> "AnsiRenderer":
+        """Draw for an existing rich Console: its file, width and colours."""
+        return cls(
+            config,
+            width=console.width,
+            color_system=console.color_system,
+            no_color=console.no_color,
+            ascii_only=not console.encoding.startswith("utf"),
+            file=console.file,
+        )
+
+    @classmethod
+    def for_terminal(cls, config, file=None) -> "AnsiRenderer":
+        """Draw for stdout, detecting its width and colours the way rich does."""
+        terminal = detect_terminal(file)
+        return cls(
+            config,
+            width=terminal["width"],
+            color_system=terminal["color_system"],
+            no_color=terminal["no_color"],
+            ascii_only=not terminal["encoding"].startswith("utf"),
+            file=file,
+        )
+
+    def codes(self, *definitions: str) -> str:
+        """SGR parameters for rich style definitions applied on top of each other."""
+        if self.color_system is None:
+            return ""
+        key = "\0".join(definitions)
+        codes = self._styles.get(key)
+        if codes is None:
+            codes = self._styles[key] = self._resolve_codes(definitions)
+            self._dirty = True
+        return codes
+
+    def _resolve_codes(self, definitions: tuple) -> str:
+        from rich.color import ColorSystem
+        from rich.errors import StyleSyntaxError
+        from rich.style import Style
+
+        style = Style()
+        for definition in definitions:
+            try:
+                style += Style.parse(definition)
+            except StyleSyntaxError:
+                pass
+        if self.no_color:
+            style = style.without_color
+        system = ColorSystem(COLOR_SYSTEMS.index(self.color_system) + 1)
+        codes = [code for name, code in SGR_ATTRIBUTES if getattr(style, name)]
+        if style.color is not None:
+            codes.extend(style.color.downgrade(system).get_ansi_codes())
+        if style.bgcolor is not None:
+            codes.extend(style.bgcolor.downgrade(system).get_ansi_codes(foreground=False))
+        return ";".join(codes)
+
+    def box(self, name: str, source: str = "") -> str:
+        """Characters of a rich box by name (see ``rich.box``)."""
+        chars = self._boxes.get(name)
+        if chars is None:
+            from rich import box
+
+            try:
+                found = getattr(box, name)
+            except (AttributeError, TypeError):
+                print(f"Error getting box attribute value from {source}.")
+                sys.exit(1)
+            chars = self._boxes[name] = "".join(
+                [
+                    found.top_left,
+                    found.top,
+                    found.top_right,
+                    found.mid_left,
+                    found.mid_right,
+                    found.bottom_left,
+                    found.bottom,
+                    found.bottom_right,
+                    "1" if found.ascii else "0",
+                ]
+            )
+            self._dirty = True
+        if self.ascii_only and chars[ASCII] == "0":
+            return self.box("ASCII", source)
+        return chars
+
+    def _save(self) -> None:
+        """Keep newly resolved styles and boxes for later runs."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        config = self.config
+        styles = dict(config.load_cached("ansi_styles", {}))
+        styles[self._system] = self._styles
+        config.store_cached("ansi_styles", styles)
+        config.store_cached("ansi_boxes", self._boxes)
+
+    def render(self, view) -> str:
+        """Draw a view as lines of ANSI text."""
+        if isinstance(view, str):
+            return view
+        text = "\n".join(self._line(runs) for _, runs in view.lines(self.width))
+        self._save()
+        return text
+
+    def print(self, view) -> None:
+        file = self.file or sys.stdout
+        file.write(self.render(view) + "\n")
+        file.flush()
+
+    def renderable(self, view):
+        from rich.text import Text
+
+        return Text.from_ansi(self.render(view))
+
+    def capture(self, view) -> str:
+        return self.render(view) + "\n"
+
+    @staticmethod
+    def _line(runs: list) -> str:
+        out = []
+        text, codes = "", ""
+        for run_text, run_codes in runs:
+            if run_codes == codes or not run_text:
+                text += run_text
+                continue
+            if text:
+                out.append(f"\x1b[{codes}m{text}\x1b[0m" if codes else text)
+            text, codes = run_text, run_codes
+        if text:
+            out.append(f"\x1b[{codes}m{text}\x1b[0m" if codes else text)
+        return "".join(out)
+
+    def ascii_art(self, weather_data: "CurrentWeather"):
+        condition = weather_data.main
+        codes = self.codes(self.config.condition_colour(condition))
+        art = self.config.ascii_art(condition, weather_data.icon)
+        return Text(*((line, codes) for line in art.split("\n")))
+
+    def _title(self, text: str, border: str, style: str) -> list:
+        return [(" ", self.codes(border)), (text, self.codes(border, style)), (" ", self.codes(border))]
+
+    def full_weather(
+        self,
+        weather_data: "CurrentWeather",
+        location: str,
+        deg_symbol: str,
+        wind_unit: str,
+    ):
+        theme = self.config.resolver
+        panel = theme.panel
+        ascii_panel_config = theme.ascii_panel
+        condition_colour = theme.condition_colour(weather_data.main)
+        minimal = self.box("MINIMAL", theme.theme_file)
+
+        art = self.config.ascii_art(weather_data.main, weather_data.icon)
+        art_codes = self.codes(condition_colour)
+        content = Columns(
+            [
+                Panel(Text(text), minimal)
+                for text in (
+                    (weather_data.description.capitalize(), art_codes),
+                    (
+                        f"Temp: {weather_data.temp:.1f}° (feels {weather_data.feels_like:.1f}°) {deg_symbol}",
+                        self.codes(theme.temp(weather_data.temp)),
+                    ),
+                    (
+                        f"Humidity: {weather_data.humidity}%",
+                        self.codes(theme.humid(weather_data.humidity)),
+                    ),
+                    (f"Wind: {weather_data.wind_speed} {wind_unit}", self.codes(theme.wind)),
+                )
+            ]
+        )
+
+        border = theme.panel_border
+        weather_panel = Panel(
+            content,
+            self.box(str(panel.get("box")).upper(), theme.theme_file),
+            border=self.codes(border),
+            title=self._title(location.replace("%20", " ").title(), border, theme.city),
+            subtitle=self._title(
+                f"Coord: ({weather_data.lon:.2f}, {weather_data.lat:.2f}) | Country: {weather_data.country}",
+                border,
+                "dim",
+            ),
+            padding=(panel.get("padding_top_right"), panel.get("padding_bottom_left")),
+            width=panel.get("width"),
+            height=panel.get("height"),
+        )
+        ascii_panel = Panel(
+            Text(*((line, art_codes) for line in art.split("\n"))),
+            self.box(str(ascii_panel_config.get("box")).upper(), theme.theme_file),
+            border=self.codes(f"{ascii_panel_config.get('border_style')} {theme.city}"),
+            padding=(
+                ascii_panel_config.get("padding_top_right"),
+                ascii_panel_config.get("padding_bottom_left"),
+            ),
+            width=ascii_panel_config.get("width"),
+            height=ascii_panel_config.get("height"),
+        )
+        return Group(ascii_panel, weather_panel)
+
+    def multi_city(
+        self, locations: list, results: dict, deg_symbol: str, wind_unit: str
+    ):
+        theme = self.config.resolver
+        border = theme.panel_border
+        box = self.box(str(theme.panel.get("box")).upper(), theme.theme_file)
+        cards = []
+        for location in locations:
+            weather_data = results[location]
+            if isinstance(weather_data, Exception):
+                details = Text((str(weather_data), self.codes("bold red")))
+            else:
+                details = Text(
+                    (
+                        weather_data.description.capitalize(),
+                        self.codes(theme.condition_colour(weather_data.main)),
+                    ),
+                    (
+                        f"Temp: {weather_data.temp:.1f}{deg_symbol}",
+                        self.codes(theme.temp(weather_data.temp)),
+                    ),
+                    (
+                        f"Humidity: {weather_data.humidity}%",
+                        self.codes(theme.humid(weather_data.humidity)),
+                    ),
+                    (f"Wind: {weather_data.wind_speed} {wind_unit}", self.codes(theme.wind)),
+                )
+            cards.append(
+                Panel(
+                    details,
+                    box,
+                    border=self.codes(border),
+                    title=self._title(location.replace("%20", " ").title(), border, theme.city),
+                    width=30,
+                )
+            )
+        return Columns(cards)
+
+    def forecast(self, weather_data: list, deg_symbol: str, wind_unit: str):
+        from sunny.forecast import local_datetime
+
+        theme = self.config.resolver
+        border = theme.panel_border
+        box = self.box(str(theme.panel.get("box")).upper(), theme.theme_file)
+        day_cards = []
+        for day in weather_data:
+            dt = local_datetime(day)
+            temperature = day.get("temp")
+            humidity = day.get("humidity")
+            condition = day.get("main")
+
+            if day.get("samples", 1) > 1:
+                subtitle = f"{day['temp_min']:.1f}° / {day['temp_max']:.1f}°"
+                wind_label = "Wind: max"
+            else:
+                subtitle = dt.strftime("%I:%M %p")
+                wind_label = "Wind:"
+
+            condition_codes = self.codes(theme.condition_colour(condition))
+            art = self.config.ascii_art(condition, day.get("icon"))
+            details = Text(
+                (day.get("description").capitalize(), condition_codes),
+                (
+                    f"Temp: {temperature:.1f}° (feels {day.get('feels_like_temp'):.1f}°) {deg_symbol}",
+                    self.codes(theme.temp(temperature)),
+                ),
+                (f"Humidity: {humidity}%", self.codes(theme.humid(humidity))),
+                (f"{wind_label} {day.get('wind_speed')} {wind_unit}", self.codes(theme.wind)),
+            )
+            day_cards.append(
+                Panel(
+                    Group(
+                        Text(*((line, condition_codes) for line in art.split("\n"))),
+                        Text(("", "")),
+                        details,
+                    ),
+                    box,
+                    border=self.codes(border),
+                    title=self._title(dt.strftime("%a %d %b"), border, theme.city),
+                    subtitle=self._title(subtitle, border, "dim"),
+                    padding=(1, 4),
+                    width=30,
+                    height=20,
+                )
+            )
+        return Columns(day_cards, expand=True)
+
+    def theme_preview(self, name: str, theme: dict):
+        panel_config = theme.get("panel", {})
+        border = (
+            f"{panel_config.get('border_style', 'bold')} "
+            f"{panel_config.get('border_colour', 'light_steel_blue')}"
+        )
+        colours = theme.get("colours")
+        minimal = self.box("MINIMAL")
+        content = Columns(
+            [
+                Panel(Text((text, self.codes(str(colour)))), minimal)
+                for text, colour in (
+                    ("Thunderstorm", colours.get("col_desc").get("Thunderstorm")),
+                    ("Temp: 25(26) C", colours.get("col_temp").get("mid")),
+                    ("Humidity: 65", colours.get("col_humid").get("high")),
+                    ("Wind: 3 m/s", colours.get("col_wind")),
+                )
+            ]
+        )
+        return Panel(
+            content,
+            self.box(panel_config.get("box", "ROUNDED")),
+            border=self.codes(border),
+            title=self._title(name, border, str(colours.get("col_city"))),
+            subtitle=[
+                (" Coord: (75.00, 32.00) Country: IN ", self.codes(border)),
+            ],
+            padding=(
+                int(panel_config.get("padding_top_right", 1)),
+                int(panel_config.get("padding_bottom_left", 1)),
+            ),
+            width=int(panel_config.get("width", 55)),
+            height=int(panel_config.get("height", 12)),
+        )
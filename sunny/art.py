@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+from functools import lru_cache
+from typing import Callable, Optional
+
+DATA_FILE = Path(__file__).parent / "data" / "ascii_art.json"
+
+
+class ArtRegistry:
+    """ASCII art indexed by icon code and weather condition.
+
+    The bundled art is read from ``data/ascii_art.json`` on first use. Users
+    can add or override entries in ``ascii_art.toml`` next to ``config.toml``,
+    using the same ``[art]``, ``[icons]`` and ``[conditions]`` tables, e.g.::
+
+        [art]
+        mist = '''
+          ~~~~~~
+        ~~~~~~~~~'''
+
+        [icons]
+        "50d" = "mist"
+    """
+
+    TABLES = ("art", "icons", "conditions")
+
+    def __init__(self, load_user_art: Optional[Callable[[], dict]] = None) -> None:
+        self._load_user_art = load_user_art
+        self._data = None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            with open(DATA_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            user = self._load_user_art() if self._load_user_art else {}
+            for table in self.TABLES:
+                if isinstance(user.get(table), dict):
+                    data[table].update(user[table])
+            self._data = data
+        return self._data
+
+    def name(self, condition: str, icon: str) -> str:
+        """Get the art name for a condition, preferring an exact icon match."""
+        data = self.data
+        return (
+            data["icons"].get(icon)
+            or data["conditions"].get(condition)
+            or data["default"]
+        )
+
+    def lookup(self, condition: str, icon: str) -> str:
+        art = self.data["art"]
+        return art.get(self.name(condition, icon), art[self.data["default"]])
+
+    @property
+    def previews(self) -> list:
+        """Get (title, art) pairs shown by --showall."""
+        return [(p["title"], p["art"]) for p in self.data["previews"]]
+
+
+class RenderedArt:
+    """Rich renderable for styled art that caches its rendered lines per width."""
+
+    __slots__ = ("text", "_lines")
+
+    def __init__(self, text) -> None:
+        self.text = text
+        self._lines = {}
+
+    def __rich_measure__(self, console, options):
+        from rich.measure import Measurement
+
+        return Measurement.get(console, options, self.text)
+
+    def __rich_console__(self, console, options):
+        from rich.segment import Segment
+
+        key = (options.max_width, options.justify, options.overflow, options.no_wrap)
+        lines = self._lines.get(key)
+        if lines is None:
+            lines = self._lines[key] = console.render_lines(
+                self.text, options.update(height=None), pad=False
+            )
+        new_line = Segment.line()
+        for line in lines:
+            yield from line
+            yield new_line
+
+
+@lru_cache(maxsize=128)
+def render_art(art: str, style: str) -> RenderedArt:
+    """Get the renderable for art in a style, built once per (art, style)."""
+    from rich.text import Text
+
+    text = Text(art)
+    text.stylize(style)
+    return RenderedArt(text)
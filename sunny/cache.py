@@ -0,0 +1,176 @@
+import os
+import sys
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Optional, Tuple
+from platformdirs import user_cache_dir
+
+
+class FileCache:
+    """Directory of cache files, one per key, evicted least recently used first.
+
+    Files are written atomically. The file mtime tracks last use and drives
+    LRU eviction once the number of entries goes over ``max_entries``.
+    """
+
+    DIRECTORY = "files"
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 200) -> None:
+        self.CACHE_DIR = Path(cache_dir or user_cache_dir("sunny")) / self.DIRECTORY
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> Path:
+        return self.CACHE_DIR / f"{key}.entry"
+
+    def _read(self, key: str) -> Optional[bytes]:
+        """Return the contents of an entry and mark it used, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write(self, key: str, *chunks: bytes) -> None:
+        """Store an entry atomically and evict least recently used entries."""
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp, path)
+            self._evict()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        entries = list(self.CACHE_DIR.glob("*.entry"))
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[: len(entries) - self.max_entries]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        for path in self.CACHE_DIR.glob("*.entry"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+class ResponseCache(FileCache):
+    """On-disk cache of raw API responses keyed by (endpoint, location, units).
+
+    Every entry is a single file: a JSON header line holding the fetch time,
+    followed by the response body.
+    """
+
+    DIRECTORY = "responses"
+
+    @staticmethod
+    def make_key(endpoint: str, location: str, units: str) -> str:
+        raw = f"{endpoint}|{location.strip().lower()}|{units}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Return (body, age in seconds) of an entry, or None on a miss."""
+        data = self._read(key)
+        if data is None:
+            return None
+        header, _, body = data.partition(b"\n")
+        try:
+            fetched_at = json.loads(header).get("fetched_at", 0)
+        except (ValueError, AttributeError):
+            return None
+        return body, max(0.0, time.time() - fetched_at)
+
+    def set(self, key: str, body: bytes) -> None:
+        """Store a response body with its fetch time."""
+        header = json.dumps({"fetched_at": time.time()}).encode("utf-8") + b"\n"
+        self._write(key, header, body)
+
+    def claim_refresh(self, key: str, timeout: float = 60.0) -> bool:
+        """Mark an entry as being refreshed. Returns False if a refresh is already running."""
+        marker = self.CACHE_DIR / f"{key}.refresh"
+        try:
+            if time.time() - marker.stat().st_mtime < timeout:
+                return False
+            marker.unlink()
+        except OSError:
+            pass
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            os.close(os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except OSError:
+            return False
+
+    def release_refresh(self, key: str) -> None:
+        try:
+            (self.CACHE_DIR / f"{key}.refresh").unlink()
+        except OSError:
+            pass
+
+
+def spawn_refresh(entries: list) -> None:
+    """Refresh cache entries in one detached process so the caller can exit at once.
+
+    ``entries`` holds (endpoint, location, units) tuples.
+    """
+    import subprocess
+
+    if not entries:
+        return
+    args = [arg for entry in entries for arg in entry]
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "sunny.utility", *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+class RenderCache(FileCache):
+    """On-disk cache of the final output of a view, as bytes.
+
+    Keys hash everything the output depends on: the sunny version, the
+    decoded payload, the config, theme and art files, units, display mode,
+    renderer and terminal (width, colour system and encoding). A new
+    response, an edited theme or an upgrade gives a new key, and entries
+    nothing asks for again age out by LRU.
+    """
+
+    DIRECTORY = "renders"
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 100) -> None:
+        super().__init__(cache_dir, max_entries)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        raw = json.dumps(parts, sort_keys=True, default=repr, ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored output, or None on a miss."""
+        return self._read(key)
+
+    def set(self, key: str, data: bytes) -> None:
+        """Store the output of a view."""
+        self._write(key, data)
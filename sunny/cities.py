@@ -0,0 +1,222 @@
+import os
+import sys
+import mmap
+import struct
+import unicodedata
+from pathlib import Path
+from bisect import bisect_left, bisect_right
+from typing import List, NamedTuple, Optional
+from platformdirs import user_cache_dir
+from sunny.geocode import normalize
+
+INDEX_NAME = "cities.idx"
+MAGIC = b"SUNNYCTY"
+VERSION = 1
+
+HEADER = struct.Struct("<8sHI")
+# folded name key, country, id, lat, lon, offset and length of the display name
+RECORD = struct.Struct("<32s2sIffIB")
+KEY_SIZE = 32
+
+
+def fold(name: str) -> str:
+    """Normalise a city name and strip accents, so 'São Paulo' matches 'sao paulo'."""
+    decomposed = unicodedata.normalize("NFKD", normalize(name))
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _key(name: str) -> bytes:
+    return fold(name).encode("utf-8")[:KEY_SIZE]
+
+
+def split_query(location: str) -> tuple:
+    """Split 'Delhi,IN' into ('delhi', 'IN'); a state in between is ignored."""
+    parts = normalize(location).split(",")
+    country = parts[-1].upper() if len(parts) > 1 and len(parts[-1]) == 2 else ""
+    return parts[0], country
+
+
+class City(NamedTuple):
+    name: str
+    country: str
+    id: int
+    lat: float
+    lon: float
+
+    @property
+    def arg(self) -> str:
+        """The city as it would be passed to ``-c``."""
+        return f"{self.name.replace(' ', '_')},{self.country}"
+
+
+class _Keys:
+    """Sequence view of the sorted record keys, for bisect."""
+
+    def __init__(self, index: "CityIndex") -> None:
+        self.index = index
+
+    def __len__(self) -> int:
+        return self.index.count
+
+    def __getitem__(self, i: int) -> bytes:
+        return self.index.key(i)
+
+
+class CityIndex:
+    """Sorted, fixed-width city records read through mmap.
+
+    Records are sorted by folded name, so exact and prefix lookups are a
+    binary search over the mapped file and only touched pages are read.
+    The index is built from OpenWeather's ``city.list.json`` with
+    ``python -m sunny.cities city.list.json.gz`` and looked up in the cache
+    directory, then in the package data.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a sunny city index")
+        self._names = HEADER.size + self.count * RECORD.size
+        self._keys = _Keys(self)
+
+    @staticmethod
+    def locate() -> Optional[Path]:
+        for path in (
+            Path(user_cache_dir("sunny")) / INDEX_NAME,
+            Path(__file__).parent / "data" / INDEX_NAME,
+        ):
+            if path.is_file():
+                return path
+        return None
+
+    @classmethod
+    def open(cls) -> Optional["CityIndex"]:
+        """Open the installed index, or return None when there is none."""
+        path = cls.locate()
+        if path is None:
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def key(self, i: int) -> bytes:
+        return self._map[
+            HEADER.size + i * RECORD.size : HEADER.size + i * RECORD.size + KEY_SIZE
+        ].rstrip(b"\0")
+
+    def city(self, i: int) -> City:
+        _, country, city_id, lat, lon, offset, length = RECORD.unpack_from(
+            self._map, HEADER.size + i * RECORD.size
+        )
+        start = self._names + offset
+        name = self._map[start : start + length].decode("utf-8", "ignore")
+        return City(name, country.decode("ascii"), city_id, lat, lon)
+
+    def _prefix_range(self, prefix: bytes) -> range:
+        # 0xff never occurs in UTF-8, so it sorts after every key with this prefix
+        return range(
+            bisect_left(self._keys, prefix), bisect_left(self._keys, prefix + b"\xff")
+        )
+
+    def find(self, location: str) -> List[City]:
+        """Get every city with exactly this name, within the country if one is given."""
+        name, country = split_query(location)
+        key = _key(name)
+        folded = fold(name)
+        matches = []
+        for i in range(bisect_left(self._keys, key), bisect_right(self._keys, key)):
+            city = self.city(i)
+            # Keys are truncated, so long names are compared in full
+            if fold(city.name) == folded and (not country or city.country == country):
+                matches.append(city)
+        return matches
+
+    def complete(self, prefix: str, limit: int = 20) -> List[City]:
+        """Get up to ``limit`` distinct city names that start with ``prefix``."""
+        name, country = split_query(prefix)
+        matches = {}
+        for i in self._prefix_range(_key(name)):
+            city = self.city(i)
+            if not country or city.country == country:
+                matches.setdefault((city.name, city.country), city)
+                if len(matches) >= limit:
+                    break
+        return list(matches.values())
+
+    def suggest(self, location: str, limit: int = 3) -> List[City]:
+        """Get the closest city names to a misspelt one."""
+        from difflib import get_close_matches
+
+        name, country = split_query(location)
+        key = _key(name)
+        # Compare against names sharing the first letters, so a lookup reads
+        # a few pages of the index rather than all of it
+        candidates = self._prefix_range(key[:1])
+        if len(candidates) > 20000:
+            candidates = self._prefix_range(key[:2])
+        names = {}
+        for i in candidates:
+            names.setdefault(self.key(i).decode("utf-8", "ignore"), []).append(i)
+        cities = {}
+        for match in get_close_matches(fold(name), names, n=limit, cutoff=0.75):
+            for i in names[match]:
+                city = self.city(i)
+                if not country or city.country == country:
+                    cities.setdefault((city.name, city.country), city)
+        return list(cities.values())[:limit]
+
+    def close(self) -> None:
+        self._map.close()
+
+
+def build(source: str, output: Optional[str] = None) -> Path:
+    """Build an index from OpenWeather's city.list.json (optionally gzipped)."""
+    import gzip
+    import json
+
+    opener = gzip.open if source.endswith(".gz") else open
+    with opener(source, "rt", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    cities = sorted(
+        (
+            (_key(e["name"]), e.get("country") or "", e["name"], e["id"], e["coord"])
+            for e in entries
+            if e.get("name")
+        ),
+        key=lambda c: c[:3],
+    )
+    names = bytearray()
+    records = bytearray(HEADER.pack(MAGIC, VERSION, len(cities)))
+    for key, country, name, city_id, coord in cities:
+        encoded = name.encode("utf-8")[:255]
+        records += RECORD.pack(
+            key,
+            country.encode("ascii", "ignore")[:2],
+            city_id,
+            coord["lat"],
+            coord["lon"],
+            len(names),
+            len(encoded),
+        )
+        names += encoded
+
+    path = Path(output) if output else Path(user_cache_dir("sunny")) / INDEX_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(records)
+        f.write(names)
+    os.replace(tmp, path)
+    return path
+
+
+if __name__ == "__main__":
+    # python -m sunny.cities city.list.json.gz [OUTPUT]
+    if len(sys.argv) < 2:
+        sys.exit("Usage: python -m sunny.cities CITY_LIST_JSON [OUTPUT]")
+    print(f"City index written to {build(*sys.argv[1:3])}")
@@ -1,37 +1,185 @@
+from sunny import __version__, trace
 from sunny.utility import Weather
 from sunny.configure import ConfigManager
-from sunny.themes import show_all_ascii, show_all_themes
 
 import os
 import sys
+import builtins
 import argparse
-from datetime import datetime
-from typing import Dict, Any, Optional
-from rich.console import Console
-from rich import print, box
-from rich.panel import Panel
-from rich.columns import Columns
-from importlib.metadata import version
+from typing import TYPE_CHECKING, Callable, Optional
+from rich import print
+
+if TYPE_CHECKING:
+    from sunny.decode import CurrentWeather
+
+# rich layout modules are imported inside the display methods that need them,
+# so plain-text and cached paths do not pay for loading them.
 
 
 class WeatherCLI:
     """Main Weather CLI application class"""
 
     def __init__(self):
-        self.weather = Weather()
-        self.console = Console()
         self.config = ConfigManager()
+        self.weather = Weather(self.config)
+        self._console = None
+        self._renderer = None
+        self.renderer_name = None
+
+    @property
+    def console(self):
+        """Get the rich console, creating it on first use."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    @console.setter
+    def console(self, console) -> None:
+        self._console = console
+        self._renderer = None
+
+    @property
+    def renderer(self):
+        """Get the renderer picked by --renderer or [display] renderer."""
+        if self._renderer is None:
+            name = self.renderer_name or self.config.get_renderer
+            if name == "ansi" and os.name != "nt":
+                from sunny.ansi import AnsiRenderer
+
+                if self._console is not None:
+                    self._renderer = AnsiRenderer.for_console(self.config, self._console)
+                else:
+                    self._renderer = AnsiRenderer.for_terminal(self.config)
+            else:
+                from sunny.render import RichRenderer
+
+                self._renderer = RichRenderer(self.config, self.console)
+        return self._renderer
+
+    @property
+    def terminal(self) -> dict:
+        """Width, colour system and encoding the output is drawn for."""
+        console = self._console
+        if console is None:
+            from sunny.render import detect_terminal
+
+            return detect_terminal()
+        return {
+            "width": console.width,
+            "color_system": console.color_system,
+            "no_color": console.no_color,
+            "encoding": console.encoding,
+        }
+
+    def show(self, mode: str, payload, build: Callable) -> None:
+        """Print the view ``build(renderer)`` makes of ``payload``.
+
+        The output is kept in the render cache, so a later call with the same
+        payload, files, units and terminal writes the stored bytes without
+        building the view again.
+        """
+        settings = self.config.cache_settings
+        entries = int(settings["render_entries"]) if settings["enabled"] else 0
+        if entries <= 0 or os.name == "nt":
+            renderer = self.renderer
+            renderer.print(build(renderer))
+            return
+
+        from sunny.cache import RenderCache
+
+        with trace.span("render.cache", mode=mode) as span:
+            cache = RenderCache(max_entries=entries)
+            terminal = self.terminal
+            key = cache.make_key(
+                __version__,
+                mode,
+                payload,
+                self.renderer_name or self.config.get_renderer,
+                terminal,
+                self.config.display_signature,
+            )
+            data = cache.get(key)
+            span.set(hit=data is not None)
+
+        file = self._console.file if self._console is not None else sys.stdout
+        if data is None:
+            renderer = self.renderer
+            text = renderer.capture(build(renderer))
+            try:
+                data = text.encode(terminal["encoding"])
+            except (LookupError, UnicodeEncodeError):
+                file.write(text)
+                file.flush()
+                return
+            cache.set(key, data)
+
+        buffer = getattr(file, "buffer", None)
+        if buffer is None:
+            file.write(data.decode(terminal["encoding"]))
+        else:
+            file.flush()
+            buffer.write(data)
+        file.flush()
+
+    @property
+    def is_terminal(self) -> bool:
+        if self._console is not None:
+            return self._console.is_terminal
+        return sys.stdout.isatty()
+
+    def echo(self, text: str, style: Optional[str] = None) -> None:
+        """Print a single line, bypassing rich when output is not a terminal."""
+        if not self.is_terminal:
+            builtins.print(text)
+        elif style:
+            print(f"[{style}]{text}[/{style}]")
+        else:
+            print(text)
 
     def setup_argument_parser(self) -> argparse.ArgumentParser:
         """Setup and configure argument parser"""
         parser = argparse.ArgumentParser(description="See weather in CLI", prog="sunny")
 
+        parser.add_argument(
+            "command",
+            nargs="?",
+            choices=["daemon", "prefetch", "export"],
+            help="'daemon' keeps sunny resident so later calls answer instantly, "
+            "'prefetch' refreshes the [prefetch] locations in the cache, "
+            "'export' prints metrics for the [export] locations",
+        )
+        parser.add_argument(
+            "--loop",
+            help="With 'prefetch', keep refreshing every [prefetch] interval",
+            action="store_true",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["json", "ndjson", "csv", "plain", "openmetrics"],
+            help="Print records in a machine-readable format without styling "
+            "(openmetrics is for 'export')",
+        )
+        parser.add_argument(
+            "--textfile",
+            metavar="PATH",
+            help="With 'export', write the metrics atomically to PATH",
+        )
+        parser.add_argument(
+            "--listen",
+            metavar="[HOST:]PORT",
+            help="With 'export', serve the metrics over HTTP at /metrics",
+        )
         parser.add_argument("-v", "--version", help="Show version", action="store_true")
         parser.add_argument(
             "-a", "--about", help="Show about information", action="store_true"
         )
         parser.add_argument(
-            "-c", "--city", help="City name (add '_' if city has space)"
+            "-c",
+            "--city",
+            action="append",
+            help="City name (add '_' if city has space). Repeat or separate with commas to show many cities",
         )
         parser.add_argument(
             "-t", "--temp", help="Fetch temperature only", action="store_true"
@@ -57,6 +205,41 @@ class WeatherCLI:
         parser.add_argument(
             "--forecast", help="Show weather forecast of 5 days`", action="store_true"
         )
+        parser.add_argument(
+            "--statusline",
+            nargs="?",
+            const="",
+            metavar="TEMPLATE",
+            help="Print one line for status bars from cached data, refreshing it in the background",
+        )
+        parser.add_argument(
+            "--renderer",
+            choices=["rich", "ansi"],
+            help="Draw with rich, or with the faster built-in ANSI renderer",
+        )
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const="stderr",
+            metavar="FILE",
+            help="Time each stage of this call and print a summary to stderr, or append it as JSON lines to FILE",
+        )
+        parser.add_argument(
+            "--budget",
+            help="Show how many API calls are available right now",
+            action="store_true",
+        )
+        parser.add_argument(
+            "--complete",
+            metavar="PREFIX",
+            help="List city names starting with PREFIX, for shell completion",
+        )
+        parser.add_argument(
+            "--watch",
+            type=float,
+            metavar="SECONDS",
+            help="Keep running and refresh the weather every SECONDS",
+        )
         parser.add_argument(
             "--showall",
             help="Show all available ASCII art`",
@@ -90,6 +273,8 @@ class WeatherCLI:
         return api_key, default_location
 
     def get_version(self) -> str:
+        from importlib.metadata import version
+
         return version("sunny")
 
     def get_temperature_units(self, args_units: Optional[str]) -> tuple[str, str, str]:
@@ -104,103 +289,221 @@ class WeatherCLI:
     def process_city_name(self, city_name: str) -> str:
         return city_name.replace("_", "%20") if "_" in city_name else city_name
 
-    def get_weather_data(self, location: str, unit: str) -> Dict[str, Any]:
+    def get_locations(self, cities: list) -> list:
+        """Split repeated and comma separated city arguments into locations.
+
+        An ISO 3166 country code qualifies the city before it, so
+        ``Delhi,IN,Paris`` is Delhi in India and Paris, and a two-letter state
+        code followed by a country code (``Paris,TX,US``) does too. Other
+        parts are cities of their own.
+        """
+        from sunny.geocode import COUNTRY_CODES
+
+        def is_country(part: str) -> bool:
+            return len(part) == 2 and part.upper() in COUNTRY_CODES
+
+        locations = []
+        for value in cities:
+            names = []
+            parts = [part.strip() for part in value.split(",")]
+            for i, part in enumerate(parts):
+                following = parts[i + 1] if i + 1 < len(parts) else ""
+                qualifies = is_country(part) or (
+                    len(part) == 2 and part.isalpha() and is_country(following)
+                )
+                if qualifies and names:
+                    names[-1] += f",{part}"
+                elif part:
+                    names.append(part)
+            for city in names:
+                if self.process_city_name(city) not in locations:
+                    locations.append(self.process_city_name(city))
+        return locations
+
+    def run_prefetch(self, loop: bool = False) -> None:
+        """Refresh the [prefetch] locations once, or every interval with ``loop``."""
+        import time
+
+        settings = self.config.prefetch_settings
+        locations = self.get_locations(settings["locations"])
+        if not locations:
+            print(
+                f"[bold red]Error[/bold red]: No [prefetch] locations configured in {self.config.config_file_location}"
+            )
+            sys.exit(1)
+        interval = float(settings["interval"])
+        # Always download, so the cache is fresh whenever prefetch runs
+        self.weather.max_age = 0
+
+        try:
+            while True:
+                started = time.perf_counter()
+                self.weather.reset()
+                results = self.weather.prefetch(
+                    locations,
+                    settings["units"],
+                    settings["endpoints"],
+                    int(settings["concurrency"]),
+                )
+                failed = 0
+                for endpoint, location, seconds, error in results:
+                    status = "ok" if error is None else str(error)
+                    failed += error is not None
+                    self.echo(
+                        f"{endpoint:<9}{location.replace('%20', ' '):<24}{seconds * 1000:8.0f} ms  {status}"
+                    )
+                elapsed = time.perf_counter() - started
+                self.echo(
+                    f"Prefetched {len(results) - failed}/{len(results)} entries in {elapsed:.2f} s",
+                    "bold green" if not failed else "bold red",
+                )
+                if not loop:
+                    if failed:
+                        sys.exit(1)
+                    return
+                time.sleep(max(0.0, interval - elapsed))
+        except KeyboardInterrupt:
+            pass
+
+    def run_export(
+        self,
+        locations: list,
+        units: Optional[str],
+        textfile: Optional[str],
+        listen: Optional[str],
+    ) -> None:
+        """Export the current weather of many locations as OpenMetrics."""
+        from sunny.export import Exporter, parse_listen
+
+        settings = self.config.export_settings
+        locations = locations or self.get_locations(settings["locations"])
+        if not locations:
+            print(
+                f"[bold red]Error[/bold red]: No [export] locations configured in {self.config.config_file_location}"
+            )
+            sys.exit(1)
+        exporter = Exporter(self.weather, locations, units or settings["units"])
+        listen = parse_listen(listen or settings["listen"])
+        textfile = textfile or settings["textfile"]
+
+        if listen:
+            exporter.serve(listen)
+        elif textfile:
+            try:
+                exporter.write_textfile(textfile)
+            except OSError as e:
+                print(f"[bold red]Error[/bold red]: Unable to write {textfile}: {e}")
+                sys.exit(1)
+        else:
+            sys.stdout.write(exporter.collect())
+
+    @trace.traced
+    def write_records(
+        self, fmt: str, locations: list, unit: str, forecast: bool, selected: list
+    ) -> None:
+        """Print current weather or forecast records in ``fmt``, bypassing rich.
+
+        Many locations are fetched concurrently and, except for JSON, written
+        one record per city as each one completes. ``selected`` limits the
+        records to those fields.
+        """
+        from sunny import output
+
+        if selected:
+            keys = ["location", "date"] if forecast else ["location"]
+            fields = [*keys, "units", *selected]
+        else:
+            fields = output.FORECAST_FIELDS if forecast else output.CURRENT_FIELDS
+
+        if forecast:
+            writer = output.Writer(fmt, fields, many=True)
+            for location in locations:
+                days = self.weather.fetch_forecast(location, unit)
+                for record in output.forecast_records(location, days, unit):
+                    writer.write(record)
+        elif len(locations) > 1:
+            writer = output.Writer(fmt, fields, many=True)
+            for location, result in self.weather.iter_many(locations, unit):
+                writer.write(output.current_record(location, result, unit))
+        else:
+            writer = output.Writer(fmt, fields)
+            current = self.weather.fetch_current(locations[0], unit)
+            writer.write(output.current_record(locations[0], current, unit))
+        writer.close()
+
+    @trace.traced
+    def display_budget(self) -> None:
+        """Display the API calls left in the shared rate limit bucket."""
+        self.validate_config()
+        limiter = self.weather.limiter
+        if limiter is None:
+            self.echo("API rate limiting is disabled")
+            return
+        remaining = limiter.remaining()
+        colour = "bold green" if remaining >= 1 else "bold red"
+        self.echo(
+            f"API budget: {int(remaining)} of {int(limiter.burst)} calls available, "
+            f"refilling at {limiter.rate * 60:g}/min",
+            colour,
+        )
+
+    def complete_cities(self, prefix: str) -> None:
+        """Print city names for shell completion, one per line."""
+        cities = self.weather.cities
+        if cities is None:
+            return
+        for city in cities.complete(prefix):
+            builtins.print(city.arg)
+
+    def get_weather_data(self, location: str, unit: str) -> "CurrentWeather":
         """Get weather data"""
         try:
-            return self.weather.get_weather_city_json(location, unit)
+            return self.weather.fetch_current(location, unit)
         except Exception as e:
             print(
                 f"[bold red]Error[/bold red]: Failed to fetch weather data - {str(e)}"
             )
             sys.exit(1)
 
-    def display_ascii_art(self, weather_data: Dict[str, Any]) -> None:
+    @trace.traced
+    def display_ascii_art(self, weather_data: "CurrentWeather") -> None:
         """Display ASCII art for weather condition"""
-        condition = weather_data["weather"][0]["main"]
-        icon = weather_data["weather"][0]["icon"]
-        color = self.config.condition_colour(condition)
-        ascii_art = f"[{color}]{self.config.ascii_art(condition, icon)}[/{color}]"
-        print(ascii_art)
+        self.show("ascii", weather_data, lambda renderer: renderer.ascii_art(weather_data))
 
+    @trace.traced
     def display_full_weather(
         self,
-        weather_data: Dict[str, Any],
+        weather_data: "CurrentWeather",
         location: str,
         deg_symbol: str,
         wind_unit: str,
     ) -> None:
         """Display complete weather information."""
         try:
-            main_data = weather_data["main"]
-            weather_info = weather_data["weather"][0]
-            wind_data = weather_data["wind"]
-            coord_data = weather_data["coord"]
-            sys_data = weather_data["sys"]
-
-            temperature = main_data["temp"]
-            feels_like_temp = main_data["feels_like"]
-            humidity = main_data["humidity"]
-            description = weather_info["description"]
-            condition = weather_info["main"]
-            wind_speed = wind_data["speed"]
-
-            ascii_color = self.config.condition_colour(condition)
-            ascii_art = f"[{ascii_color}]{self.config.ascii_art(condition, weather_info['icon'])}[/{ascii_color}]"
-
-            content_panels = [
-                Panel(
-                    f"[{self.config.condition_colour(condition)}]{description.capitalize()}[/{self.config.condition_colour(condition)}]",
-                    box=box.MINIMAL,
-                ),
-                Panel(
-                    f"[{self.config.temp_colour(temperature)}]Temp: {temperature:.1f}° (feels {feels_like_temp:.1f}°) {deg_symbol}[/{self.config.temp_colour(temperature)}]",
-                    box=box.MINIMAL,
-                ),
-                Panel(
-                    f"[{self.config.humid_colour(humidity)}]Humidity: {humidity}%[/{self.config.humid_colour(humidity)}]",
-                    box=box.MINIMAL,
-                ),
-                Panel(
-                    f"[{self.config.wind_colour}]Wind: {wind_speed} {wind_unit}[/{self.config.wind_colour}]",
-                    box=box.MINIMAL,
-                ),
-            ]
-
-            content = Columns(content_panels)
-
-            weather_panel = Panel(
-                content,
-                title=f"[{self.config.city_colour}]{location.replace('%20', ' ').title()}[/{self.config.city_colour}]",
-                border_style=f"{self.config.get_panel_attribute('border_style')} {self.config.get_panel_attribute('border_colour')}",
-                box=self.config.get_box_style(),
-                padding=(
-                    self.config.get_panel_attribute("padding_top_right"),
-                    self.config.get_panel_attribute("padding_bottom_left"),
+            self.show(
+                "full",
+                (weather_data, location, deg_symbol, wind_unit),
+                lambda renderer: renderer.full_weather(
+                    weather_data, location, deg_symbol, wind_unit
                 ),
-                width=self.config.get_panel_attribute("width"),
-                height=self.config.get_panel_attribute("height"),
-                subtitle=f"[dim]Coord: ({coord_data['lon']:.2f}, {coord_data['lat']:.2f}) | Country: {sys_data['country']}[/dim]",
             )
-
-            ascii_panel = Panel(
-                ascii_art,
-                border_style=f"{self.config.get_ascii_panel_attribute('border_style')} {self.config.city_colour}",
-                box=self.config.get_ascii_box_style(),
-                padding=(
-                    self.config.get_ascii_panel_attribute("padding_top_right"),
-                    self.config.get_ascii_panel_attribute("padding_bottom_left"),
-                ),
-                width=self.config.get_ascii_panel_attribute("width"),
-                height=self.config.get_ascii_panel_attribute("height"),
-            )
-
-            self.console.print(ascii_panel)
-            self.console.print(weather_panel)
-
         except (KeyError, TypeError) as e:
             print(f"[bold red]Error[/bold red]: Invalid weather data format - {e}")
             sys.exit(1)
 
+    @trace.traced
+    def display_multi_city(
+        self, locations: list, unit: str, deg_symbol: str, wind_unit: str
+    ) -> None:
+        """Display a compact grid with the current weather of many cities."""
+        results = self.weather.fetch_many(locations, unit)
+        self.show(
+            "multi",
+            ([(location, results[location]) for location in locations], deg_symbol, wind_unit),
+            lambda renderer: renderer.multi_city(locations, results, deg_symbol, wind_unit),
+        )
+
+    @trace.traced
     def display_forecast(
         self,
         location: str,
@@ -208,56 +511,27 @@ class WeatherCLI:
         deg_symbol: str,
         wind_unit: str,
     ):
-        """Display 5-days forecast."""
-
+        """Display one card per forecast day."""
         try:
-            day_cards = []
-            for i in range(5):
-
-                dt_text = weather_data[i].get("dt_txt")
-                dt = datetime.strptime(dt_text, "%Y-%m-%d %H:%M:%S")
-                day_str = dt.strftime("%a %d %b")
-                time_str = dt.strftime("%I:%M %p")
-
-                temperature = weather_data[i].get("temp")
-                feels_like_temp = weather_data[i].get("feels_like_temp")
-                humidity = weather_data[i].get("humidity")
-                description = weather_data[i].get("description")
-                condition = weather_data[i].get("main")
-                wind_speed = weather_data[i].get("wind_speed")
-                icon = weather_data[i].get("icon")
-
-                ascii_color = self.config.condition_colour(condition)
-                ascii_art = f"[{ascii_color}]{self.config.ascii_art(condition,icon )}[/{ascii_color}]"
-
-                details = "\n".join(
-                    [
-                        f"[{self.config.condition_colour(condition)}]{description.capitalize()}[/{self.config.condition_colour(condition)}]",
-                        f"[{self.config.temp_colour(temperature)}]Temp: {temperature:.1f}° (feels {feels_like_temp:.1f}°) {deg_symbol}[/{self.config.temp_colour(temperature)}]",
-                        f"[{self.config.humid_colour(humidity)}]Humidity: {humidity}%[/{self.config.humid_colour(humidity)}]",
-                        f"[{self.config.wind_colour}]Wind: {wind_speed} {wind_unit}[/{self.config.wind_colour}]",
-                    ]
-                )
-
-                card = Panel(
-                    f"{ascii_art}\n\n{details}",
-                    title=f"[{self.config.city_colour}]{day_str}[/{self.config.city_colour}]",
-                    subtitle=f"[dim]{time_str}[/dim]",
-                    border_style=f"{self.config.get_panel_attribute('border_style')} {self.config.get_panel_attribute('border_colour')}",
-                    box=self.config.get_box_style(),
-                    padding=(1,4),
-                    width=30,
-                    height=20,
-                )
-
-                day_cards.append(card)
-
-            self.console.print(Columns(day_cards, expand=True))
-
+            self.show(
+                "forecast",
+                (weather_data, deg_symbol, wind_unit),
+                lambda renderer: renderer.forecast(weather_data, deg_symbol, wind_unit),
+            )
         except (KeyError, TypeError) as e:
             print(f"[bold red]Error[/bold red]: Invalid weather data format - {e}")
             sys.exit(1)
 
+    @trace.traced
+    def display_statusline(
+        self, location: str, unit: str, template: Optional[str] = None
+    ) -> None:
+        """Display one line for status bars, without waiting on the network."""
+        from sunny.statusline import statusline
+
+        builtins.print(statusline(self.weather, location, unit, template))
+
+    @trace.traced
     def display_temperature_only(
         self, location: str, unit: str, deg_symbol: str
     ) -> None:
@@ -265,37 +539,103 @@ class WeatherCLI:
         try:
             temperature = self.weather.fetch_temp(location, unit)
             color = self.config.temp_colour(temperature)
-            print(f"[{color}]Temperature: {temperature:.1f}{deg_symbol}[/{color}]")
+            self.echo(f"Temperature: {temperature:.1f}{deg_symbol}", color)
         except Exception as e:
             print(f"[bold red]Error[/bold red]: Failed to fetch temperature - {str(e)}")
             sys.exit(1)
 
+    @trace.traced
     def display_humidity_only(self, location: str, unit: str) -> None:
         """Display only humidity information"""
         try:
             humidity = self.weather.fetch_humid(location, unit)
             color = self.config.humid_colour(humidity)
-            print(f"[{color}]Humidity: {humidity}%[/{color}]")
+            self.echo(f"Humidity: {humidity}%", color)
         except Exception as e:
             print(f"[bold red]Error[/bold red]: Failed to fetch humidity - {str(e)}")
             sys.exit(1)
 
+    @trace.traced
     def display_description_only(self, location: str, unit: str) -> None:
         """Display only weather description."""
         try:
             weather_data = self.get_weather_data(location, unit)
-            description = weather_data["weather"][0]["description"]
-            condition = weather_data["weather"][0]["main"]
+            description = weather_data.description
+            condition = weather_data.main
             color = self.config.condition_colour(condition)
-            print(f"[{color}]{description.capitalize()}[/{color}]")
+            self.echo(description.capitalize(), color)
         except Exception as e:
             print(f"[bold red]Error[/bold red]: Failed to fetch description - {str(e)}")
             sys.exit(1)
 
-    def run(self) -> None:
+    def watch(self, fetch: Callable, build: Callable, interval: float) -> None:
+        """Re-fetch a view every ``interval`` seconds and redraw it in place.
+
+        The console, theme, config and HTTP session are reused between
+        refreshes, panels are only rebuilt when the fetched data changed and a
+        failed refresh keeps the last good view on screen.
+        """
+        import time
+        from contextlib import nullcontext
+        from rich.live import Live
+        from rich.text import Text
+        from rich.console import Group
+
+        self.weather.max_age = interval
+        data = view = None
+        # Off a terminal there is nothing to redraw, so each refresh is printed
+        live = Live(console=self.console, auto_refresh=False)
+        with live if self.is_terminal else nullcontext():
+            try:
+                while True:
+                    started = time.monotonic()
+                    self.weather.reset()
+                    try:
+                        fresh = fetch()
+                        if view is None or fresh != data:
+                            view, data = self.renderer.renderable(build(fresh)), fresh
+                        status = Text(
+                            f"Updated {time.strftime('%H:%M:%S')}, every {interval:g}s",
+                            style="dim",
+                        )
+                    except SystemExit as e:
+                        status = Text(f"{e.code} Retrying in {interval:g}s.", style="bold red")
+                    except (KeyError, TypeError) as e:
+                        status = Text(
+                            f"Error: Invalid weather data format - {e}", style="bold red"
+                        )
+
+                    screen = status if view is None else Group(status, view)
+                    if self.is_terminal:
+                        live.update(screen, refresh=True)
+                    else:
+                        self.console.print(screen)
+                    time.sleep(max(0.0, interval - (time.monotonic() - started)))
+            except KeyboardInterrupt:
+                pass
+
+    def run(self, argv: Optional[list] = None) -> None:
         """Main application entry point"""
+        argv = sys.argv[1:] if argv is None else argv
+        trace.enable_from(argv)
+        try:
+            self._run(argv)
+        finally:
+            trace.finish(argv)
+
+    def _run(self, argv: list) -> None:
         parser = self.setup_argument_parser()
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
+        # The daemon runs every call on the same object, so a --renderer of
+        # an earlier call must not carry over
+        self.renderer_name = args.renderer
+        self._renderer = None
+
+        if args.command == "daemon":
+            from sunny.daemon import serve
+
+            serve()
+            return
 
         if args.init:
             self.config.setup_config()
@@ -303,25 +643,54 @@ class WeatherCLI:
             return
 
         if args.about:
-            print("[bold yellow]sunny[/bold yellow] - A minimal CLI weather tool")
+            if self.is_terminal:
+                print("[bold yellow]sunny[/bold yellow] - A minimal CLI weather tool")
+            else:
+                self.echo("sunny - A minimal CLI weather tool")
             return
 
         if args.showall:
+            from sunny.themes import show_all_ascii
+
             show_all_ascii()
             return
 
         if args.themes:
-            print()
-            show_all_themes()
+            from sunny.themes import show_all_themes
+
+            self.renderer.print("")
+            show_all_themes(self.renderer)
             return
 
         if args.version:
-            version = self.get_version()
-            print(f"[bold green]{version}[/bold green]")
+            self.echo(self.get_version(), "bold green")
+            return
+
+        if args.budget:
+            self.display_budget()
+            return
+
+        if args.complete is not None:
+            self.complete_cities(args.complete)
+            return
 
         api_key, default_location = self.validate_config()
 
-        location = self.process_city_name(args.city) if args.city else default_location
+        if args.command == "prefetch":
+            self.run_prefetch(args.loop)
+            return
+
+        if args.command == "export" or args.format == "openmetrics":
+            self.run_export(
+                self.get_locations(args.city) if args.city else [],
+                args.units,
+                args.textfile,
+                args.listen,
+            )
+            return
+
+        locations = self.get_locations(args.city) if args.city else []
+        location = locations[0] if locations else default_location
         if not location:
             print(
                 f"[bold red]Error[/bold red]: No city specified. Configure default location in {self.config.config_file_location}"
@@ -330,6 +699,54 @@ class WeatherCLI:
 
         unit, deg_symbol, wind_unit = self.get_temperature_units(args.units)
 
+        if args.statusline is not None:
+            self.display_statusline(location, unit, args.statusline or None)
+            return
+
+        if args.format:
+            if args.watch is not None:
+                parser.error("--format cannot be combined with --watch")
+            selected = [
+                field
+                for flag, field in (
+                    (args.temp, "temp"),
+                    (args.humidity, "humidity"),
+                    (args.description, "description"),
+                )
+                if flag
+            ]
+            self.write_records(
+                args.format,
+                locations or [location],
+                unit,
+                args.forecast,
+                selected,
+            )
+            return
+
+        if args.watch is not None:
+            if args.watch <= 0:
+                parser.error("--watch needs a positive number of seconds")
+            if len(locations) > 1:
+                fetch = lambda: self.weather.fetch_many(locations, unit)
+                build = lambda results: self.renderer.multi_city(
+                    locations, results, deg_symbol, wind_unit
+                )
+            elif args.forecast:
+                fetch = lambda: self.weather.fetch_forecast(location, unit)
+                build = lambda days: self.renderer.forecast(days, deg_symbol, wind_unit)
+            else:
+                fetch = lambda: self.weather.fetch_current(location, unit)
+                build = lambda current: self.renderer.full_weather(
+                    current, location, deg_symbol, wind_unit
+                )
+            self.watch(fetch, build, args.watch)
+            return
+
+        if len(locations) > 1:
+            self.display_multi_city(locations, unit, deg_symbol, wind_unit)
+            return
+
         if args.temp:
             self.display_temperature_only(location, unit, deg_symbol)
 
@@ -348,10 +765,10 @@ class WeatherCLI:
 
         if (
             not any([args.temp, args.humidity, args.description, args.forecast])
-            or len(sys.argv) == 1
+            or len(argv) == 0
         ):
             weather_data = self.get_weather_data(location, unit)
             self.display_full_weather(weather_data, location, deg_symbol, wind_unit)
-        else:
+        elif args.forecast:
             data = self.weather.fetch_forecast(location, unit)
             self.display_forecast(location, data, deg_symbol, wind_unit)
@@ -1,10 +1,28 @@
-import toml
 import sys
 import os
-import glob
+import marshal
 from pathlib import Path
 from rich import print
-from platformdirs import user_config_dir
+from platformdirs import user_config_dir, user_cache_dir
+from sunny import trace
+
+# Bump when the layout of the compiled config cache changes
+COMPILED_CACHE_VERSION = 1
+
+
+def _file_signature(path) -> tuple:
+    """Identify a file's current contents by path, mtime and size."""
+    stat = os.stat(path)
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _plain(value):
+    """Convert parsed TOML into plain builtins that marshal can store."""
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
 
 
 class ConfigManager:
@@ -13,13 +31,19 @@ class ConfigManager:
         self.CONFIG_DIR = Path(user_config_dir(self.APP_NAME))
         self.CONFIG_FILE = self.CONFIG_DIR / "config.toml"
         self.THEMES_DIR = self.CONFIG_DIR / "themes"
+        self.ASCII_ART_FILE = self.CONFIG_DIR / "ascii_art.toml"
         self.THEMES_FILES = [
             self.THEMES_DIR / "sunny_dynamic.toml",
             self.THEMES_DIR / "minimal.toml",
             self.THEMES_DIR / "cyberpunk.toml",
         ]
+        self.COMPILED_FILE = Path(user_cache_dir(self.APP_NAME)) / "config.marshal"
         self._config_data = None
         self._theme_data = None
+        self._theme_file = None
+        self._compiled = None
+        self._resolver = None
+        self._art = None
         self.DEFAULT_CONFIG = """
 # sunny Configuration
 
@@ -37,6 +61,77 @@ units = "metric"
 show_forecast = false
 days = 5
 theme = "sunny_dynamic"
+# How each forecast day is built: "daily" (whole-day summary), "noon" or "sample"
+forecast_strategy = "daily"
+# "rich", or "ansi" to draw the same layout with the faster built-in renderer
+renderer = "rich"
+
+# Response cache (seconds). Stale answers are shown at once and refreshed in the background
+[cache]
+enabled = true
+weather_ttl = 600
+forecast_ttl = 1800
+stale_ttl = 3600
+max_entries = 200
+# Rendered views kept so repeated calls skip layout, 0 to turn off
+render_entries = 100
+
+# HTTP settings. Timeouts are in seconds; retries apply to 5xx responses
+[network]
+base_url = "https://api.openweathermap.org"
+connect_timeout = 3.05
+read_timeout = 10
+retries = 3
+backoff_factor = 0.5
+
+# Where weather comes from: "openweather" ([network] base_url), or "stub", which serves
+# weather.json and forecast.json from the fixtures directory for tests. With a backup
+# ("openweather" at backup_url, or "stub") and hedge_after > 0, a request still
+# unanswered after hedge_after seconds is raced against the backup; first valid answer wins
+[provider]
+name = "openweather"
+fixtures = ""
+backup = ""
+backup_url = ""
+hedge_after = 0
+
+# Calls per API key shared by every sunny process. Requests wait up to max_wait
+# seconds for budget and fail after that
+[ratelimit]
+enabled = true
+calls_per_minute = 60
+burst = 20
+max_wait = 10
+
+# Locations `sunny prefetch` refreshes in the response cache. `sunny prefetch --loop`
+# repeats every interval seconds, so keep it below the cache TTLs. units = "" uses
+# the [defaults] units
+[prefetch]
+locations = []
+units = ""
+endpoints = ["weather", "forecast"]
+interval = 300
+concurrency = 4
+
+# `sunny export --format openmetrics` metrics. Empty locations use the [prefetch]
+# ones. textfile is written atomically for node_exporter's textfile collector,
+# listen ("9118" or "host:port") serves /metrics instead, neither prints to stdout
+[export]
+locations = []
+units = ""
+textfile = ""
+listen = ""
+
+# `sunny --statusline` for tmux, polybar and i3blocks. It reads cached data only and
+# refreshes it in the background, or waits for the API when [cache] is disabled.
+# Fields: {icon} {temp} {feels_like} {deg} {humidity} {wind} {wind_unit}
+# {description} {main} {location} {stale}, with format specs like {temp:.1f}.
+# stale_marker fills {stale} once data is stale_after seconds old
+[statusline]
+template = "{icon} {temp:.0f}{deg} {humidity}%{stale}"
+stale_after = 900
+stale_marker = "*"
+missing = "…"
 """
         self.THEMES = {
             "sunny_dynamic": """
@@ -90,6 +185,12 @@ Snow = "bright_white"
 Atmosphere = "grey53"
 Clear = "dark_orange"
 Clouds = "orchid"
+
+# Optional custom bands for temperature and humidity colours.
+# A value above a bound moves up to the next colour.
+# [bands.temp]
+# bounds = [0, 10, 20, 30]
+# colours = ["blue1", "deep_sky_blue1", "chartreuse3", "sandy_brown", "red1"]
 """,
             "minimal": """
 # minimal
@@ -230,14 +331,64 @@ Clouds = "purple3"
         else:
             print(f"✅ Themes exists at: {self.THEMES_DIR}")
 
+    def _load_compiled(self) -> dict:
+        """Load the compiled config cache, or an empty one if it is missing or outdated."""
+        if self._compiled is None:
+            try:
+                with open(self.COMPILED_FILE, "rb") as f:
+                    compiled = marshal.load(f)
+                if compiled.get("version") != COMPILED_CACHE_VERSION:
+                    compiled = {}
+            except (OSError, EOFError, ValueError, TypeError, AttributeError):
+                compiled = {}
+            self._compiled = compiled
+        return self._compiled
+
+    def _save_compiled(self, **entries) -> None:
+        """Store parsed config or theme data so later runs skip TOML parsing."""
+        compiled = dict(self._load_compiled(), version=COMPILED_CACHE_VERSION, **entries)
+        try:
+            data = marshal.dumps(compiled)
+            self.COMPILED_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.COMPILED_FILE.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.COMPILED_FILE)
+            self._compiled = compiled
+        except (OSError, ValueError):
+            pass
+
+    def load_cached(self, name: str, default=None):
+        """Get a derived entry stored in the compiled config cache."""
+        return self._load_compiled().get(name, default)
+
+    def store_cached(self, name: str, value) -> None:
+        """Store a derived entry in the compiled config cache."""
+        self._save_compiled(**{name: value})
+
+    def _load_toml(self, path) -> dict:
+        import toml
+
+        with open(path, "r", encoding="utf-8") as f:
+            return _plain(toml.load(f))
+
     def _load_config(self) -> dict:
         """Load configuration data from file."""
         if not self.CONFIG_FILE.exists():
             self.setup_config()
 
-        with self.CONFIG_FILE.open("r", encoding="utf-8") as f:
-            self._config_data = toml.load(f)
-        return self._config_data
+        with trace.span("config.load") as span:
+            signature = _file_signature(self.CONFIG_FILE)
+            compiled = self._load_compiled()
+            if compiled.get("config_signature") == signature:
+                span.set(compiled=True)
+                self._config_data = compiled["config"]
+                return self._config_data
+
+            span.set(compiled=False)
+            self._config_data = self._load_toml(self.CONFIG_FILE)
+            self._save_compiled(config_signature=signature, config=self._config_data)
+            return self._config_data
 
     @property
     def config(self) -> dict:
@@ -253,11 +404,12 @@ Clouds = "purple3"
 
     def get_theme_file(self):
         """Get the theme file path, falling back to sunny_dynamic if needed."""
-        if self._config_data == None:
-            self.config
-        defualt_theme = self._config_data.get("display").get("theme")
-        file = glob.glob(os.path.join(self.THEMES_DIR, f"{defualt_theme}.toml"))[0]
-        return file
+        if self._theme_file is None:
+            if self._config_data == None:
+                self.config
+            defualt_theme = self._config_data.get("display").get("theme")
+            self._theme_file = os.path.join(self.THEMES_DIR, f"{defualt_theme}.toml")
+        return self._theme_file
 
     def _load_theme(self):
         """Load theme data from file."""
@@ -265,8 +417,17 @@ Clouds = "purple3"
         if not os.path.exists(theme_file):
             print(f"Theme file not found: {theme_file}")
             sys.exit(1)
-        with open(theme_file, "r", encoding="utf-8") as f:
-            theme_data = toml.load(f)
+
+        with trace.span("theme.load", theme=Path(theme_file).stem) as span:
+            signature = _file_signature(theme_file)
+            compiled = self._load_compiled()
+            if compiled.get("theme_signature") == signature:
+                span.set(compiled=True)
+                return compiled["theme"]
+
+            span.set(compiled=False)
+            theme_data = self._load_toml(theme_file)
+            self._save_compiled(theme_signature=signature, theme=theme_data)
             return theme_data
 
     @property
@@ -311,237 +472,193 @@ Clouds = "purple3"
             )
             sys.exit(1)
 
+    @property
+    def cache_settings(self) -> dict:
+        """Get response cache settings from config, filling in defaults."""
+        settings = {
+            "enabled": True,
+            "weather_ttl": 600,
+            "forecast_ttl": 1800,
+            "stale_ttl": 3600,
+            "max_entries": 200,
+            "render_entries": 100,
+        }
+        settings.update(self.config.get("cache", {}))
+        return settings
+
+    @property
+    def forecast_settings(self) -> dict:
+        """Get forecast days and strategy from the [display] section."""
+        display = self.config.get("display", {})
+        return {
+            "days": int(display.get("days", 5)),
+            "strategy": display.get("forecast_strategy", "daily"),
+        }
+
+    @property
+    def display_signature(self) -> tuple:
+        """Identify the config, theme and art files views are drawn from."""
+        from sunny.art import DATA_FILE
+
+        signatures = []
+        for path in (self.CONFIG_FILE, self.get_theme_file(), self.ASCII_ART_FILE, DATA_FILE):
+            try:
+                signatures.append(_file_signature(path))
+            except OSError:
+                signatures.append(None)
+        return tuple(signatures)
+
+    @property
+    def get_renderer(self) -> str:
+        """Get the renderer name from the [display] section."""
+        return self.config.get("display", {}).get("renderer", "rich")
+
+    @property
+    def network_settings(self) -> dict:
+        """Get HTTP transport settings from config, filling in defaults."""
+        settings = {
+            "base_url": "https://api.openweathermap.org",
+            "connect_timeout": 3.05,
+            "read_timeout": 10,
+            "retries": 3,
+            "backoff_factor": 0.5,
+            "pool_size": 10,
+        }
+        settings.update(self.config.get("network", {}))
+        return settings
+
+    @property
+    def provider_settings(self) -> dict:
+        """Get weather provider and hedging settings from config, filling in defaults."""
+        settings = {
+            "name": "openweather",
+            "fixtures": "",
+            "backup": "",
+            "backup_url": "",
+            "hedge_after": 0,
+        }
+        settings.update(self.config.get("provider", {}))
+        return settings
+
+    @property
+    def ratelimit_settings(self) -> dict:
+        """Get API rate limit settings from config, filling in defaults."""
+        settings = {
+            "enabled": True,
+            "calls_per_minute": 60,
+            "burst": 20,
+            "max_wait": 10,
+        }
+        settings.update(self.config.get("ratelimit", {}))
+        return settings
+
+    @property
+    def prefetch_settings(self) -> dict:
+        """Get prefetch settings from config, filling in defaults."""
+        settings = {
+            "locations": [],
+            "units": "",
+            "endpoints": ["weather", "forecast"],
+            "interval": 300,
+            "concurrency": 4,
+        }
+        settings.update(self.config.get("prefetch", {}))
+        if not settings["units"]:
+            settings["units"] = self.get_unit or "metric"
+        return settings
+
+    @property
+    def statusline_settings(self) -> dict:
+        """Get status line settings from config, filling in defaults."""
+        settings = {
+            "template": "{icon} {temp:.0f}{deg} {humidity}%{stale}",
+            "stale_after": 900,
+            "stale_marker": "*",
+            "missing": "…",
+        }
+        settings.update(self.config.get("statusline", {}))
+        return settings
+
+    @property
+    def export_settings(self) -> dict:
+        """Get export settings from config, filling in defaults."""
+        settings = {"locations": [], "units": "", "textfile": "", "listen": ""}
+        settings.update(self.config.get("export", {}))
+        if not settings["locations"]:
+            settings["locations"] = self.prefetch_settings["locations"]
+        if not settings["units"]:
+            settings["units"] = self.get_unit or "metric"
+        return settings
+
+    @property
+    def resolver(self):
+        """Get the precompiled lookups for the current theme."""
+        if self._resolver is None:
+            from sunny.resolver import ThemeResolver
+
+            self._resolver = ThemeResolver(self.theme, self.get_theme_file())
+        return self._resolver
+
     @property
     def city_colour(self) -> str:
         """Get city color from theme."""
-        file_location = self.get_theme_file()
-        try:
-            return self.theme.get("colours").get("col_city")
-        except Exception as e:
-            print(
-                f"Warning: No default city color found in {file_location}. Using fallback value 'light_steel_blue'. Exception : {e}"
-            )
-            return "light_steel_blue"
+        return self.resolver.city
 
     def temp_colour(self, temperature: float) -> str:
         """Get temperature color based on value."""
-        file_location = self.get_theme_file()
-        try:
-            if temperature > 30:
-                return self.theme.get("colours").get("col_temp").get("high")
-            elif temperature > 10:
-                return self.theme.get("colours").get("col_temp").get("mid")
-            else:
-                return self.theme.get("colours").get("col_temp").get("low")
-
-        except Exception as e:
-            print(
-                f"Warning: No default temp color found in {file_location}. Using fallback value 'chartreuse3'. Exception: {e}"
-            )
-            return "chartreuse3"
+        return self.resolver.temp(temperature)
 
     def humid_colour(self, humidity: int) -> str:
         """Get humidity color based on value."""
-        file_location = self.get_theme_file()
-        try:
-            if humidity > 65:
-                return self.theme.get("colours").get("col_humid").get("high")
-            elif humidity >= 55:
-                return self.theme.get("colours").get("col_humid").get("mid")
-            else:
-                return self.theme.get("colours").get("col_humid").get("low")
-        except Exception as e:
-            print(
-                f"Warning: No default humid color found in {file_location}. Using fallback value 'green_yellow'. Exception: {e}"
-            )
-            return "green_yellow"
+        return self.resolver.humid(humidity)
 
     def condition_colour(self, condition: str):
         """Get weather condition color based on condition type."""
-        try:
-            if condition == "Thunderstorm":
-                return self.theme.get("colours").get("col_desc").get("Thunderstorm")
-            elif condition == "Drizzle":
-                return self.theme.get("colours").get("col_desc").get("Drizzle")
-            elif condition == "Rain":
-                return self.theme.get("colours").get("col_desc").get("Rain")
-            elif condition == "Snow":
-                return self.theme.get("colours").get("col_desc").get("Snow")
-            elif condition == "Atmosphere":
-                return self.theme.get("colours").get("col_desc").get("Atmosphere")
-            elif condition == "Clear":
-                return self.theme.get("colours").get("col_desc").get("Clear")
-            elif condition == "Clouds":
-                return self.theme.get("colours").get("col_desc").get("Clouds")
-            else:
-                return "dark_orange"
-        except Exception as e:
-            print(
-                f"Warning: No default condition color found in {self.get_theme_file()}. Using fallback value 'dark_orange'. Exception: {e}"
-            )
-            return "dark_orange"
+        return self.resolver.condition_colour(condition)
 
     @property
     def wind_colour(self) -> str:
         """Get wind color from theme."""
+        return self.resolver.wind
+
+    @property
+    def art(self):
+        """Get the ASCII art registry, loading art files on first use."""
+        if self._art is None:
+            from sunny.art import ArtRegistry
+
+            self._art = ArtRegistry(self._load_user_art)
+        return self._art
+
+    def _load_user_art(self) -> dict:
+        """Load user supplied ASCII art, if any."""
         try:
-            return self.theme.get("colours").get("col_wind")
+            signature = _file_signature(self.ASCII_ART_FILE)
+        except OSError:
+            return {}
+        compiled = self._load_compiled()
+        if compiled.get("ascii_art_signature") == signature:
+            return compiled["ascii_art"]
+
+        try:
+            art = self._load_toml(self.ASCII_ART_FILE)
         except Exception as e:
-            print(
-                f"Warning: No default wind color found in {self.get_theme_file()}. Using fallback value 'sky_blue1'. Exception: {e}"
-            )
-            return "sky_blue1"
+            print(f"Warning: Unable to read {self.ASCII_ART_FILE}. Exception: {e}")
+            return {}
+        self._save_compiled(ascii_art_signature=signature, ascii_art=art)
+        return art
 
     def ascii_art(self, condition: str, icon: str):
-        if condition == "Thunderstorm":
-            return r"""                    
-           #####            
-      ....=########         
-    .......:########        
-   ............-######      
- ...............*######     
-...................*##          
-  ...:==+-........          
-      ==                    
-     =="""
-        elif condition == "Drizzle":
-            return r"""       
-        #####           
-   ......*######        
-   .........+#####      
-.............:*###      
-...............         
-  ...#........          
-    #### #              
-      # ##"""
-        elif condition == "Rain":
-            return r"""
-      . =======        
-   .....:+======       
-  ..........+===       
-.............:++       
-...............        
- ...++........         
-    # ## #             
-     ## #"""
-        elif condition == "Snow":
-            return r"""
-               __##____    
-  *        *  /  ##  ****  
-             /        **** 
-   *        /        ******
-           /___________****
-            |            **
-        *   | ___        | 
-  *         | | |   ___  | 
-            | |_|   | |  **"""
-        elif condition == "Atmosphere":
-            return r"""
-     ######             
-  ##########            
-     #############      
-#############           
-   #############        
-     ########"""
-        elif condition == "Clear":
-            if icon == "01d":
-                return r"""
-   ========           
- ============         
-==============        
-===============       
-===============       
-==============        
- ============+        
-   ========+"""
-            else:
-                return r"""         
-   ########           
- ############         
-##############        
-###############       
-###############       
-##############        
- #############        
-   #########"""
-        elif condition == "Clouds":
-            if icon == "02d":
-                return r"""                                    
-      ....+========      
-    .......=========     
-    ...........=====     
- ..............-+===     
-...................      
-  ................"""
-            elif icon == "02n":
-                return r"""
-           ###         
-      ....#########      
-    .......#########     
-    ..........:#####     
- ..............+####        
-  ............"""
-            elif icon == "03n":
-                return r"""
-     .....              
-    ........            
-  .............         
-..................      
-..................      
- ................."""
-            elif icon == "04n":
-                return r"""
-           ##            
-      .. ######          
-    ......+#######       
-   ..........:######     
-..............-######    
-.................*##     
-..................       
- ................"""
-            else:
-                return r"""
-     .....              
-    ........            
-  .............         
-..................      
-..................      
- ................."""
-
-        else:
-            return r"""                                      
-      ....+======      
-    .......========     
-   .............====              
-...................=     
-  ................"""
+        return self.art.lookup(condition, icon)
 
     def get_panel_attribute(self, key):
-        return self.theme.get("panel", {}).get(key)
+        return self.resolver.panel.get(key)
 
     def get_box_style(self):
-        try:
-            from rich import box
-
-            box_style = self.theme.get("panel", {}).get("box").upper()
-            box_object = getattr(box, box_style)
-            return box_object
-        except AttributeError as e:
-            print(
-                f"Error getting box attribute value from config. [{self.get_theme_file()}]"
-            )
-            sys.exit(1)
+        return self.resolver.box
 
     def get_ascii_panel_attribute(self, key):
-        return self.theme.get("ascii_panel", {}).get(key)
+        return self.resolver.ascii_panel.get(key)
 
     def get_ascii_box_style(self):
-        try:
-            from rich import box
-
-            box_style = self.theme.get("ascii_panel", {}).get("box").upper()
-            box_object = getattr(box, box_style)
-            return box_object
-        except AttributeError as e:
-            print(f"Error getting box attribute value from {self.get_theme_file()}.")
-            sys.exit(1)
+        return self.resolver.ascii_box
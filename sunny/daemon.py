@@ -0,0 +1,243 @@
+"""Resident sunny process answering CLI calls over a Unix domain socket.
+
+The client half of this module only needs the standard library so that
+``sunny`` can hand its arguments to a running daemon before paying for
+importing rich, requests or parsing any TOML.
+"""
+
+import os
+import sys
+import json
+import socket
+import threading
+from pathlib import Path
+from platformdirs import user_cache_dir
+
+SOCKET_PATH = Path(user_cache_dir("sunny")) / "sunny.sock"
+
+# Arguments that must run in the calling process. Exports serve a port or
+# write a file, which only make sense from the caller's process and cwd
+LOCAL_ONLY = {
+    "daemon",
+    "prefetch",
+    "export",
+    "--init",
+    "--watch",
+    "--listen",
+    "--textfile",
+    "openmetrics",
+}
+# Seconds a call waits for the one running before it, after which the
+# daemon says it is busy and the client runs the call itself
+BUSY_TIMEOUT = 2.0
+
+
+def _terminal() -> dict:
+    """Describe the calling terminal so the daemon can render for it."""
+    try:
+        width = os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError):
+        width = None
+    env = {
+        name: os.environ[name]
+        for name in ("TERM", "COLORTERM", "NO_COLOR", "FORCE_COLOR", "COLUMNS")
+        if name in os.environ
+    }
+    return {"width": width, "tty": sys.stdout.isatty(), "env": env}
+
+
+def request(argv: list, path: Path = SOCKET_PATH, timeout: float = 60.0):
+    """Run a CLI call in the daemon and print its output.
+
+    Returns the exit code, or None when no daemon is reachable and the call
+    should run in-process instead.
+    """
+    local = any(
+        name in LOCAL_ONLY or value in LOCAL_ONLY
+        for name, _, value in (arg.partition("=") for arg in argv)
+    )
+    if local or not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            message = {"argv": argv, "terminal": _terminal()}
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        reply = json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+    if reply.get("busy") or reply.get("local"):
+        return None
+
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(reply.get("stderr", ""))
+    return reply.get("code", 0)
+
+
+def _color_system(terminal: dict):
+    env = terminal.get("env", {})
+    if "NO_COLOR" in env or not (terminal.get("tty") or "FORCE_COLOR" in env):
+        return None
+    if env.get("COLORTERM") in ("truecolor", "24bit"):
+        return "truecolor"
+    if "256color" in env.get("TERM", ""):
+        return "256"
+    return "standard"
+
+
+class Daemon:
+    """Keeps a warm WeatherCLI (config, theme, HTTP pool, caches) between calls."""
+
+    def __init__(self, path: Path = SOCKET_PATH) -> None:
+        self.path = Path(path)
+        self.app = None
+        self._signature = None
+        # Calls redirect sys.stdout and reconfigure rich's global console,
+        # so they run one at a time
+        self._lock = threading.Lock()
+
+    def _files_signature(self, app) -> tuple:
+        # The files views are drawn from: config, theme, user and bundled art
+        return app.config.display_signature
+
+    def _load_app(self):
+        """Build the CLI, rebuilding it when config or theme files change."""
+        if self.app is not None:
+            try:
+                if self._files_signature(self.app) == self._signature:
+                    return self.app
+            except (OSError, IndexError, AttributeError):
+                pass
+            self.app.weather.close()
+
+        from sunny.cli import WeatherCLI
+
+        app = WeatherCLI()
+        app.config.theme
+        self._signature = self._files_signature(app)
+        self.app = app
+        return app
+
+    def _runs_locally(self, app, argv: list) -> bool:
+        """Whether a call must run in the client, as parsed by the CLI itself."""
+        import io
+        from contextlib import redirect_stderr
+
+        # Usage errors are left to the real run, which reports them
+        try:
+            with redirect_stderr(io.StringIO()):
+                args, _ = app.setup_argument_parser().parse_known_args(argv)
+        except SystemExit:
+            return False
+        return (
+            args.command in LOCAL_ONLY
+            or args.format == "openmetrics"
+            or bool(args.listen or args.textfile or args.init or args.watch)
+        )
+
+    def handle(self, message: dict) -> dict:
+        """Run one CLI call and capture its output."""
+        import io
+        import rich
+        from contextlib import redirect_stdout, redirect_stderr
+
+        terminal = message.get("terminal", {})
+        force_terminal = terminal.get("tty") or "FORCE_COLOR" in terminal.get("env", {})
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = 0
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                app = self._load_app()
+                if self._runs_locally(app, message.get("argv", [])):
+                    return {"local": True}
+                rich.reconfigure(
+                    file=stdout,
+                    width=terminal.get("width"),
+                    force_terminal=force_terminal,
+                    color_system=_color_system(terminal),
+                )
+                app.console = rich.get_console()
+                app.weather.reset()
+                app.run(message.get("argv", []))
+            except SystemExit as e:
+                if isinstance(e.code, str):
+                    print(e.code, file=sys.stderr)
+                    code = 1
+                else:
+                    code = e.code or 0
+            except Exception as e:
+                print(f"Unexpected error: {str(e)}")
+                code = 1
+        return {"code": code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def _in_use(self) -> bool:
+        """Whether another daemon answers on the socket path."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(1)
+            try:
+                probe.connect(str(self.path))
+            except OSError:
+                return False
+        return True
+
+    def serve_forever(self) -> None:
+        self._load_app()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            if self._in_use():
+                sys.exit(f"Error: A sunny daemon is already listening on {self.path}")
+            self.path.unlink()
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            # Create the socket owner-only, with no window where others can connect
+            umask = os.umask(0o177)
+            try:
+                server.bind(str(self.path))
+            finally:
+                os.umask(umask)
+            server.listen(16)
+            print(f"sunny daemon listening on {self.path}")
+            try:
+                while True:
+                    conn, _ = server.accept()
+                    threading.Thread(
+                        target=self._serve_connection, args=(conn,), daemon=True
+                    ).start()
+            finally:
+                self.path.unlink(missing_ok=True)
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        with conn:
+            try:
+                conn.settimeout(5)
+                data = b""
+                while not data.endswith(b"\n"):
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+                message = json.loads(data)
+                if self._lock.acquire(timeout=BUSY_TIMEOUT):
+                    try:
+                        reply = self.handle(message)
+                    finally:
+                        self._lock.release()
+                else:
+                    reply = {"busy": True}
+                conn.sendall(json.dumps(reply).encode("utf-8"))
+            except (OSError, ValueError):
+                pass
+
+
+def serve(path: Path = SOCKET_PATH) -> None:
+    """Run the daemon in the foreground until interrupted."""
+    Daemon(path).serve_forever()
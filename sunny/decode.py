@@ -0,0 +1,191 @@
+import json
+from typing import NamedTuple
+
+# Prefer msgspec, which decodes straight into the typed structs below and
+# skips every field sunny does not use, then orjson, then the stdlib.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+
+    def loads(body: bytes):
+        try:
+            return msgspec.json.decode(body)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e))
+
+    BACKEND = "msgspec"
+else:
+    try:
+        import orjson
+
+        loads = orjson.loads
+        BACKEND = "orjson"
+    except ImportError:
+        loads = json.loads
+        BACKEND = "json"
+
+
+class CurrentWeather(NamedTuple):
+    """The fields of a /weather response that sunny displays."""
+
+    name: str
+    temp: float
+    feels_like: float
+    humidity: int
+    wind_speed: float
+    code: int
+    main: str
+    description: str
+    icon: str
+    lon: float
+    lat: float
+    country: str
+
+
+_decoders = None
+
+
+def _msgspec_decoders() -> tuple:
+    """Build typed msgspec decoders for /weather and /forecast on first use."""
+    global _decoders
+    if _decoders is None:
+        from typing import List
+
+        class Main(msgspec.Struct):
+            temp: float
+            feels_like: float
+            humidity: int
+
+        class Condition(msgspec.Struct):
+            id: int
+            main: str
+            description: str
+            icon: str
+
+        class Wind(msgspec.Struct):
+            speed: float
+
+        class Coord(msgspec.Struct):
+            lon: float
+            lat: float
+
+        class Sys(msgspec.Struct):
+            country: str = ""
+
+        class Current(msgspec.Struct):
+            main: Main
+            weather: List[Condition]
+            wind: Wind
+            coord: Coord
+            sys: Sys
+            name: str = ""
+
+        class EntryMain(msgspec.Struct):
+            temp: float = 0.0
+            feels_like: float = 0.0
+            humidity: int = 0
+
+        class EntryCondition(msgspec.Struct):
+            id: int = 0
+            main: str = ""
+            description: str = ""
+            icon: str = ""
+
+        class EntryWind(msgspec.Struct):
+            speed: float = 0.0
+
+        class Entry(msgspec.Struct):
+            dt: int = 0
+            main: EntryMain = msgspec.field(default_factory=EntryMain)
+            weather: List[EntryCondition] = msgspec.field(default_factory=list)
+            wind: EntryWind = msgspec.field(default_factory=EntryWind)
+
+        class City(msgspec.Struct):
+            timezone: int = 0
+
+        class Forecast(msgspec.Struct):
+            entries: List[Entry] = msgspec.field(name="list", default_factory=list)
+            city: City = msgspec.field(default_factory=City)
+
+        _decoders = (msgspec.json.Decoder(Current), msgspec.json.Decoder(Forecast))
+    return _decoders
+
+
+def current_weather(body: bytes) -> CurrentWeather:
+    """Decode a /weather response body. Raises ValueError on malformed data."""
+    if msgspec is not None:
+        try:
+            data = _msgspec_decoders()[0].decode(body)
+            main, condition = data.main, data.weather[0]
+            return CurrentWeather(
+                data.name,
+                main.temp,
+                main.feels_like,
+                main.humidity,
+                data.wind.speed,
+                condition.id,
+                condition.main,
+                condition.description,
+                condition.icon,
+                data.coord.lon,
+                data.coord.lat,
+                data.sys.country,
+            )
+        except (msgspec.DecodeError, IndexError) as e:
+            raise ValueError(f"Invalid weather data format - {e}")
+
+    try:
+        data = loads(body)
+        main, condition = data["main"], data["weather"][0]
+        return CurrentWeather(
+            data.get("name", ""),
+            main["temp"],
+            main["feels_like"],
+            main["humidity"],
+            data["wind"]["speed"],
+            condition["id"],
+            condition["main"],
+            condition["description"],
+            condition["icon"],
+            data["coord"]["lon"],
+            data["coord"]["lat"],
+            data["sys"].get("country", ""),
+        )
+    except (KeyError, IndexError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid weather data format - {e}")
+
+
+def forecast_series(body: bytes):
+    """Decode a /forecast response body into a ForecastSeries."""
+    from sunny.forecast import ForecastSeries
+
+    if msgspec is None:
+        try:
+            return ForecastSeries.from_response(loads(body))
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid forecast data format - {e}")
+
+    try:
+        data = _msgspec_decoders()[1].decode(body)
+    except msgspec.DecodeError as e:
+        raise ValueError(f"Invalid forecast data format - {e}")
+    rows = []
+    for entry in data.entries:
+        condition = entry.weather[0] if entry.weather else None
+        rows.append(
+            (
+                entry.dt,
+                entry.main.temp,
+                entry.main.feels_like,
+                entry.wind.speed,
+                entry.main.humidity,
+                condition.id if condition else 0,
+                condition.main if condition else "",
+                condition.description if condition else "",
+                condition.icon if condition else "",
+            )
+        )
+    return ForecastSeries.from_rows(rows, data.city.timezone)
@@ -0,0 +1,170 @@
+import os
+import sys
+import time
+import threading
+from pathlib import Path
+from typing import Optional
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Metric name suffix per unit system: temperature, wind speed
+UNIT_SUFFIXES = {
+    "metric": ("celsius", "meters_per_second"),
+    "imperial": ("fahrenheit", "miles_per_hour"),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+
+
+class Exporter:
+    """Current weather of many locations as OpenMetrics gauges.
+
+    Data comes from ``Weather.fetch_many``, so scrapes inside the cache TTL
+    are answered from the response cache without API calls. Fetch counts,
+    errors and latency are exported too, accumulated over the life of the
+    exporter.
+    """
+
+    def __init__(self, weather, locations: list, units: str = "metric") -> None:
+        self.weather = weather
+        self.locations = locations
+        self.units = units
+        self.fetches = {location: 0 for location in locations}
+        self.errors = {location: 0 for location in locations}
+        self.created = time.time()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _name(location: str) -> str:
+        return location.replace("%20", " ")
+
+    def collect(self) -> str:
+        """Fetch every location and render the metrics exposition."""
+        with self._lock:
+            self.weather.reset()
+            timings = {}
+            started = time.perf_counter()
+            results = self.weather.fetch_many(self.locations, self.units, timings)
+            duration = time.perf_counter() - started
+            for location, result in results.items():
+                self.fetches[location] += 1
+                if isinstance(result, Exception):
+                    self.errors[location] += 1
+            return self._render(results, timings, duration)
+
+    def _render(self, results: dict, timings: dict, duration: float) -> str:
+        temp_unit, wind_unit = UNIT_SUFFIXES.get(self.units, UNIT_SUFFIXES["metric"])
+        gauges = [
+            (f"sunny_temperature_{temp_unit}", temp_unit, "Air temperature", "temp"),
+            (f"sunny_feels_like_{temp_unit}", temp_unit, "Apparent temperature", "feels_like"),
+            ("sunny_humidity_percent", "percent", "Relative humidity", "humidity"),
+            (f"sunny_wind_speed_{wind_unit}", wind_unit, "Wind speed", "wind_speed"),
+            ("sunny_condition_code", None, "OpenWeather condition id", "code"),
+        ]
+        ok = {
+            location: record
+            for location, record in results.items()
+            if not isinstance(record, Exception)
+        }
+
+        lines = []
+        for name, unit, help_text, field in gauges:
+            lines.append(f"# TYPE {name} gauge")
+            if unit:
+                lines.append(f"# UNIT {name} {unit}")
+            lines.append(f"# HELP {name} {help_text}.")
+            for location, record in ok.items():
+                labels = {"location": self._name(location)}
+                if field == "code":
+                    labels["condition"] = record.main
+                lines.append(f"{name}{{{_labels(**labels)}}} {getattr(record, field)}")
+
+        lines += [
+            "# TYPE sunny_up gauge",
+            "# HELP sunny_up Whether the last fetch of a location succeeded.",
+        ]
+        for location, record in results.items():
+            up = 0 if isinstance(record, Exception) else 1
+            lines.append(f"sunny_up{{{_labels(location=self._name(location))}}} {up}")
+
+        lines += [
+            "# TYPE sunny_fetch_duration_seconds gauge",
+            "# UNIT sunny_fetch_duration_seconds seconds",
+            "# HELP sunny_fetch_duration_seconds Time the last fetch of a location took, cache hits included.",
+        ]
+        for location in results:
+            labels = _labels(location=self._name(location))
+            lines.append(f"sunny_fetch_duration_seconds{{{labels}}} {timings[location]:.6f}")
+
+        for name, counts, help_text in (
+            ("sunny_fetches", self.fetches, "Fetches of a location since the exporter started."),
+            ("sunny_fetch_errors", self.errors, "Failed fetches of a location since the exporter started."),
+        ):
+            lines += [f"# TYPE {name} counter", f"# HELP {name} {help_text}"]
+            for location, count in counts.items():
+                labels = _labels(location=self._name(location))
+                lines.append(f"{name}_total{{{labels}}} {count}")
+                lines.append(f"{name}_created{{{labels}}} {self.created:.3f}")
+
+        lines += [
+            "# TYPE sunny_scrape_duration_seconds gauge",
+            "# UNIT sunny_scrape_duration_seconds seconds",
+            "# HELP sunny_scrape_duration_seconds Time taken to fetch every location.",
+            f"sunny_scrape_duration_seconds {duration:.6f}",
+            "# EOF",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Write the metrics atomically, for node_exporter's textfile collector."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.collect())
+        os.replace(tmp, path)
+
+    def serve(self, address: str) -> None:
+        """Serve the metrics at http://ADDRESS/metrics until interrupted."""
+        from http.server import HTTPServer, BaseHTTPRequestHandler
+
+        host, _, port = address.rpartition(":")
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.collect().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = HTTPServer((host or "127.0.0.1", int(port)), Handler)
+        host, port = server.server_address[:2]
+        print(f"Serving metrics at http://{host}:{port}/metrics", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+def parse_listen(value: str) -> Optional[str]:
+    """Accept PORT or HOST:PORT, returning HOST:PORT."""
+    if not value:
+        return None
+    return value if ":" in value else f"127.0.0.1:{value}"
@@ -0,0 +1,258 @@
+import sys
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+
+STRATEGIES = ("daily", "noon", "sample")
+
+SECONDS_PER_DAY = 86400
+
+# Column name -> array typecode. Text fields are stored as indexes into a
+# shared table of interned strings so every column is a flat typed array.
+COLUMNS = {
+    "dt": "q",
+    "temp": "d",
+    "feels_like": "d",
+    "wind_speed": "d",
+    "humidity": "b",
+    "code": "H",
+    "main": "H",
+    "description": "H",
+    "icon": "H",
+}
+TEXT_COLUMNS = ("main", "description", "icon")
+
+
+class ForecastSeries:
+    """Forecast entries held as typed columns instead of one dict per entry.
+
+    Slicing, ``days()`` and ``at_hour()`` return views that share the
+    underlying arrays; column accessors return memoryviews, so no entry data
+    is copied until a value is read.
+    """
+
+    __slots__ = ("_columns", "_views", "strings", "offset", "_index")
+
+    def __init__(
+        self, columns: dict, strings: tuple, offset: int, index: range = None
+    ) -> None:
+        self._columns = columns
+        self._views = {name: memoryview(col) for name, col in columns.items()}
+        self.strings = strings
+        self.offset = offset
+        self._index = index if index is not None else range(len(columns["dt"]))
+
+    @classmethod
+    def from_response(cls, data: dict) -> "ForecastSeries":
+        """Build a series from a decoded /forecast response."""
+        entries = data.get("list", [])
+        mains = [entry.get("main", {}) for entry in entries]
+        weather = [(entry.get("weather") or [{}])[0] for entry in entries]
+        strings = {}
+        setdefault = strings.setdefault
+        intern = sys.intern
+
+        def indexes(key):
+            return [
+                setdefault(intern(w.get(key) or ""), len(strings)) for w in weather
+            ]
+
+        columns = {
+            "dt": array("q", [entry.get("dt", 0) for entry in entries]),
+            "temp": array("d", [m.get("temp") or 0.0 for m in mains]),
+            "feels_like": array("d", [m.get("feels_like") or 0.0 for m in mains]),
+            "wind_speed": array(
+                "d", [entry.get("wind", {}).get("speed") or 0.0 for entry in entries]
+            ),
+            "humidity": array("b", [m.get("humidity") or 0 for m in mains]),
+            "code": array("H", [w.get("id") or 0 for w in weather]),
+            "main": array("H", indexes("main")),
+            "description": array("H", indexes("description")),
+            "icon": array("H", indexes("icon")),
+        }
+
+        offset = int(data.get("city", {}).get("timezone") or 0)
+        return cls(columns, tuple(strings), offset)
+
+    @classmethod
+    def from_rows(cls, rows: list, offset: int = 0) -> "ForecastSeries":
+        """Build a series from tuples holding one value per column, in COLUMNS order."""
+        values = list(zip(*rows)) or [()] * len(COLUMNS)
+        strings = {}
+        columns = {}
+        for (name, code), column in zip(COLUMNS.items(), values):
+            if name in TEXT_COLUMNS:
+                column = [
+                    strings.setdefault(sys.intern(value), len(strings))
+                    for value in column
+                ]
+            columns[name] = array(code, column)
+        return cls(columns, tuple(strings), int(offset))
+
+    def _view(self, index: range) -> "ForecastSeries":
+        view = ForecastSeries.__new__(ForecastSeries)
+        view._columns = self._columns
+        view._views = self._views
+        view.strings = self.strings
+        view.offset = self.offset
+        view._index = index
+        return view
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._view(self._index[item])
+        return self.record(item)
+
+    def column(self, name: str) -> memoryview:
+        """Get a zero-copy view of one column for the entries in this series."""
+        index = self._index
+        return self._views[name][index.start : index.stop : index.step]
+
+    def text(self, name: str, position: int) -> str:
+        return self.strings[self.column(name)[position]]
+
+    def record(self, position: int) -> dict:
+        """Get one entry as a dict."""
+        return {
+            "dt": self.column("dt")[position],
+            "temp": self.column("temp")[position],
+            "feels_like_temp": self.column("feels_like")[position],
+            "humidity": self.column("humidity")[position],
+            "wind_speed": self.column("wind_speed")[position],
+            "id": self.column("code")[position],
+            "main": self.text("main", position),
+            "description": self.text("description", position),
+            "icon": self.text("icon", position),
+        }
+
+    def local_day(self, position: int) -> int:
+        return (self.column("dt")[position] + self.offset) // SECONDS_PER_DAY
+
+    def local_seconds(self, position: int) -> int:
+        """Seconds since local midnight of an entry."""
+        return (self.column("dt")[position] + self.offset) % SECONDS_PER_DAY
+
+    def days(self) -> list:
+        """Split the series into one view per local calendar day."""
+        views = []
+        start = 0
+        for i in range(1, len(self) + 1):
+            if i == len(self) or self.local_day(i) != self.local_day(start):
+                views.append(self[start:i])
+                start = i
+        return views
+
+    def at_hour(self, hour: int) -> "ForecastSeries":
+        """Get the entries at a local hour, e.g. every 12:00.
+
+        Evenly spaced matches (the API's 3-hour steps) come back as a strided
+        view; gaps, repeated or unsorted timestamps give a copy.
+        """
+        offset = self.offset
+        matches = [
+            i
+            for i, dt in enumerate(self.column("dt"))
+            if (dt + offset) % SECONDS_PER_DAY // 3600 == hour
+        ]
+        if len(matches) < 2:
+            return self[matches[0] : matches[0] + 1] if matches else self[0:0]
+        strided = range(matches[0], matches[-1] + 1, matches[1] - matches[0])
+        if list(strided) != matches:
+            return self._take(matches)
+        return self[strided.start : strided.stop : strided.step]
+
+    def _take(self, positions: list) -> "ForecastSeries":
+        """Copy the entries at some positions into a new series."""
+        rows = [
+            tuple(
+                self.text(name, i) if name in TEXT_COLUMNS else self.column(name)[i]
+                for name in COLUMNS
+            )
+            for i in positions
+        ]
+        return ForecastSeries.from_rows(rows, self.offset)
+
+    def to_numpy(self) -> dict:
+        """Get the numeric columns as NumPy arrays sharing this series' memory."""
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("NumPy is required for ForecastSeries.to_numpy()")
+        return {
+            name: np.asarray(self.column(name))
+            for name in COLUMNS
+            if name not in TEXT_COLUMNS
+        }
+
+
+def _summary(series: ForecastSeries, dt: int) -> dict:
+    """Summarise every entry of a series as one forecast record."""
+    temps = series.column("temp")
+    humidity = series.column("humidity")
+    mains = series.column("main")
+
+    dominant = Counter(mains).most_common(1)[0][0]
+    matching = [i for i, main in enumerate(mains) if main == dominant]
+    strings = series.strings
+    # Prefer daytime icons so the art matches how the day looks
+    icons = Counter(series.column("icon")[i] for i in matching)
+    icon = max(icons, key=lambda code: (icons[code], strings[code].endswith("d")))
+    description = Counter(series.column("description")[i] for i in matching)
+
+    return {
+        "dt": dt,
+        "offset": series.offset,
+        "samples": len(series),
+        "temp": sum(temps) / len(temps),
+        "temp_min": min(temps),
+        "temp_max": max(temps),
+        "feels_like_temp": sum(series.column("feels_like")) / len(series),
+        "humidity": round(sum(humidity) / len(humidity)),
+        "wind_speed": max(series.column("wind_speed")),
+        "main": strings[dominant],
+        "description": strings[description.most_common(1)[0][0]],
+        "id": series.column("code")[matching[0]],
+        "icon": strings[icon],
+    }
+
+
+def local_datetime(record: dict) -> datetime:
+    """Get the local wall-clock time of a forecast record."""
+    return datetime.fromtimestamp(record["dt"] + record.get("offset", 0), timezone.utc)
+
+
+def aggregate(series: ForecastSeries, strategy: str = "daily", days: int = 5) -> list:
+    """Turn a forecast series into one record per local calendar day.
+
+    ``daily`` summarises every 3-hour entry of a day (mean temperature and
+    humidity, min/max temperature, max wind, dominant condition). ``noon``
+    picks the entry closest to local midday and ``sample`` keeps the old
+    behaviour of taking every fifth entry.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(
+            f"Unknown forecast strategy '{strategy}'. Use one of: {', '.join(STRATEGIES)}"
+        )
+    if not len(series):
+        return []
+
+    if strategy == "sample":
+        sampled = series[::5][:days]
+        return [
+            _summary(sampled[i : i + 1], sampled.column("dt")[i])
+            for i in range(len(sampled))
+        ]
+
+    records = []
+    for day in series.days()[:days]:
+        if strategy == "daily":
+            records.append(_summary(day, day.column("dt")[0]))
+        else:
+            noon = min(
+                range(len(day)), key=lambda i: abs(day.local_seconds(i) - 43200)
+            )
+            records.append(_summary(day[noon : noon + 1], day.column("dt")[noon]))
+    return records
@@ -0,0 +1,129 @@
+import os
+import json
+import threading
+from pathlib import Path
+from urllib.parse import unquote
+from typing import NamedTuple, Optional
+from platformdirs import user_cache_dir
+
+# ISO 3166-1 alpha-2 country codes, plus XK (Kosovo) as OpenWeather uses it
+COUNTRY_CODES = frozenset(
+    """
+    AD AE AF AG AI AL AM AO AQ AR AS AT AU AW AX AZ BA BB BD BE BF BG BH BI BJ BL
+    BM BN BO BQ BR BS BT BV BW BY BZ CA CC CD CF CG CH CI CK CL CM CN CO CR CU CV
+    CW CX CY CZ DE DJ DK DM DO DZ EC EE EG EH ER ES ET FI FJ FK FM FO FR GA GB GD
+    GE GF GG GH GI GL GM GN GP GQ GR GS GT GU GW GY HK HM HN HR HT HU ID IE IL IM
+    IN IO IQ IR IS IT JE JM JO JP KE KG KH KI KM KN KP KR KW KY KZ LA LB LC LI LK
+    LR LS LT LU LV LY MA MC MD ME MF MG MH MK ML MM MN MO MP MQ MR MS MT MU MV MW
+    MX MY MZ NA NC NE NF NG NI NL NO NP NR NU NZ OM PA PE PF PG PH PK PL PM PN PR
+    PS PT PW PY QA RE RO RS RU RW SA SB SC SD SE SG SH SI SJ SK SL SM SN SO SR SS
+    ST SV SX SY SZ TC TD TF TG TH TJ TK TL TM TN TO TR TT TV TW TZ UA UG UM US UY
+    UZ VA VC VE VG VI VN VU WF WS XK YE YT ZA ZM ZW
+    """.split()
+)
+
+
+def normalize(location: str) -> str:
+    """Normalise a city query so spelling variants map to one alias.
+
+    ``New_York``, ``new%20york`` and ``New York `` all become ``new york``;
+    ``Delhi, IN`` becomes ``delhi,in``.
+    """
+    text = unquote(location).replace("_", " ").casefold()
+    return ",".join(" ".join(part.split()) for part in text.split(","))
+
+
+class Place(NamedTuple):
+    lat: float
+    lon: float
+    country: str
+    id: int
+    name: str
+
+    @property
+    def params(self) -> dict:
+        """Query parameters that select this place without name resolution."""
+        if self.id:
+            return {"id": self.id}
+        return {"lat": self.lat, "lon": self.lon}
+
+    @property
+    def key(self) -> str:
+        """Location part of the response cache key, shared by every alias."""
+        if self.id:
+            return f"id:{self.id}"
+        return f"{self.lat:.4f},{self.lon:.4f}"
+
+
+def place_from_response(endpoint: str, data: dict) -> Optional[Place]:
+    """Read the resolved place out of a decoded /weather or /forecast response."""
+    try:
+        if endpoint == "forecast":
+            city = data["city"]
+            country = city.get("country", "")
+        else:
+            city = data
+            country = data.get("sys", {}).get("country", "")
+        coord = city["coord"]
+        return Place(
+            float(coord["lat"]),
+            float(coord["lon"]),
+            country or "",
+            int(city.get("id") or 0),
+            city.get("name") or "",
+        )
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+class GeocodeIndex:
+    """Persistent map of normalised city names to resolved places.
+
+    Stored as JSON in the cache directory and shared by every sunny process.
+    Entries are added from the ``coord`` and ``id`` of the first response
+    for a name, so later lookups skip server-side name resolution.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        self.INDEX_FILE = Path(cache_dir or user_cache_dir("sunny")) / "geocode.json"
+        self._places = None
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.INDEX_FILE, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            return {alias: Place(*values) for alias, values in raw.items()}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    @property
+    def places(self) -> dict:
+        if self._places is None:
+            self._places = self._read()
+        return self._places
+
+    def get(self, location: str) -> Optional[Place]:
+        return self.places.get(normalize(location))
+
+    def add(self, location: str, place: Place) -> None:
+        """Remember a place under the queried name and its ``name,country`` form."""
+        aliases = {normalize(location)}
+        if place.name and place.country:
+            aliases.add(normalize(f"{place.name},{place.country}"))
+
+        with self._lock:
+            # Merge with entries other processes may have written meanwhile
+            places = self._read()
+            places.update(self.places)
+            for alias in aliases:
+                places[alias] = place
+            self._places = places
+            try:
+                self.INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.INDEX_FILE.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump({alias: list(p) for alias, p in places.items()}, f)
+                os.replace(tmp, self.INDEX_FILE)
+            except OSError:
+                pass
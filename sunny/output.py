@@ -0,0 +1,178 @@
+"""Machine-readable output of weather records, without rich.
+
+Records are plain dicts with a fixed set of keys, written as JSON, NDJSON
+(one object per line), CSV or uncoloured text. Nothing here imports rich, so
+scripted calls skip building consoles and panels and their output never
+contains markup or escape codes.
+"""
+
+import sys
+import json
+from typing import Iterable
+
+FORMATS = ("json", "ndjson", "csv", "plain")
+
+CURRENT_FIELDS = (
+    "location",
+    "name",
+    "country",
+    "lat",
+    "lon",
+    "units",
+    "temp",
+    "feels_like",
+    "humidity",
+    "wind_speed",
+    "code",
+    "main",
+    "description",
+    "icon",
+)
+
+FORECAST_FIELDS = (
+    "location",
+    "date",
+    "dt",
+    "units",
+    "samples",
+    "temp",
+    "temp_min",
+    "temp_max",
+    "feels_like",
+    "humidity",
+    "wind_speed",
+    "code",
+    "main",
+    "description",
+    "icon",
+)
+
+UNIT_SYMBOLS = {"metric": ("°C", "m/s"), "imperial": ("°F", "mi/h")}
+
+
+def location_name(location: str) -> str:
+    return location.replace("%20", " ")
+
+
+def current_record(location: str, weather, units: str) -> dict:
+    """Turn a CurrentWeather, or the error raised for it, into a record."""
+    if isinstance(weather, Exception):
+        error = str(weather).removeprefix("Error: ")
+        return {"location": location_name(location), "error": error}
+    return {
+        "location": location_name(location),
+        "name": weather.name,
+        "country": weather.country,
+        "lat": weather.lat,
+        "lon": weather.lon,
+        "units": units,
+        "temp": weather.temp,
+        "feels_like": weather.feels_like,
+        "humidity": weather.humidity,
+        "wind_speed": weather.wind_speed,
+        "code": weather.code,
+        "main": weather.main,
+        "description": weather.description,
+        "icon": weather.icon,
+    }
+
+
+def forecast_records(location: str, days: list, units: str) -> list:
+    """Turn the per-day forecast summaries into records."""
+    from sunny.forecast import local_datetime
+
+    return [
+        {
+            "location": location_name(location),
+            "date": local_datetime(day).date().isoformat(),
+            "dt": day["dt"],
+            "units": units,
+            "samples": day.get("samples", 1),
+            "temp": day["temp"],
+            "temp_min": day.get("temp_min", day["temp"]),
+            "temp_max": day.get("temp_max", day["temp"]),
+            "feels_like": day["feels_like_temp"],
+            "humidity": day["humidity"],
+            "wind_speed": day["wind_speed"],
+            "code": day["id"],
+            "main": day["main"],
+            "description": day["description"],
+            "icon": day["icon"],
+        }
+        for day in days
+    ]
+
+
+def plain_line(record: dict) -> str:
+    """One uncoloured line describing a record."""
+    label = record.get("date") or record["location"]
+    if "error" in record:
+        return f"{label}: error: {record['error']}"
+    deg, wind = UNIT_SYMBOLS.get(record.get("units"), UNIT_SYMBOLS["metric"])
+    parts = []
+    if "temp" in record:
+        temp = f"{record['temp']:.1f}{deg}"
+        if "feels_like" in record:
+            temp += f" (feels {record['feels_like']:.1f}{deg})"
+        parts.append(temp)
+    if "description" in record:
+        parts.append(record["description"])
+    if "humidity" in record:
+        parts.append(f"humidity {record['humidity']}%")
+    if "wind_speed" in record:
+        parts.append(f"wind {record['wind_speed']} {wind}")
+    return f"{label}: {', '.join(parts)}"
+
+
+class Writer:
+    """Writes records to a stream in one of ``FORMATS``.
+
+    ``fields`` limits and orders the keys of every record. NDJSON, CSV and
+    plain records are written (and flushed) as they arrive; JSON collects
+    them and writes one document in ``close``: an array when ``many``,
+    otherwise the single record as an object.
+    """
+
+    def __init__(
+        self, fmt: str, fields: Iterable[str], many: bool = False, stream=None
+    ) -> None:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown output format '{fmt}'. Use one of: {', '.join(FORMATS)}")
+        self.format = fmt
+        self.fields = tuple(fields)
+        self.stream = stream if stream is not None else sys.stdout
+        self._records = []
+        self.many = many
+        self._csv = None
+
+    def _select(self, record: dict) -> dict:
+        selected = {key: record[key] for key in self.fields if key in record}
+        if "error" in record:
+            selected["error"] = record["error"]
+        return selected
+
+    def write(self, record: dict) -> None:
+        record = self._select(record)
+        if self.format == "json":
+            self._records.append(record)
+            return
+        if self.format == "ndjson":
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        elif self.format == "csv":
+            if self._csv is None:
+                import csv
+
+                self._csv = csv.DictWriter(
+                    self.stream, fieldnames=[*self.fields, "error"], lineterminator="\n"
+                )
+                self._csv.writeheader()
+            self._csv.writerow(record)
+        else:
+            self.stream.write(plain_line(record) + "\n")
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self.format == "json":
+            document = self._records if self.many else self._records[0]
+            self.stream.write(json.dumps(document, ensure_ascii=False, indent=2) + "\n")
+            self.stream.flush()
@@ -0,0 +1,240 @@
+"""Backends that answer sunny's weather queries.
+
+A provider returns the body of a current weather or forecast query in the
+OpenWeather 2.5 schema, which ``sunny.decode`` turns into sunny's records, so
+the response cache, the geocode index and the decoders work the same whatever
+answered. A backend with another API converts its payload to that schema in
+``fetch``.
+
+``OpenWeatherProvider`` queries the API at ``[network] base_url``,
+``StubProvider`` serves recorded payloads from a directory for tests and
+benchmarks, and ``HedgedProvider`` races a backup against a slow primary.
+"""
+
+import sys
+import time
+import queue
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import unquote
+
+from sunny import trace
+
+PROVIDERS = ("openweather", "stub")
+
+
+class ProviderError(Exception):
+    """A provider could not answer. ``status`` is the HTTP status, if any."""
+
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class Provider:
+    """Answers /weather and /forecast queries for a location."""
+
+    name = ""
+
+    def fetch(self, endpoint: str, location: str, units: str, place=None) -> bytes:
+        """Get the response body of an endpoint. Raises ProviderError.
+
+        ``place`` is the resolved ``geocode.Place`` of the location, if known.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class OpenWeatherProvider(Provider):
+    """The OpenWeather API, or a mirror of it, over a pooled HTTP session."""
+
+    name = "openweather"
+
+    def __init__(self, settings: dict, api_key: str) -> None:
+        from sunny.transport import Transport
+
+        self.transport = Transport(settings)
+        self.api_key = api_key
+
+    def fetch(self, endpoint: str, location: str, units: str, place=None) -> bytes:
+        import requests
+
+        params = {
+            **(place.params if place else {"q": unquote(location)}),
+            "units": units,
+            "appid": self.api_key,
+        }
+        try:
+            with trace.span(
+                "http.get", endpoint=endpoint, location=unquote(location)
+            ) as span:
+                response = self.transport.get(f"data/2.5/{endpoint}", params)
+                span.set(
+                    status=response.status_code,
+                    ttfb_ms=round(response.elapsed.total_seconds() * 1000, 2),
+                    bytes=len(response.content),
+                )
+        except requests.exceptions.RequestException as e:
+            raise ProviderError(str(e))
+        if response.status_code >= 400:
+            raise ProviderError(f"HTTP error {response.status_code}", response.status_code)
+        return response.content
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class StubProvider(Provider):
+    """Serves ``weather.json`` and ``forecast.json`` from a directory for any location.
+
+    ``delay`` seconds pass before each answer, and with ``status`` set every
+    query fails with that HTTP status instead, to stand in for a slow or
+    failing API.
+    """
+
+    name = "stub"
+
+    def __init__(self, directory, delay: float = 0.0, status: Optional[int] = None) -> None:
+        self.directory = Path(directory)
+        self.delay = delay
+        self.status = status
+
+    def fetch(self, endpoint: str, location: str, units: str, place=None) -> bytes:
+        with trace.span("stub.get", endpoint=endpoint, location=unquote(location)):
+            if self.delay:
+                time.sleep(self.delay)
+            if self.status is not None:
+                raise ProviderError(f"HTTP error {self.status}", self.status)
+            try:
+                return (self.directory / f"{endpoint}.json").read_bytes()
+            except OSError:
+                raise ProviderError(f"No {endpoint}.json in {self.directory}", 404)
+
+
+class HedgedProvider(Provider):
+    """Asks a backup provider too when the primary is slow, and takes the first valid answer.
+
+    The backup is only asked once the primary has taken ``delay`` seconds,
+    or has failed, and only if ``allow()`` agrees (the rate limiter's say).
+    Answers that do not decode count as failures. When both fail, the
+    primary's error is raised. The loser is left to finish in a daemon
+    thread, so it never holds up the caller.
+    """
+
+    def __init__(
+        self,
+        primary: Provider,
+        backup: Provider,
+        delay: float,
+        allow: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self.primary = primary
+        self.backup = backup
+        self.delay = delay
+        self.allow = allow
+        self.name = f"{primary.name}+{backup.name}"
+
+    def _ask(self, provider: Provider, answers: queue.Queue, *query) -> None:
+        from sunny import decode
+
+        decoders = {"weather": decode.current_weather, "forecast": decode.forecast_series}
+        # Every outcome is put on the queue, or fetch would wait for it forever
+        try:
+            body = provider.fetch(*query)
+            decoders[query[0]](body)
+        except ValueError as e:
+            error = ProviderError(f"Invalid response from {provider.name} - {e}")
+            answers.put((provider, None, error))
+        except Exception as e:
+            answers.put((provider, None, e))
+        else:
+            answers.put((provider, body, None))
+
+    def _role(self, provider: Provider) -> str:
+        return "primary" if provider is self.primary else "backup"
+
+    def _start(self, provider: Provider, answers: queue.Queue, query: tuple) -> None:
+        threading.Thread(
+            target=self._ask,
+            args=(provider, answers, *query),
+            name=f"hedge-{self._role(provider)}",
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _final(error: Exception) -> bool:
+        """Whether an error is the API's answer (unknown city, bad key) rather than a failure."""
+        status = getattr(error, "status", None)
+        return status is not None and 400 <= status < 500 and status != 429
+
+    def fetch(self, endpoint: str, location: str, units: str, place=None) -> bytes:
+        query = (endpoint, location, units, place)
+        answers = queue.Queue()
+        with trace.span("hedge", endpoint=endpoint) as span:
+            self._start(self.primary, answers, query)
+            try:
+                first = answers.get(timeout=self.delay)
+            except queue.Empty:
+                first = None
+
+            if first is not None and (first[2] is None or self._final(first[2])):
+                # The primary answered in time
+                hedge = False
+            else:
+                hedge = self.allow is None or self.allow()
+            span.set(hedged=hedge)
+            if not hedge:
+                provider, body, error = first or answers.get()
+                if error is not None:
+                    raise error
+                span.set(winner=self._role(provider))
+                return body
+
+            self._start(self.backup, answers, query)
+            errors = {}
+            if first is not None:
+                errors[self.primary] = first[2]
+            while len(errors) < 2:
+                provider, body, error = answers.get()
+                if error is None:
+                    span.set(winner=self._role(provider))
+                    return body
+                if provider is self.primary and self._final(error):
+                    raise error
+                errors[provider] = error
+            raise errors[self.primary]
+
+    def close(self) -> None:
+        self.primary.close()
+        self.backup.close()
+
+
+def create(name: str, config, base_url: str = "") -> Provider:
+    """Build a provider by name from the config."""
+    if name == "openweather":
+        settings = dict(config.network_settings)
+        if base_url:
+            settings["base_url"] = base_url
+        return OpenWeatherProvider(settings, config.get_api_key)
+    if name == "stub":
+        fixtures = config.provider_settings["fixtures"]
+        if not fixtures:
+            sys.exit("Error: The stub provider needs [provider] fixtures set to a directory.")
+        return StubProvider(fixtures)
+    sys.exit(f"Error: Unknown weather provider '{name}'. Use one of: {', '.join(PROVIDERS)}")
+
+
+def from_config(config, allow: Optional[Callable[[], bool]] = None) -> Provider:
+    """Build the provider set up in [provider], hedged when a backup is configured."""
+    settings = config.provider_settings
+    provider = create(settings["name"], config)
+    delay = float(settings["hedge_after"])
+    if settings["backup"] and delay > 0:
+        backup = create(settings["backup"], config, settings["backup_url"])
+        # Only a second OpenWeather request spends API budget
+        allow = allow if backup.name == "openweather" else None
+        provider = HedgedProvider(provider, backup, delay, allow)
+    return provider
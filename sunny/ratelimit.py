@@ -0,0 +1,105 @@
+import os
+import time
+import struct
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional
+from platformdirs import user_cache_dir
+
+try:
+    import fcntl
+except ImportError:  # Windows: the bucket is only shared between threads
+    fcntl = None
+
+# tokens left, time of the last refill
+STATE = struct.Struct("<dd")
+
+
+class RateLimited(Exception):
+    """Raised when a request would have to wait longer than allowed for a token"""
+
+    def __init__(self, wait: float) -> None:
+        super().__init__(f"next request allowed in {wait:.0f}s")
+        self.wait = wait
+
+
+class TokenBucket:
+    """Token bucket shared by every sunny process using the same API key.
+
+    The bucket state lives in a 16-byte file under the cache directory and
+    is updated under an exclusive ``flock``, so prompts, status lines, cron
+    jobs and the daemon draw from one budget. Tokens refill continuously at
+    ``calls_per_minute`` up to ``burst``.
+    """
+
+    _thread_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_key: str,
+        calls_per_minute: float = 60,
+        burst: float = 20,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        digest = hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:16]
+        self.STATE_FILE = (
+            Path(cache_dir or user_cache_dir("sunny")) / "ratelimit" / f"{digest}.bucket"
+        )
+        self.rate = float(calls_per_minute) / 60
+        self.burst = float(burst)
+
+    def _update(self, take: float, drain: bool = False) -> tuple:
+        """Refill the bucket and take ``take`` tokens if that many are available.
+
+        Returns (taken, tokens left afterwards).
+        """
+        self.STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with self._thread_lock:
+            fd = os.open(self.STATE_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.read(fd, STATE.size)
+                now = time.time()
+                if len(raw) == STATE.size:
+                    tokens, updated = STATE.unpack(raw)
+                    # A clock that went backwards must not mint extra tokens
+                    elapsed = max(0.0, now - updated)
+                    tokens = min(self.burst, tokens + elapsed * self.rate)
+                else:
+                    tokens = self.burst
+                taken = tokens >= take
+                if taken:
+                    tokens -= take
+                if drain:
+                    tokens = 0.0
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, STATE.pack(tokens, now))
+                return taken, tokens
+            finally:
+                os.close(fd)
+
+    def acquire(self, max_wait: float = 10.0) -> float:
+        """Take one token, waiting up to ``max_wait`` seconds for it.
+
+        Returns the tokens left. Raises RateLimited when the wait would be
+        longer than ``max_wait``.
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            taken, tokens = self._update(1)
+            if taken:
+                return tokens
+            wait = (1 - tokens) / self.rate if self.rate > 0 else float("inf")
+            if time.monotonic() + wait > deadline:
+                raise RateLimited(wait)
+            time.sleep(wait)
+
+    def remaining(self) -> float:
+        """Tokens available right now, without taking any."""
+        return self._update(float("inf"))[1]
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the API answered 429."""
+        self._update(float("inf"), drain=True)
@@ -0,0 +1,388 @@
+"""Renderers drawing sunny's views.
+
+``RichRenderer`` builds rich renderables and prints them with a rich
+``Console``. ``sunny.ansi.AnsiRenderer`` draws the same layouts directly as
+ANSI escape sequences, and is picked with ``[display] renderer = "ansi"`` or
+``--renderer ansi``.
+"""
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sunny.decode import CurrentWeather
+
+RENDERERS = ("rich", "ansi")
+# Colour systems by the last part of $TERM, as rich picks them
+TERM_COLORS = {"kitty": "256", "256color": "256", "16color": "standard"}
+
+
+def detect_terminal(file=None) -> dict:
+    """Width, colour system and encoding rich would pick for ``file`` (stdout).
+
+    Done without importing rich, so it is cheap enough to key caches on.
+    """
+    environ = os.environ
+    stream = file or sys.stdout
+    tty_compatible = environ.get("TTY_COMPATIBLE", "")
+    if tty_compatible in ("0", "1"):
+        is_terminal = tty_compatible == "1"
+    elif environ.get("FORCE_COLOR") is not None:
+        is_terminal = environ["FORCE_COLOR"] != ""
+    else:
+        try:
+            is_terminal = stream.isatty()
+        except (AttributeError, ValueError):
+            is_terminal = False
+    dumb = is_terminal and environ.get("TERM", "").lower() in ("dumb", "unknown")
+
+    color_system = None
+    if is_terminal and not dumb:
+        if environ.get("COLORTERM", "").strip().lower() in ("truecolor", "24bit"):
+            color_system = "truecolor"
+        else:
+            term = environ.get("TERM", "").strip().lower()
+            color_system = TERM_COLORS.get(term.rpartition("-")[2], "standard")
+
+    width = None
+    columns = environ.get("COLUMNS")
+    if columns is not None and columns.isdigit():
+        width = int(columns)
+    elif dumb:
+        width = 80
+    else:
+        for fd in (0, 1, 2):
+            try:
+                width = os.get_terminal_size(fd).columns
+                break
+            except (AttributeError, ValueError, OSError):
+                pass
+
+    return {
+        "width": width or 80,
+        "color_system": color_system,
+        "no_color": environ.get("NO_COLOR", "") != "",
+        "encoding": (getattr(stream, "encoding", "utf-8") or "utf-8").lower(),
+    }
+
+
+class Renderer:
+    """Builds views of weather data and prints them.
+
+    The view methods return an object only ``print`` of the same renderer
+    needs to understand.
+    """
+
+    name = ""
+
+    def ascii_art(self, weather_data: "CurrentWeather"):
+        """Build the art of the current weather condition."""
+        raise NotImplementedError
+
+    def full_weather(
+        self,
+        weather_data: "CurrentWeather",
+        location: str,
+        deg_symbol: str,
+        wind_unit: str,
+    ):
+        """Build the ASCII art and weather panels for one location."""
+        raise NotImplementedError
+
+    def multi_city(
+        self, locations: list, results: dict, deg_symbol: str, wind_unit: str
+    ):
+        """Build one card per city from the results of ``Weather.fetch_many``."""
+        raise NotImplementedError
+
+    def forecast(self, weather_data: list, deg_symbol: str, wind_unit: str):
+        """Build one card per forecast day."""
+        raise NotImplementedError
+
+    def theme_preview(self, name: str, theme: dict):
+        """Build the sample panel ``--themes`` shows for a theme."""
+        raise NotImplementedError
+
+    def print(self, view) -> None:
+        """Write a view, or a plain string, followed by a newline."""
+        raise NotImplementedError
+
+    def renderable(self, view):
+        """Turn a view into something a rich ``Live`` display can draw."""
+        raise NotImplementedError
+
+    def capture(self, view) -> str:
+        """Get the text ``print`` would write for a view."""
+        raise NotImplementedError
+
+
+class RichRenderer(Renderer):
+    """Renderer building rich panels and columns."""
+
+    name = "rich"
+
+    def __init__(self, config, console) -> None:
+        self.config = config
+        self.console = console
+
+    def print(self, view) -> None:
+        self.console.print(view)
+
+    def renderable(self, view):
+        return view
+
+    def capture(self, view) -> str:
+        with self.console.capture() as capture:
+            self.console.print(view)
+        return capture.get()
+
+    def ascii_art(self, weather_data: "CurrentWeather"):
+        from sunny.art import render_art
+
+        condition = weather_data.main
+        color = self.config.condition_colour(condition)
+        return render_art(self.config.ascii_art(condition, weather_data.icon), color)
+
+    def full_weather(
+        self,
+        weather_data: "CurrentWeather",
+        location: str,
+        deg_symbol: str,
+        wind_unit: str,
+    ):
+        """Build the ASCII art and weather panels for one location."""
+        from rich import box
+        from rich.panel import Panel
+        from rich.console import Group
+        from rich.columns import Columns
+        from sunny.art import render_art
+
+        temperature = weather_data.temp
+        feels_like_temp = weather_data.feels_like
+        humidity = weather_data.humidity
+        description = weather_data.description
+        condition = weather_data.main
+        wind_speed = weather_data.wind_speed
+
+        theme = self.config.resolver
+        panel = theme.panel
+        ascii_panel_config = theme.ascii_panel
+        condition_colour = theme.condition_colour(condition)
+        temp_colour = theme.temp(temperature)
+        humid_colour = theme.humid(humidity)
+
+        ascii_art = render_art(
+            self.config.ascii_art(condition, weather_data.icon), condition_colour
+        )
+
+        content_panels = [
+            Panel(
+                f"[{condition_colour}]{description.capitalize()}[/{condition_colour}]",
+                box=box.MINIMAL,
+            ),
+            Panel(
+                f"[{temp_colour}]Temp: {temperature:.1f}° (feels {feels_like_temp:.1f}°) {deg_symbol}[/{temp_colour}]",
+                box=box.MINIMAL,
+            ),
+            Panel(
+                f"[{humid_colour}]Humidity: {humidity}%[/{humid_colour}]",
+                box=box.MINIMAL,
+            ),
+            Panel(
+                f"[{theme.wind}]Wind: {wind_speed} {wind_unit}[/{theme.wind}]",
+                box=box.MINIMAL,
+            ),
+        ]
+
+        content = Columns(content_panels)
+
+        weather_panel = Panel(
+            content,
+            title=f"[{theme.city}]{location.replace('%20', ' ').title()}[/{theme.city}]",
+            border_style=theme.style(theme.panel_border),
+            box=theme.box,
+            padding=(
+                panel.get("padding_top_right"),
+                panel.get("padding_bottom_left"),
+            ),
+            width=panel.get("width"),
+            height=panel.get("height"),
+            subtitle=f"[dim]Coord: ({weather_data.lon:.2f}, {weather_data.lat:.2f}) | Country: {weather_data.country}[/dim]",
+        )
+
+        ascii_panel = Panel(
+            ascii_art,
+            border_style=theme.style(
+                f"{ascii_panel_config.get('border_style')} {theme.city}"
+            ),
+            box=theme.ascii_box,
+            padding=(
+                ascii_panel_config.get("padding_top_right"),
+                ascii_panel_config.get("padding_bottom_left"),
+            ),
+            width=ascii_panel_config.get("width"),
+            height=ascii_panel_config.get("height"),
+        )
+
+        return Group(ascii_panel, weather_panel)
+
+    def multi_city(
+        self, locations: list, results: dict, deg_symbol: str, wind_unit: str
+    ):
+        """Build one card per city from the results of ``Weather.fetch_many``."""
+        from rich.panel import Panel
+        from rich.columns import Columns
+        from rich.markup import escape
+
+        theme = self.config.resolver
+        border_style = theme.style(theme.panel_border)
+        cards = []
+        for location in locations:
+            weather_data = results[location]
+            title = f"[{theme.city}]{location.replace('%20', ' ').title()}[/{theme.city}]"
+            try:
+                if isinstance(weather_data, Exception):
+                    raise weather_data
+                temperature = weather_data.temp
+                humidity = weather_data.humidity
+                description = weather_data.description
+                condition = weather_data.main
+                wind_speed = weather_data.wind_speed
+                condition_colour = theme.condition_colour(condition)
+                temp_colour = theme.temp(temperature)
+                humid_colour = theme.humid(humidity)
+                details = "\n".join(
+                    [
+                        f"[{condition_colour}]{description.capitalize()}[/{condition_colour}]",
+                        f"[{temp_colour}]Temp: {temperature:.1f}{deg_symbol}[/{temp_colour}]",
+                        f"[{humid_colour}]Humidity: {humidity}%[/{humid_colour}]",
+                        f"[{theme.wind}]Wind: {wind_speed} {wind_unit}[/{theme.wind}]",
+                    ]
+                )
+            except Exception as e:
+                details = f"[bold red]{escape(str(e))}[/bold red]"
+
+            cards.append(
+                Panel(
+                    details,
+                    title=title,
+                    border_style=border_style,
+                    box=theme.box,
+                    width=30,
+                )
+            )
+
+        return Columns(cards)
+
+    def forecast(self, weather_data: list, deg_symbol: str, wind_unit: str):
+        """Build one card per forecast day."""
+        from rich.panel import Panel
+        from rich.console import Group
+        from rich.columns import Columns
+        from sunny.art import render_art
+        from sunny.forecast import local_datetime
+
+        theme = self.config.resolver
+        border_style = theme.style(theme.panel_border)
+        day_cards = []
+        for day in weather_data:
+
+            dt = local_datetime(day)
+            day_str = dt.strftime("%a %d %b")
+
+            temperature = day.get("temp")
+            feels_like_temp = day.get("feels_like_temp")
+            humidity = day.get("humidity")
+            description = day.get("description")
+            condition = day.get("main")
+            wind_speed = day.get("wind_speed")
+            icon = day.get("icon")
+
+            if day.get("samples", 1) > 1:
+                subtitle = f"{day['temp_min']:.1f}° / {day['temp_max']:.1f}°"
+                wind_label = "Wind: max"
+            else:
+                subtitle = dt.strftime("%I:%M %p")
+                wind_label = "Wind:"
+
+            condition_colour = theme.condition_colour(condition)
+            temp_colour = theme.temp(temperature)
+            humid_colour = theme.humid(humidity)
+            ascii_art = render_art(self.config.ascii_art(condition, icon), condition_colour)
+
+            details = "\n".join(
+                [
+                    f"[{condition_colour}]{description.capitalize()}[/{condition_colour}]",
+                    f"[{temp_colour}]Temp: {temperature:.1f}° (feels {feels_like_temp:.1f}°) {deg_symbol}[/{temp_colour}]",
+                    f"[{humid_colour}]Humidity: {humidity}%[/{humid_colour}]",
+                    f"[{theme.wind}]{wind_label} {wind_speed} {wind_unit}[/{theme.wind}]",
+                ]
+            )
+
+            card = Panel(
+                Group(ascii_art, "", details),
+                title=f"[{theme.city}]{day_str}[/{theme.city}]",
+                subtitle=f"[dim]{subtitle}[/dim]",
+                border_style=border_style,
+                box=theme.box,
+                padding=(1,4),
+                width=30,
+                height=20,
+            )
+
+            day_cards.append(card)
+
+        return Columns(day_cards, expand=True)
+
+    def theme_preview(self, name: str, theme: dict):
+        from rich import box
+        from rich.panel import Panel
+        from rich.columns import Columns
+
+        panel_config = theme.get("panel", {})
+        border_style = panel_config.get("border_style", "bold")
+        box_attr = getattr(box, panel_config.get("box", "ROUNDED"))
+        border_colour = panel_config.get("border_colour", "light_steel_blue")
+        padding = (
+            int(panel_config.get("padding_top_right", 1)),
+            int(panel_config.get("padding_bottom_left", 1)),
+        )
+        width = int(panel_config.get("width", 55))
+        height = int(panel_config.get("height", 12))
+        colours = theme.get("colours")
+        city_colour = colours.get("col_city")
+        wind_colour = colours.get("col_wind")
+        temp_mid = colours.get("col_temp").get("mid")
+        humd_high = colours.get("col_humid").get("high")
+        thunderstorm = colours.get("col_desc").get("Thunderstorm")
+        content = Columns(
+            [
+                Panel(
+                    f"[{thunderstorm}]Thunderstorm[/{thunderstorm}]",
+                    box=box.MINIMAL,
+                ),
+                Panel(
+                    f"[{temp_mid}]Temp: 25(26) C[/{temp_mid}]",
+                    box=box.MINIMAL,
+                ),
+                Panel(
+                    f"[{humd_high}]Humidity: 65[/{humd_high}]",
+                    box=box.MINIMAL,
+                ),
+                Panel(
+                    f"[{wind_colour}]Wind: 3 m/s[/{wind_colour}]",
+                    box=box.MINIMAL,
+                ),
+            ]
+        )
+        return Panel(
+            content,
+            title=f"[{city_colour}]{name}[/{city_colour}]",
+            border_style=f"{border_style} {border_colour}",
+            box=box_attr,
+            padding=padding,
+            width=width,
+            height=height,
+            subtitle="Coord: (75.00, 32.00) Country: IN",
+        )
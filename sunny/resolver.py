@@ -0,0 +1,141 @@
+import sys
+from bisect import bisect_left
+from rich import print
+
+FALLBACK_COLOURS = {
+    "col_city": "light_steel_blue",
+    "col_wind": "sky_blue1",
+    "col_temp": "chartreuse3",
+    "col_humid": "green_yellow",
+    "col_desc": "dark_orange",
+}
+
+# Default bands: a value greater than a bound moves up to the next colour
+DEFAULT_BANDS = {
+    "temp": ([10, 30], ("low", "mid", "high")),
+    "humid": ([54, 65], ("low", "mid", "high")),
+}
+
+
+class BandTable:
+    """Maps a number to a colour by bisecting sorted band bounds."""
+
+    __slots__ = ("bounds", "colours")
+
+    def __init__(self, bounds: list, colours: list) -> None:
+        if len(colours) != len(bounds) + 1:
+            raise ValueError("bands need exactly one more colour than bounds")
+        self.bounds = [float(b) for b in bounds]
+        self.colours = tuple(colours)
+
+    def __call__(self, value: float) -> str:
+        return self.colours[bisect_left(self.bounds, value)]
+
+
+class ThemeResolver:
+    """Theme lookups precomputed once per theme file.
+
+    Temperature and humidity colours come from band tables, which a theme can
+    override with ``[bands.temp]`` / ``[bands.humid]`` tables holding
+    ``bounds`` and ``colours`` lists. Condition colours are a dict lookup and
+    rich box and border styles are resolved on first use.
+    """
+
+    __slots__ = (
+        "theme_file",
+        "city",
+        "wind",
+        "temp",
+        "humid",
+        "conditions",
+        "panel",
+        "ascii_panel",
+        "panel_border",
+        "_box",
+        "_ascii_box",
+        "_styles",
+    )
+
+    def __init__(self, theme: dict, theme_file: str) -> None:
+        self.theme_file = theme_file
+        colours = theme.get("colours")
+        if not isinstance(colours, dict):
+            print(
+                f"Warning: No colours found in {theme_file}. Using fallback colours."
+            )
+            colours = {}
+
+        self.city = colours.get("col_city") or FALLBACK_COLOURS["col_city"]
+        self.wind = colours.get("col_wind") or FALLBACK_COLOURS["col_wind"]
+        bands = theme.get("bands", {})
+        self.temp = self._band_table("temp", colours.get("col_temp"), bands)
+        self.humid = self._band_table("humid", colours.get("col_humid"), bands)
+        self.conditions = {
+            condition: colour
+            for condition, colour in (colours.get("col_desc") or {}).items()
+            if colour
+        }
+
+        self.panel = theme.get("panel", {})
+        self.ascii_panel = theme.get("ascii_panel", {})
+        self.panel_border = (
+            f"{self.panel.get('border_style')} {self.panel.get('border_colour')}"
+        )
+        self._box = None
+        self._ascii_box = None
+        self._styles = {}
+
+    def _band_table(self, name: str, named_colours, bands: dict) -> BandTable:
+        fallback = FALLBACK_COLOURS[f"col_{name}"]
+        custom = bands.get(name)
+        if custom:
+            try:
+                return BandTable(custom["bounds"], custom["colours"])
+            except (KeyError, TypeError, ValueError) as e:
+                print(
+                    f"Warning: Invalid [bands.{name}] in {self.theme_file}. Using default bands. Exception: {e}"
+                )
+        bounds, levels = DEFAULT_BANDS[name]
+        named_colours = named_colours if isinstance(named_colours, dict) else {}
+        return BandTable(
+            bounds, [named_colours.get(level) or fallback for level in levels]
+        )
+
+    def temp_colour(self, temperature: float) -> str:
+        return self.temp(temperature)
+
+    def humid_colour(self, humidity: int) -> str:
+        return self.humid(humidity)
+
+    def condition_colour(self, condition: str) -> str:
+        return self.conditions.get(condition, FALLBACK_COLOURS["col_desc"])
+
+    def style(self, definition: str):
+        """Get a parsed rich Style, cached per definition string."""
+        style = self._styles.get(definition)
+        if style is None:
+            from rich.style import Style
+
+            style = self._styles[definition] = Style.parse(definition)
+        return style
+
+    def _resolve_box(self, section: dict):
+        from rich import box
+
+        try:
+            return getattr(box, section.get("box").upper())
+        except AttributeError:
+            print(f"Error getting box attribute value from {self.theme_file}.")
+            sys.exit(1)
+
+    @property
+    def box(self):
+        if self._box is None:
+            self._box = self._resolve_box(self.panel)
+        return self._box
+
+    @property
+    def ascii_box(self):
+        if self._ascii_box is None:
+            self._ascii_box = self._resolve_box(self.ascii_panel)
+        return self._ascii_box
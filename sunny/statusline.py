@@ -0,0 +1,154 @@
+"""One-line weather for status bars such as tmux, polybar and i3blocks.
+
+Bars run their command every few seconds and stall while it blocks, so the
+line is built from the response cache alone. Stale or missing data is
+refreshed by a detached process and picked up by a later call.
+``python -m sunny --statusline`` takes a fast path through ``main`` that skips
+argparse, rich and the daemon.
+"""
+
+import sys
+from typing import Optional
+
+from sunny.output import UNIT_SYMBOLS
+
+# Condition glyphs by OpenWeather's main condition, others are mist, haze, fog...
+ICONS = {
+    "Thunderstorm": "⛈",
+    "Drizzle": "🌦",
+    "Rain": "🌧",
+    "Snow": "❄",
+    "Clear": "☀",
+    "Clouds": "☁",
+}
+DEFAULT_ICON = "🌫"
+NIGHT_ICON = "☾"
+
+FIELDS = (
+    "icon",
+    "temp",
+    "feels_like",
+    "deg",
+    "humidity",
+    "wind",
+    "wind_unit",
+    "description",
+    "main",
+    "location",
+    "stale",
+)
+
+
+def icon(main: str, code: str) -> str:
+    """Glyph of a condition; clear nights get a moon."""
+    if main == "Clear" and code.endswith("n"):
+        return NIGHT_ICON
+    return ICONS.get(main, DEFAULT_ICON)
+
+
+def fields(weather, location: str, units: str, stale: str = "") -> dict:
+    """Values a template can use for a CurrentWeather."""
+    deg, wind_unit = UNIT_SYMBOLS.get(units, UNIT_SYMBOLS["metric"])
+    return {
+        "icon": icon(weather.main, weather.icon),
+        "temp": weather.temp,
+        "feels_like": weather.feels_like,
+        "deg": deg,
+        "humidity": weather.humidity,
+        "wind": weather.wind_speed,
+        "wind_unit": wind_unit,
+        "description": weather.description,
+        "main": weather.main,
+        "location": location.replace("%20", " ").title(),
+        "stale": stale,
+    }
+
+
+def statusline(weather, location: str, units: str, template: Optional[str] = None) -> str:
+    """Build the status line of a location from cached data only.
+
+    ``weather`` is a ``Weather``; the template and markers come from the
+    [statusline] section unless ``template`` is given.
+    """
+    settings = weather.config.statusline_settings
+    cached = weather.fetch_cached(location, units)
+    if cached is None:
+        return settings["missing"]
+    current, age = cached
+    stale = settings["stale_marker"] if age > float(settings["stale_after"]) else ""
+    values = fields(current, location, units, stale)
+    try:
+        return (template or settings["template"]).format_map(values)
+    except KeyError as e:
+        sys.exit(
+            f"Error: Unknown statusline field {e}. Use any of: {', '.join(FIELDS)}"
+        )
+    except (ValueError, IndexError) as e:
+        sys.exit(f"Error: Invalid statusline template - {e}")
+
+
+def parse_args(argv: list) -> Optional[tuple]:
+    """Get (city, units, template) from plain --statusline calls.
+
+    Returns None for anything else (other flags, several cities), which is
+    left to the full argument parser.
+    """
+    city = units = template = None
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        following = argv[i + 1] if i + 1 < len(argv) else None
+        name, eq, value = arg.partition("=")
+        if name == "--statusline":
+            if eq:
+                template = value
+            elif following is not None and not following.startswith("-"):
+                template = following
+                i += 1
+        elif name in ("-c", "--city", "-u", "--units"):
+            if not eq:
+                if following is None:
+                    return None
+                value = following
+                i += 1
+            if name in ("-c", "--city"):
+                if city is not None or "," in value:
+                    return None
+                city = value
+            elif value in UNIT_SYMBOLS:
+                units = value
+            else:
+                return None
+        else:
+            return None
+        i += 1
+    return city, units, template
+
+
+def main(argv: list) -> Optional[int]:
+    """Print the status line for ``argv``, or return None to run the full CLI."""
+    parsed = parse_args(argv)
+    if parsed is None:
+        return None
+    city, units, template = parsed
+
+    from sunny import trace
+
+    trace.enable_from(argv)
+    try:
+        with trace.span("statusline"):
+            from sunny.configure import ConfigManager
+            from sunny.utility import Weather
+
+            config = ConfigManager()
+            if not config.CONFIG_FILE.exists():
+                return None
+            location = city.replace("_", "%20") if city else config.get_location
+            if not location:
+                return None
+            units = units or config.get_unit or "metric"
+            line = statusline(Weather(config), location, units, template)
+        print(line)
+        return 0
+    finally:
+        trace.finish(argv)
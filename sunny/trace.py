@@ -0,0 +1,203 @@
+import os
+import sys
+import time
+import threading
+from functools import wraps
+from typing import Optional
+
+# The active tracer, or None. Every span() call checks this first, so tracing
+# costs one global lookup per span while it is off.
+_tracer = None
+_http_instrumented = False
+
+
+class _NoSpan:
+    """Span used while tracing is off; does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def set(self, **attrs) -> None:
+        pass
+
+
+NO_SPAN = _NoSpan()
+
+
+class Span:
+    __slots__ = ("tracer", "name", "attrs", "start", "duration", "depth", "thread")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: dict) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self) -> "Span":
+        stack = self.tracer.stack()
+        self.depth = len(stack)
+        self.thread = threading.current_thread().name
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer.stack().pop()
+        self.tracer.spans.append(self)
+        return False
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    """Collects the spans of one run and writes them out when it finishes.
+
+    ``target`` is ``stderr`` for a summary table, or the path of a JSON-lines
+    file that gets one record per span and one for the whole run appended.
+    """
+
+    def __init__(self, target: str) -> None:
+        self.target = target
+        self.started = time.perf_counter()
+        self.spans = []
+        self._local = threading.local()
+
+    def stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def write(self, argv: list) -> None:
+        total = (time.perf_counter() - self.started) * 1000
+        spans = sorted(self.spans, key=lambda s: s.start)
+        if self.target == "stderr":
+            self._write_summary(spans, total)
+        else:
+            self._write_jsonl(spans, total, argv)
+
+    def _write_summary(self, spans: list, total: float) -> None:
+        lines = [f"sunny trace: {total:.1f} ms total"]
+        for s in spans:
+            label = f"{'  ' * s.depth}{s.name}"
+            attrs = " ".join(f"{k}={v}" for k, v in s.attrs.items())
+            thread = "" if s.thread == "MainThread" else f" [{s.thread}]"
+            lines.append(f"  {label:<34}{s.duration * 1000:9.2f} ms  {attrs}{thread}")
+        print("\n".join(lines), file=sys.stderr)
+
+    def _write_jsonl(self, spans: list, total: float, argv: list) -> None:
+        import json
+
+        run = f"{os.getpid()}-{time.time():.3f}"
+        records = [
+            {
+                "run": run,
+                "name": s.name,
+                "start_ms": round((s.start - self.started) * 1000, 3),
+                "duration_ms": round(s.duration * 1000, 3),
+                "depth": s.depth,
+                "thread": s.thread,
+                **s.attrs,
+            }
+            for s in spans
+        ]
+        records.append(
+            {"run": run, "name": "run", "argv": argv, "duration_ms": round(total, 3)}
+        )
+        try:
+            with open(self.target, "a", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, default=str) + "\n")
+        except OSError as e:
+            print(f"Warning: Unable to write trace to {self.target}: {e}", file=sys.stderr)
+
+
+def span(name: str, **attrs):
+    """Time a block as a named span. Returns a no-op while tracing is off."""
+    if _tracer is None:
+        return NO_SPAN
+    return Span(_tracer, name, attrs)
+
+
+def traced(func):
+    """Record every call of a function as a span named after it."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _tracer is None:
+            return func(*args, **kwargs)
+        with Span(_tracer, func.__name__, {}):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def target_from(argv: list) -> Optional[str]:
+    """Get the trace target from ``--profile [FILE]`` or the SUNNY_TRACE variable.
+
+    ``SUNNY_TRACE=1`` (or ``stderr``) prints a summary, any other value is a
+    JSON-lines file to append to.
+    """
+    for i, arg in enumerate(argv):
+        if arg.startswith("--profile="):
+            return arg.split("=", 1)[1] or "stderr"
+        if arg == "--profile":
+            following = argv[i + 1] if i + 1 < len(argv) else ""
+            return following if following and not following.startswith("-") else "stderr"
+    target = os.environ.get("SUNNY_TRACE", "")
+    if target in ("", "0"):
+        return None
+    return "stderr" if target in ("1", "stderr") else target
+
+
+def enable_from(argv: list) -> None:
+    """Start tracing if the arguments or environment ask for it."""
+    global _tracer
+    if _tracer is None:
+        target = target_from(argv)
+        if target:
+            _tracer = Tracer(target)
+            if "urllib3" in sys.modules:
+                instrument_http()
+
+
+def finish(argv: list) -> None:
+    """Stop tracing and write out the spans collected so far."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.write(argv)
+
+
+def instrument_http() -> None:
+    """Add connect spans to urllib3 connections: TCP (with DNS) and TLS."""
+    global _http_instrumented
+    if _http_instrumented:
+        return
+    _http_instrumented = True
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+
+    def wrap(cls, method: str, name: str) -> None:
+        original = getattr(cls, method)
+
+        @wraps(original)
+        def timed(self, *args, **kwargs):
+            with span(name, host=self.host):
+                return original(self, *args, **kwargs)
+
+        setattr(cls, method, timed)
+
+    wrap(HTTPConnection, "_new_conn", "http.connect")
+    wrap(HTTPSConnection, "connect", "http.tls")
@@ -0,0 +1,84 @@
+import random
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from sunny import trace
+
+
+class JitteredRetry(Retry):
+    """Retry policy that spreads exponential backoff with random jitter."""
+
+    # Longest Retry-After wait honoured, in seconds
+    MAX_RETRY_AFTER = 10.0
+    # urllib3 retries a 429 that carries Retry-After whatever the status
+    # list says; rate limiting is left to Weather and its token bucket
+    RETRY_AFTER_STATUS_CODES = frozenset({413, 503})
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.MAX_RETRY_AFTER)
+
+
+class Transport:
+    """Pooled keep-alive HTTP session with timeouts and bounded retries."""
+
+    # 429 is not retried here: Weather drains the shared rate limiter on it,
+    # and retries inside the adapter would not take tokens from it
+    RETRY_STATUSES = (500, 502, 503, 504)
+
+    def __init__(self, settings: dict) -> None:
+        self.base_url = settings["base_url"].rstrip("/")
+        self.timeout = (float(settings["connect_timeout"]), float(settings["read_timeout"]))
+        self.retries = int(settings["retries"])
+        self.backoff_factor = float(settings["backoff_factor"])
+        self.pool_size = int(settings["pool_size"])
+        self._session = None
+        # Threads of fetch_many may all ask for the session at once
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the shared session, creating it on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        if trace.enabled():
+            trace.instrument_http()
+        retry = JitteredRetry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=2, pool_maxsize=self.pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get(self, path: str, params: dict) -> requests.Response:
+        """GET a path relative to the base URL."""
+        return self.session.get(
+            f"{self.base_url}/{path}", params=params, timeout=self.timeout
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
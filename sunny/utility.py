@@ -1,87 +1,463 @@
-import requests
 import sys
-import json
+import threading
+from contextlib import contextmanager
+from typing import Callable, Optional
+from urllib.parse import unquote
+from sunny import trace
 from sunny.configure import ConfigManager
+from sunny.cache import ResponseCache, spawn_refresh
+from sunny.geocode import GeocodeIndex, normalize
+
+class WeatherError(Exception):
+    """Raised when weather data for a location cannot be fetched"""
 
-API_CONFIG = ConfigManager()
 
-api_key = API_CONFIG.get_api_key
 class Weather:
-    def __init__(self) -> None:
-        pass
+    def __init__(self, config: Optional[ConfigManager] = None) -> None:
+        self.config = config if config is not None else ConfigManager()
+        self.cache_settings = self.config.cache_settings
+        self.cache = (
+            ResponseCache(max_entries=self.cache_settings["max_entries"])
+            if self.cache_settings["enabled"]
+            else None
+        )
+        # Resolved places, so names are only looked up by the API once
+        self.places = GeocodeIndex() if self.cache_settings["enabled"] else None
+        # Offline city index, opened on the first name the geocode index misses
+        self._cities = None
+        self._provider = None
+        self._limiter = None
+        # Guards the lazy members above, whose first use is often in the
+        # worker threads of fetch_many
+        self._lazy_lock = threading.RLock()
+        # Upper bound in seconds on the age of cached data, set by --watch
+        self.max_age = None
+        # Decoded payloads of this invocation, so combined flags share one fetch
+        self._payloads = {}
+        # Stale entries waiting for a background refresh, and how many
+        # batch_refresh blocks are open
+        self._stale = []
+        self._batches = 0
+        self._stale_lock = threading.Lock()
 
-    def get_weather_city_json(self, location: str, units: str = "metric") -> str:
-        """Returns open weather api data of specified location and units"""
-        url = f"http://api.openweathermap.org/data/2.5/weather?q={location}&units={units}&appid={api_key}"
+    @property
+    def provider(self):
+        """Get the [provider] backend, importing it only when the network is needed"""
+        if self._provider is None:
+            with self._lazy_lock:
+                if self._provider is None:
+                    from sunny.providers import from_config
+
+                    self._provider = from_config(self.config, self._hedge_token)
+        return self._provider
+
+    def close(self) -> None:
+        """Close the connections of the provider, if it was used"""
+        with self._lazy_lock:
+            if self._provider is not None:
+                self._provider.close()
+                self._provider = None
+
+    @property
+    def limiter(self):
+        """Get the token bucket shared by every process using this API key"""
+        if self._limiter is None:
+            with self._lazy_lock:
+                if self._limiter is None:
+                    from sunny.ratelimit import TokenBucket
+
+                    settings = self.config.ratelimit_settings
+                    self._limiter = (
+                        TokenBucket(
+                            self.config.get_api_key or "",
+                            settings["calls_per_minute"],
+                            settings["burst"],
+                        )
+                        if settings["enabled"]
+                        else False
+                    )
+        return self._limiter or None
+
+    def _take_token(self) -> None:
+        """Wait for API budget, or fail when it would take longer than ``max_wait``"""
+        from sunny.ratelimit import RateLimited
 
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-            return data
-        except requests.exceptions.HTTPError as http_err:
-            if http_err.response.status_code == 401:
-                sys.exit(
-                    "Error: Unauthorized. Check your API key."
+            self.limiter.acquire(float(self.config.ratelimit_settings["max_wait"]))
+        except RateLimited as e:
+            raise WeatherError(f"Error: API rate limit reached, {e}.")
+
+    def _hedge_token(self) -> bool:
+        """Take API budget for a hedged request if there is some to spare right now"""
+        from sunny.ratelimit import RateLimited
+
+        if self.limiter is None:
+            return True
+        try:
+            self.limiter.acquire(0)
+            return True
+        except RateLimited:
+            return False
+
+    @contextmanager
+    def batch_refresh(self):
+        """Collect the background refreshes started inside the block into one process"""
+        with self._stale_lock:
+            self._batches += 1
+        try:
+            yield
+        finally:
+            with self._stale_lock:
+                self._batches -= 1
+                stale = [] if self._batches else self._stale
+                if not self._batches:
+                    self._stale = []
+            spawn_refresh(stale)
+
+    def _queue_refresh(self, endpoint: str, location: str, units: str) -> None:
+        """Refresh an entry in the background, with the rest of the batch if one is open"""
+        with self._stale_lock:
+            self._stale.append((endpoint, location, units))
+            if self._batches:
+                return
+            stale, self._stale = self._stale, []
+        spawn_refresh(stale)
+
+    def reset(self) -> None:
+        """Forget payloads fetched during the current invocation"""
+        self._payloads.clear()
+
+    @property
+    def cities(self):
+        """Get the offline city index, or None when none is installed"""
+        if self._cities is None:
+            with self._lazy_lock:
+                if self._cities is None:
+                    from sunny.cities import CityIndex
+
+                    self._cities = CityIndex.open() or False
+        return self._cities or None
+
+    def _place(self, location: str):
+        """Get the resolved place of a location, if it is known without asking the API"""
+        if self.places is None:
+            return None
+        place = self.places.get(location)
+        if place is None and self.cities is not None:
+            matches = self.cities.find(location)
+            # Ambiguous names are left to the API, which picks the main city
+            if len(matches) == 1:
+                from sunny.geocode import Place
+
+                city = matches[0]
+                place = Place(
+                    round(city.lat, 4), round(city.lon, 4), city.country, city.id, city.name
                 )
-            elif http_err.response.status_code == 404:
-                sys.exit(
-                    f"Error: Location '{location}' not found."
+                self.places.add(location, place)
+        return place
+
+    def _not_found(self, location: str) -> WeatherError:
+        """Error for a name the API does not know, with spellings from the city index"""
+        message = f"Error: Location '{unquote(location)}' not found."
+        # The API also knows names the index lacks (Bombay), so the index
+        # only suggests spellings once the API has said no
+        if self.cities is not None and not self.cities.find(location):
+            suggestions = self.cities.suggest(location)
+            if suggestions:
+                message += f" Did you mean {' or '.join(c.arg for c in suggestions)}?"
+        return WeatherError(message)
+
+    def _cache_key(self, endpoint: str, location: str, units: str) -> str:
+        """Cache key of a location, shared by every alias of a resolved place"""
+        place = self._place(location)
+        return ResponseCache.make_key(
+            endpoint, place.key if place else normalize(location), units
+        )
+
+    def _remember(self, endpoint: str, location: str, body: bytes) -> None:
+        """Add the place a name resolved to in a response to the geocode index"""
+        from sunny.decode import loads
+        from sunny.geocode import place_from_response
+
+        try:
+            place = place_from_response(endpoint, loads(body))
+        except ValueError:
+            return
+        if place is not None:
+            self.places.add(location, place)
+
+    def _download(self, endpoint: str, location: str, units: str) -> bytes:
+        """Ask the provider for an endpoint and return the raw response body.
+
+        Locations already in the geocode index are queried by id or
+        coordinates; other names are sent as is and the place they resolve
+        to is remembered.
+        """
+        from sunny.providers import ProviderError
+
+        place = self._place(location)
+        if self.limiter is not None:
+            self._take_token()
+
+        try:
+            body = self.provider.fetch(endpoint, location, units, place)
+        except ProviderError as e:
+            if e.status == 401:
+                raise WeatherError("Error: Unauthorized. Check your API key.")
+            elif e.status == 429:
+                if self.limiter is not None:
+                    self.limiter.drain()
+                raise WeatherError(
+                    "Error: Rate limited by OpenWeather (HTTP 429). Try again in a minute."
                 )
+            elif e.status == 404:
+                raise self._not_found(location)
+            elif e.status is not None:
+                raise WeatherError(f"Error: HTTP error {e.status}")
             else:
-                sys.exit(f"Error: HTTP error {http_err.response.status_code}")
-        except requests.exceptions.RequestException as req_err:
-            sys.exit(f"Error: An error occurred with the request: {req_err}")
+                raise WeatherError(f"Error: An error occurred with the request: {e}")
+        if place is None and self.places is not None:
+            self._remember(endpoint, location, body)
+        return body
+
+    def _get(self, endpoint: str, location: str, units: str, decode: Callable):
+        """Returns decoded endpoint data, fetched at most once per invocation"""
+        memo_key = (endpoint, normalize(location), units, decode)
+        data = self._payloads.get(memo_key)
+        if data is None:
+            data = self._payloads[memo_key] = self._load(
+                endpoint, location, units, decode
+            )
+        return data
+
+    def _load(self, endpoint: str, location: str, units: str, decode: Callable):
+        """Returns decoded endpoint data, served from the response cache when possible.
+
+        Entries younger than the endpoint TTL are used as is. Entries that are
+        stale by less than ``stale_ttl`` are returned immediately while a
+        detached process refreshes them for the next run. When ``max_age`` is
+        set, older entries are always downloaded again before returning.
+        """
+        if self.cache is None:
+            body = self._download(endpoint, location, units)
+            return self._decode(endpoint, body, decode)
+
+        key = self._cache_key(endpoint, location, units)
+        with trace.span("cache.read", endpoint=endpoint) as span:
+            entry = self.cache.get(key)
+            span.set(hit=entry is not None)
+        if entry is not None:
+            body, age = entry
+            ttl = self.cache_settings[f"{endpoint}_ttl"]
+            stale_ttl = self.cache_settings["stale_ttl"]
+            if self.max_age is not None:
+                ttl, stale_ttl = min(ttl, self.max_age), 0
+            if age <= ttl + stale_ttl:
+                try:
+                    with trace.span("decode", endpoint=endpoint, cached=True):
+                        data = decode(body)
+                except ValueError:
+                    data = None
+                if data is not None:
+                    if age > ttl and self.cache.claim_refresh(key):
+                        self._queue_refresh(endpoint, location, units)
+                    return data
+
+        body = self._download(endpoint, location, units)
+        self.cache.set(self._cache_key(endpoint, location, units), body)
+        return self._decode(endpoint, body, decode)
+
+    @staticmethod
+    def _decode(endpoint: str, body: bytes, decode: Callable):
+        try:
+            with trace.span("decode", endpoint=endpoint, cached=False):
+                return decode(body)
+        except ValueError as e:
+            raise WeatherError(f"Error: {e}")
+
+    def refresh(self, endpoint: str, location: str, units: str) -> None:
+        """Re-download an endpoint and store it in the response cache"""
+        key = self._cache_key(endpoint, location, units)
+        try:
+            body = self._download(endpoint, location, units)
+            if self.cache is not None:
+                self.cache.set(self._cache_key(endpoint, location, units), body)
+        finally:
+            if self.cache is not None:
+                self.cache.release_refresh(key)
+
+    def get_weather_city_json(self, location: str, units: str = "metric") -> dict:
+        """Returns open weather api data of specified location and units"""
+        from sunny import decode
+
+        try:
+            return self._get("weather", location, units, decode.loads)
+        except WeatherError as e:
+            sys.exit(str(e))
+
+    def fetch_current(self, location: str, units: str = "metric"):
+        """Fetches current weather as a CurrentWeather record"""
+        from sunny import decode
+
+        try:
+            return self._get("weather", location, units, decode.current_weather)
+        except WeatherError as e:
+            sys.exit(str(e))
+
+    def fetch_cached(self, location: str, units: str = "metric"):
+        """Current weather from the response cache only, as (CurrentWeather, age in seconds).
+
+        Never waits on the network. A missing entry, or one older than the
+        weather TTL, is refreshed by a detached process for later calls, and
+        what the cache holds now (or None) is returned at once. With the
+        response cache off there is nothing to serve, so the weather is
+        downloaded (None when that fails).
+        """
+        from sunny import decode
+
+        if self.cache is None:
+            try:
+                return self._get("weather", location, units, decode.current_weather), 0.0
+            except WeatherError:
+                return None
+        key = self._cache_key("weather", location, units)
+        with trace.span("cache.read", endpoint="weather") as span:
+            entry = self.cache.get(key)
+            span.set(hit=entry is not None)
+        result = None
+        if entry is not None:
+            body, age = entry
+            try:
+                with trace.span("decode", endpoint="weather", cached=True):
+                    result = decode.current_weather(body), age
+            except ValueError:
+                pass
+        stale = result is None or result[1] > self.cache_settings["weather_ttl"]
+        if stale and self.cache.claim_refresh(key):
+            self._queue_refresh("weather", location, units)
+        return result
+
+    def fetch_many(
+        self, locations: list, units: str = "metric", timings: Optional[dict] = None
+    ) -> dict:
+        """Fetches current weather of many locations concurrently.
+
+        Returns a dict of location to CurrentWeather, or to the WeatherError
+        raised for it, so one failing location does not abort the others.
+        When ``timings`` is given, the seconds each location took are stored in it.
+        """
+        results = dict(self.iter_many(locations, units, timings))
+        return {location: results[location] for location in locations}
+
+    def iter_many(
+        self, locations: list, units: str = "metric", timings: Optional[dict] = None
+    ):
+        """Like ``fetch_many``, but yields (location, result) as each one completes."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from sunny.decode import current_weather
+
+        def fetch(location):
+            started = time.perf_counter()
+            try:
+                return self._get("weather", location, units, current_weather)
+            except WeatherError as e:
+                return e
+            finally:
+                if timings is not None:
+                    timings[location] = time.perf_counter() - started
+
+        if not locations:
+            return
+        pool_size = int(self.config.network_settings["pool_size"])
+        workers = max(1, min(len(locations), pool_size))
+        with self.batch_refresh(), ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(fetch, location): location for location in locations}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def prefetch(
+        self, locations: list, units: str, endpoints: list, concurrency: int = 4
+    ) -> list:
+        """Loads every (endpoint, location) pair into the response cache.
+
+        Goes through the same path as ``get_weather_city_json`` and
+        ``get_weather_forecast``, at most ``concurrency`` at a time. Returns
+        (endpoint, location, seconds, WeatherError or None) per pair.
+        """
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from sunny.decode import loads
+
+        def load(job):
+            endpoint, location = job
+            started = time.perf_counter()
+            try:
+                self._get(endpoint, location, units, loads)
+                error = None
+            except WeatherError as e:
+                error = e
+            return endpoint, location, time.perf_counter() - started, error
+
+        jobs = [(endpoint, location) for location in locations for endpoint in endpoints]
+        if not jobs:
+            return []
+        workers = max(1, min(len(jobs), concurrency))
+        with self.batch_refresh(), ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(load, jobs))
 
     def fetch_temp(self, location: str, units: str = "metric") -> float:
-        data = self.get_weather_city_json(location, units)
-        temperature = data["main"]["temp"]
-        return temperature
+        return self.fetch_current(location, units).temp
 
     def fetch_humid(self, location: str, units: str = "metric") -> int:
-        data = self.get_weather_city_json(location, units)
-        humidity = data["main"]["humidity"]
-        return humidity
+        return self.fetch_current(location, units).humidity
 
     def fetch_desc(self, location: str, units: str = "metric") -> str:
-        data = self.get_weather_city_json(location, units)
-        desc = data["weather"][0]["description"]
-        return desc.capitalize()
+        return self.fetch_current(location, units).description.capitalize()
 
-    def get_weather_forecast(self, location: str, units: str = "metric"):
+    def get_weather_forecast(self, location: str, units: str = "metric") -> dict:
         """Returns forecast data of specified location and units"""
-        url = f"http://api.openweathermap.org/data/2.5/forecast?q={location}&units={units}&appid={api_key}"
+        from sunny import decode
+
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-            return data
-        except requests.exceptions.HTTPError as http_err:
-            if http_err.response.status_code == 401:
-                sys.exit("Error: Unauthorized. Check your API key.")
-            elif http_err.response.status_code == 404:
-                sys.exit(f"Error: Location '{location}' not found.")
-            else:
-                sys.exit(f"Error: HTTP error {http_err.response.status_code}")
-        except requests.exceptions.RequestException as req_err:
-            sys.exit(f"Error: An error occurred with the request: {req_err}")
-
-    def fetch_forecast(self, location: str, units: str = "metric") -> list:
-        """Fetches 5-day forecast data."""
-        data = self.get_weather_forecast(location, units)
-        forecast_data = []
-        for forecast in data.get("list", []):
-            forecast_data.append(
-                {
-                    "dt_txt": forecast.get("dt_txt"),
-                    "temp": forecast.get("main", {}).get("temp"),
-                    "feels_like_temp": forecast.get("main", {}).get("feels_like"),
-                    "humidity": forecast.get("main", {}).get("humidity"),
-                    "main": forecast.get("weather", [{}])[0].get("main"),
-                    "description": forecast.get("weather", [{}])[0].get("description"),
-                    "id": forecast.get("weather", [{}])[0].get("id"),
-                    "icon": forecast.get("weather", [{}])[0].get("icon"),
-                    "wind_speed": forecast.get("wind", {}).get("speed"),
-                }
-            )
-        return forecast_data[0::5]
+            return self._get("forecast", location, units, decode.loads)
+        except WeatherError as e:
+            sys.exit(str(e))
+
+    def fetch_forecast_series(self, location: str, units: str = "metric"):
+        """Fetches the 3-hourly forecast as a ForecastSeries."""
+        from sunny import decode
+
+        try:
+            return self._get("forecast", location, units, decode.forecast_series)
+        except WeatherError as e:
+            sys.exit(str(e))
+
+    def fetch_forecast(
+        self,
+        location: str,
+        units: str = "metric",
+        strategy: Optional[str] = None,
+        days: Optional[int] = None,
+    ) -> list:
+        """Fetches forecast data summarised per local calendar day."""
+        from sunny.forecast import aggregate
+
+        settings = self.config.forecast_settings
+        return aggregate(
+            self.fetch_forecast_series(location, units),
+            strategy or settings["strategy"],
+            days or settings["days"],
+        )
+
+
+if __name__ == "__main__":
+    # Background refresh of stale cache entries started by spawn_refresh:
+    # python -m sunny.utility ENDPOINT LOCATION UNITS [ENDPOINT LOCATION UNITS ...]
+    weather = Weather()
+    args = sys.argv[1:]
+    for i in range(0, len(args) - 2, 3):
+        try:
+            weather.refresh(*args[i : i + 3])
+        except WeatherError:
+            pass
@@ -0,0 +1,159 @@
+import os
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from sunny import decode
+from sunny.cache import ResponseCache
+from sunny.utility import Weather
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+TTL = 600
+STALE_TTL = 3600
+
+
+def store(cache: ResponseCache, key: str, body: bytes, age: float) -> None:
+    """Write an entry fetched ``age`` seconds ago."""
+    header = json.dumps({"fetched_at": time.time() - age}).encode("utf-8") + b"\n"
+    cache._write(key, header, body)
+
+
+def entries(cache: ResponseCache) -> set:
+    return {path.stem for path in cache.CACHE_DIR.glob("*.entry")}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path, max_entries=3)
+
+
+def test_get_returns_body_and_age(cache):
+    assert cache.get("missing") is None
+    store(cache, "key", b"body", 120)
+    body, age = cache.get("key")
+    assert body == b"body"
+    assert 120 <= age < 130
+
+
+def test_unreadable_header_is_a_miss(cache):
+    cache._write("key", b"not json\n", b"body")
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    for age, key in enumerate(["a", "b", "c"]):
+        cache.set(key, b"body")
+        past = time.time() - 100 + age
+        os.utime(cache._path(key), (past, past))
+    # "a" is the oldest, but reading it makes "b" the least recently used
+    cache.get("a")
+    cache.set("d", b"body")
+    assert entries(cache) == {"a", "c", "d"}
+    cache.set("e", b"body")
+    assert len(entries(cache)) == cache.max_entries
+
+
+def test_only_one_refresh_is_claimed(cache):
+    assert cache.claim_refresh("key")
+    assert not cache.claim_refresh("key")
+    cache.release_refresh("key")
+    assert cache.claim_refresh("key")
+
+
+def test_abandoned_refresh_claim_expires(cache):
+    assert cache.claim_refresh("key")
+    marker = cache.CACHE_DIR / "key.refresh"
+    past = time.time() - 120
+    os.utime(marker, (past, past))
+    assert cache.claim_refresh("key", timeout=60)
+
+
+class Config:
+    """Just the settings Weather reads, with rate limiting off."""
+
+    cache_settings = {
+        "enabled": True,
+        "weather_ttl": TTL,
+        "forecast_ttl": TTL,
+        "stale_ttl": STALE_TTL,
+        "max_entries": 200,
+        "render_entries": 100,
+    }
+    ratelimit_settings = {"enabled": False}
+
+
+class Provider:
+    """Serves the recorded payload and counts the downloads."""
+
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def fetch(self, endpoint, location, units, place=None) -> bytes:
+        self.calls += 1
+        return (FIXTURES_DIR / f"{endpoint}.json").read_bytes()
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def refreshes(monkeypatch):
+    spawned = []
+    monkeypatch.setattr("sunny.utility.spawn_refresh", spawned.extend)
+    return spawned
+
+
+@pytest.fixture
+def weather(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    weather = Weather(Config())
+    weather._provider = Provider()
+    return weather
+
+
+def load(weather: Weather):
+    return weather._load("weather", "Delhi", "metric", decode.current_weather)
+
+
+def seed(weather: Weather, age: float) -> None:
+    key = weather._cache_key("weather", "Delhi", "metric")
+    store(weather.cache, key, (FIXTURES_DIR / "weather.json").read_bytes(), age)
+
+
+def test_fresh_entry_is_used_as_is(weather, refreshes):
+    seed(weather, TTL - 60)
+    assert load(weather) is not None
+    assert weather.provider.calls == 0
+    assert refreshes == []
+
+
+def test_stale_entry_is_served_and_refreshed_once(weather, refreshes):
+    seed(weather, TTL + 60)
+    load(weather)
+    load(weather)
+    assert weather.provider.calls == 0
+    # The second read finds the refresh already claimed
+    assert refreshes == [("weather", "Delhi", "metric")]
+
+
+def test_entry_past_the_stale_window_is_downloaded(weather, refreshes):
+    seed(weather, TTL + STALE_TTL + 60)
+    load(weather)
+    assert weather.provider.calls == 1
+    assert refreshes == []
+    # And the new download is fresh
+    load(weather)
+    assert weather.provider.calls == 1
+
+
+def test_max_age_skips_the_stale_window(weather, refreshes):
+    seed(weather, 120)
+    weather.max_age = 60
+    load(weather)
+    assert weather.provider.calls == 1
+    assert refreshes == []
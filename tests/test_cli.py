@@ -0,0 +1,31 @@
+import pytest
+
+from sunny.cli import WeatherCLI
+
+
+@pytest.fixture
+def cli():
+    # get_locations needs no config, so skip loading one
+    return WeatherCLI.__new__(WeatherCLI)
+
+
+@pytest.mark.parametrize(
+    "cities, locations",
+    [
+        (["Delhi,IN,Paris"], ["Delhi,IN", "Paris"]),
+        (["Delhi,in"], ["Delhi,in"]),
+        (["Delhi", "Tokyo,JP"], ["Delhi", "Tokyo,JP"]),
+        (["New_York,US"], ["New%20York,US"]),
+        # Not country codes, so cities of their own
+        (["Delhi,Ur"], ["Delhi", "Ur"]),
+        (["Paris,TX"], ["Paris", "TX"]),
+        # A state code is kept when a country code follows it
+        (["Paris,TX,US"], ["Paris,TX,US"]),
+        (["Columbus,GA,US"], ["Columbus,GA,US"]),
+        # A leading code has no city to qualify
+        (["IN,Delhi"], ["IN", "Delhi"]),
+        (["Delhi,,Paris", "Delhi"], ["Delhi", "Paris"]),
+    ],
+)
+def test_get_locations(cli, cities, locations):
+    assert cli.get_locations(cities) == locations
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from sunny import decode
+from sunny.forecast import ForecastSeries, aggregate
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+@pytest.fixture
+def series():
+    return decode.forecast_series((FIXTURES_DIR / "forecast.json").read_bytes())
+
+
+def row(dt: int, temp: float, main: str = "Clear") -> tuple:
+    """One entry in COLUMNS order."""
+    return (dt, temp, temp, 1.0, 50, 800, main, main.lower(), "01d")
+
+
+def test_at_hour_is_a_strided_view_of_regular_steps(series):
+    noon = series.at_hour(14)
+    assert len(noon) == 5
+    assert all(noon.local_seconds(i) // 3600 == 14 for i in range(len(noon)))
+    # A view over the same arrays, not a copy
+    assert noon._columns is series._columns
+
+
+def test_at_hour_with_repeated_timestamps():
+    repeated = ForecastSeries.from_rows([row(3600, 1.0), row(3600, 2.0), row(7200, 3.0)])
+    assert list(repeated.at_hour(1).column("temp")) == [1.0, 2.0]
+
+
+def test_at_hour_with_unsorted_timestamps():
+    unsorted = ForecastSeries.from_rows(
+        [row(86400, 1.0), row(0, 2.0, "Rain"), row(3600, 3.0), row(2 * 86400, 4.0)]
+    )
+    at_midnight = unsorted.at_hour(0)
+    assert list(at_midnight.column("temp")) == [1.0, 2.0, 4.0]
+    assert at_midnight.text("main", 1) == "Rain"
+
+
+def test_at_hour_without_matches():
+    assert len(ForecastSeries.from_rows([row(0, 1.0)]).at_hour(5)) == 0
+    assert len(ForecastSeries.from_rows([]).at_hour(5)) == 0
+
+
+def local_hour(record: dict) -> int:
+    return (record["dt"] + record["offset"]) % 86400 // 3600
+
+
+def test_daily_summarises_every_entry_of_a_day(series):
+    days = aggregate(series, "daily")
+    assert [day["samples"] for day in days] == [len(day) for day in series.days()[:5]]
+    first = series.days()[0]
+    assert days[0]["temp_min"] == min(first.column("temp"))
+    assert days[0]["temp_max"] == max(first.column("temp"))
+    assert days[0]["temp"] == sum(first.column("temp")) / len(first)
+    assert all(day["temp_min"] <= day["temp"] <= day["temp_max"] for day in days)
+
+
+def test_noon_picks_the_entry_closest_to_midday(series):
+    days = aggregate(series, "noon")
+    assert len(days) == 5
+    assert all(day["samples"] == 1 for day in days)
+    # The first day starts after noon, so its first entry is the closest
+    assert days[0]["dt"] == series.column("dt")[0]
+    assert [local_hour(day) for day in days[1:]] == [11, 11, 11, 11]
+
+
+def test_sample_takes_every_fifth_entry(series):
+    days = aggregate(series, "sample", days=3)
+    assert [day["dt"] for day in days] == list(series.column("dt")[::5][:3])
+
+
+def test_aggregate_of_nothing(series):
+    assert aggregate(ForecastSeries.from_rows([])) == []
+    with pytest.raises(ValueError):
+        aggregate(series, "weekly")
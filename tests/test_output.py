@@ -0,0 +1,74 @@
+import io
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from sunny import decode, output
+from sunny.forecast import aggregate
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+@pytest.fixture
+def current():
+    weather = decode.current_weather((FIXTURES_DIR / "weather.json").read_bytes())
+    return output.current_record("New%20Delhi", weather, "metric")
+
+
+@pytest.fixture
+def days():
+    series = decode.forecast_series((FIXTURES_DIR / "forecast.json").read_bytes())
+    return output.forecast_records("Delhi", aggregate(series), "metric")
+
+
+def written(fmt: str, records: list, fields=output.CURRENT_FIELDS) -> str:
+    stream = io.StringIO()
+    writer = output.Writer(fmt, fields, many=True, stream=stream)
+    for record in records:
+        writer.write(record)
+    writer.close()
+    return stream.getvalue()
+
+
+def test_ndjson_is_one_object_per_record(current):
+    error = output.current_record("Atlantis", Exception("Error: City not found"), "metric")
+    lines = written("ndjson", [current, error]).splitlines()
+    assert len(lines) == 2
+    first, second = map(json.loads, lines)
+    assert list(first) == list(output.CURRENT_FIELDS)
+    assert first["location"] == "New Delhi"
+    assert second == {"location": "Atlantis", "error": "City not found"}
+
+
+def test_csv_has_a_header_and_a_row_per_record(days):
+    rows = list(csv.reader(io.StringIO(written("csv", days, output.FORECAST_FIELDS))))
+    assert rows[0] == [*output.FORECAST_FIELDS, "error"]
+    assert len(rows) == len(days) + 1
+    assert all(len(row) == len(rows[0]) for row in rows)
+    # Missing keys are left empty rather than shifting the columns
+    assert all(row[-1] == "" for row in rows[1:])
+
+
+def test_fields_limit_and_order_the_keys(current):
+    fields = ("temp", "location")
+    (line,) = written("ndjson", [current], fields).splitlines()
+    assert list(json.loads(line)) == ["temp", "location"]
+
+    rows = list(csv.reader(io.StringIO(written("csv", [current], fields))))
+    assert rows == [["temp", "location", "error"], [str(current["temp"]), "New Delhi", ""]]
+
+
+def test_json_is_one_document(current, days):
+    assert json.loads(written("json", days, output.FORECAST_FIELDS))[0]["date"] == days[0]["date"]
+    stream = io.StringIO()
+    writer = output.Writer("json", output.CURRENT_FIELDS, stream=stream)
+    writer.write(current)
+    writer.close()
+    assert json.loads(stream.getvalue())["name"] == current["name"]
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        output.Writer("xml", output.CURRENT_FIELDS)
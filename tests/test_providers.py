@@ -0,0 +1,176 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from sunny.providers import HedgedProvider, ProviderError, StubProvider
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+# Primaries that are "slow" take SLOW seconds; hedging starts after HEDGE_AFTER
+SLOW = 0.5
+HEDGE_AFTER = 0.05
+
+
+def fixtures(directory: Path, name: str) -> Path:
+    """Write the recorded payloads to ``directory`` with the city renamed."""
+    directory.mkdir()
+    weather = json.loads((FIXTURES_DIR / "weather.json").read_bytes())
+    weather["name"] = name
+    (directory / "weather.json").write_text(json.dumps(weather))
+    (directory / "forecast.json").write_bytes((FIXTURES_DIR / "forecast.json").read_bytes())
+    return directory
+
+
+@pytest.fixture
+def primary_dir(tmp_path):
+    return fixtures(tmp_path / "primary", "Primary")
+
+
+@pytest.fixture
+def backup_dir(tmp_path):
+    return fixtures(tmp_path / "backup", "Backup")
+
+
+class Allow:
+    """Counts how often the hedge asks for budget."""
+
+    def __init__(self, answer: bool = True) -> None:
+        self.answer = answer
+        self.calls = 0
+
+    def __call__(self) -> bool:
+        self.calls += 1
+        return self.answer
+
+
+def answered_by(body: bytes) -> str:
+    return json.loads(body)["name"]
+
+
+def timed_fetch(provider, endpoint: str = "weather"):
+    started = time.perf_counter()
+    try:
+        return provider.fetch(endpoint, "Delhi", "metric"), time.perf_counter() - started
+    except ProviderError as e:
+        return e, time.perf_counter() - started
+
+
+def test_hedge_wins_over_slow_primary(primary_dir, backup_dir):
+    allow = Allow()
+    hedged = HedgedProvider(
+        StubProvider(primary_dir, delay=SLOW), StubProvider(backup_dir), HEDGE_AFTER, allow
+    )
+    body, elapsed = timed_fetch(hedged)
+    assert answered_by(body) == "Backup"
+    assert elapsed < SLOW
+    assert allow.calls == 1
+
+
+def test_primary_answering_in_time_is_not_hedged(primary_dir, backup_dir):
+    allow = Allow()
+    hedged = HedgedProvider(
+        StubProvider(primary_dir), StubProvider(backup_dir), SLOW, allow
+    )
+    body, elapsed = timed_fetch(hedged)
+    assert answered_by(body) == "Primary"
+    assert elapsed < SLOW
+    assert allow.calls == 0
+
+
+def test_primary_wins_race_against_slower_backup(primary_dir, backup_dir):
+    hedged = HedgedProvider(
+        StubProvider(primary_dir, delay=0.15),
+        StubProvider(backup_dir, delay=SLOW),
+        HEDGE_AFTER,
+    )
+    body, elapsed = timed_fetch(hedged)
+    assert answered_by(body) == "Primary"
+    assert elapsed < SLOW
+
+
+def test_quick_404_is_final_and_not_hedged(primary_dir, backup_dir):
+    allow = Allow()
+    hedged = HedgedProvider(
+        StubProvider(primary_dir, status=404), StubProvider(backup_dir), SLOW, allow
+    )
+    error, elapsed = timed_fetch(hedged)
+    assert isinstance(error, ProviderError) and error.status == 404
+    assert elapsed < SLOW
+    assert allow.calls == 0
+
+
+def test_404_during_hedge_does_not_wait_for_backup(primary_dir, backup_dir):
+    hedged = HedgedProvider(
+        StubProvider(primary_dir, delay=0.15, status=404),
+        StubProvider(backup_dir, delay=SLOW * 2),
+        HEDGE_AFTER,
+    )
+    error, elapsed = timed_fetch(hedged)
+    assert isinstance(error, ProviderError) and error.status == 404
+    assert elapsed < SLOW
+
+
+def test_429_falls_through_to_hedge(primary_dir, backup_dir):
+    allow = Allow()
+    hedged = HedgedProvider(
+        StubProvider(primary_dir, status=429), StubProvider(backup_dir), SLOW, allow
+    )
+    body, elapsed = timed_fetch(hedged)
+    assert answered_by(body) == "Backup"
+    assert elapsed < SLOW
+    assert allow.calls == 1
+
+
+def test_server_error_falls_through_to_hedge(primary_dir, backup_dir):
+    hedged = HedgedProvider(
+        StubProvider(primary_dir, status=503), StubProvider(backup_dir), SLOW
+    )
+    body, _ = timed_fetch(hedged)
+    assert answered_by(body) == "Backup"
+
+
+def test_undecodable_answer_counts_as_failure(tmp_path, backup_dir):
+    broken = tmp_path / "broken"
+    broken.mkdir()
+    (broken / "weather.json").write_text("not json")
+    hedged = HedgedProvider(StubProvider(broken), StubProvider(backup_dir), SLOW)
+    body, _ = timed_fetch(hedged)
+    assert answered_by(body) == "Backup"
+
+
+def test_primary_error_is_raised_when_both_fail(primary_dir, backup_dir):
+    hedged = HedgedProvider(
+        StubProvider(primary_dir, status=503),
+        StubProvider(backup_dir, status=500),
+        HEDGE_AFTER,
+    )
+    error, _ = timed_fetch(hedged)
+    assert isinstance(error, ProviderError) and error.status == 503
+
+
+def test_no_budget_waits_for_primary(primary_dir, backup_dir):
+    allow = Allow(False)
+    hedged = HedgedProvider(
+        StubProvider(primary_dir, delay=0.15), StubProvider(backup_dir), HEDGE_AFTER, allow
+    )
+    body, elapsed = timed_fetch(hedged)
+    assert answered_by(body) == "Primary"
+    assert elapsed >= 0.15
+    assert allow.calls == 1
+
+
+def test_forecast_is_hedged_too(primary_dir, backup_dir):
+    hedged = HedgedProvider(
+        StubProvider(primary_dir, delay=SLOW), StubProvider(backup_dir), HEDGE_AFTER
+    )
+    body, elapsed = timed_fetch(hedged, "forecast")
+    assert body == (FIXTURES_DIR / "forecast.json").read_bytes()
+    assert elapsed < SLOW
+
+
+def test_stub_without_payload_answers_404(tmp_path):
+    with pytest.raises(ProviderError) as e:
+        StubProvider(tmp_path).fetch("weather", "Delhi", "metric")
+    assert e.value.status == 404
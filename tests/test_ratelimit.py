@@ -0,0 +1,61 @@
+import pytest
+
+from sunny.ratelimit import RateLimited, TokenBucket
+
+
+class Clock:
+    """Stands in for time.time so refills do not need real waiting."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("sunny.ratelimit.time.time", clock)
+    return clock
+
+
+@pytest.fixture
+def bucket(tmp_path, clock):
+    # One token a second, up to five
+    return TokenBucket("key", calls_per_minute=60, burst=5, cache_dir=tmp_path)
+
+
+def test_new_bucket_starts_full(bucket):
+    assert bucket.remaining() == 5
+
+
+def test_tokens_refill_with_time(bucket, clock):
+    for _ in range(5):
+        bucket.acquire(0)
+    with pytest.raises(RateLimited) as e:
+        bucket.acquire(0)
+    assert e.value.wait == pytest.approx(1.0)
+
+    clock.now += 2.5
+    assert bucket.remaining() == pytest.approx(2.5)
+    assert bucket.acquire(0) == pytest.approx(1.5)
+
+
+def test_refill_stops_at_burst(bucket, clock):
+    bucket.acquire(0)
+    clock.now += 3600
+    assert bucket.remaining() == 5
+
+
+def test_clock_going_backwards_adds_no_tokens(bucket, clock):
+    bucket.drain()
+    clock.now -= 3600
+    assert bucket.remaining() == 0
+
+
+def test_buckets_of_one_key_share_tokens(tmp_path, bucket):
+    other = TokenBucket("key", calls_per_minute=60, burst=5, cache_dir=tmp_path)
+    bucket.drain()
+    assert other.remaining() == 0
+    assert TokenBucket("other key", cache_dir=tmp_path).remaining() == 20